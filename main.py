@@ -6,9 +6,9 @@ import datetime
 from PyQt6.QtWidgets import QApplication, QMessageBox, QMainWindow
 from PyQt6.QtCore import QObject, QThread, pyqtSignal, QTimer
 try:
-    from typing import List, Dict, Tuple, Any, Optional
+    from typing import List, Dict, Tuple, Any, Optional, Sequence, Callable
 except ImportError:
-    List = list; Dict = dict; Tuple = tuple; Any = any; Optional = None
+    List = list; Dict = dict; Tuple = tuple; Any = any; Optional = None; Sequence = list; Callable = None
 
 from view.main_window import BaccaratView
 from model.baccarat_model import BaccaratModel
@@ -34,7 +34,13 @@ from predictors.dragon_tail_predictor import DragonTailPredictor
 from predictors.chop_follower_predictor import ChopFollowerPredictor
 from predictors.double_hunter_predictor import DoubleHunterPredictor
 from predictors.shoe_reader_predictor import ShoeReaderPredictor
+from predictors.history_context import HistoryContext
+from predictors.context_tree import MAX_ORDER
+from predictors.prediction_graph import PredictionGraph
+from predictors.prediction_executor import PredictionExecutor
+from predictors.memoized_predictor import MemoizedPredictor, DEFAULT_MAX_ENTRIES
 from simulation.baccarat_simulator import BaccaratSimulator
+from simulation.baccarat_rules import BaccaratRules, STANDARD_RULES, get_rules
 from view.stats_dialog import StatsDialog
 
 # Simülasyon Logger Sınıfı
@@ -348,12 +354,60 @@ class ModelPredictionTracker:
             
         return all(correct for _, _, correct in predictions)
 
+
+# En iyi model seçimi için artımlı başarı sıralaması
+class ModelLeaderboard:
+    """
+    Temel modellerin doğru/toplam sayılarını ve art arda doğru tahmin serilerini tutar.
+    Her sonuçlanan elde bir kez güncellenir (record + update_ranking); seçim sırasında
+    modeller taranıp sıralanmaz, hazır sıralamanın başından okunur.
+    """
+
+    def __init__(self, model_names: Sequence[str], min_total: int = 5, consistent_len: int = 2):
+        self.model_names = list(model_names)
+        self.min_total = min_total            # Başarı oranıyla sıralanmak için gereken tahmin sayısı
+        self.consistent_len = consistent_len  # 'Tutarlı' sayılmak için art arda doğru tahmin sayısı
+        self.correct = dict.fromkeys(self.model_names, 0)
+        self.total = dict.fromkeys(self.model_names, 0)
+        self.correct_runs = dict.fromkeys(self.model_names, 0)  # Son tahminlerden art arda doğru olanlar
+        self.ranking: List[str] = []     # En az min_total tahmini olanlar, başarı oranına göre (eşitlikte model sırası)
+        self.consistent: List[str] = []  # Son consistent_len tahmini doğru olanlar (model sırasıyla)
+
+    def record(self, model_name: str, correct: bool):
+        """Modelin sonuçlanan (P/B) tahminini sayar; takip edilmeyen (meta) modeller yok sayılır."""
+        if model_name not in self.total: return
+        self.total[model_name] += 1
+        if correct:
+            self.correct[model_name] += 1
+            self.correct_runs[model_name] += 1
+        else:
+            self.correct_runs[model_name] = 0
+
+    def update_ranking(self):
+        """Sıralamayı ve tutarlı modeller listesini el başına bir kez yeniden kurar."""
+        ranking = [name for name in self.model_names if self.total[name] >= self.min_total]
+        ranking.sort(key=lambda name: self.correct[name] / self.total[name], reverse=True)
+        self.ranking = ranking
+        self.consistent = [name for name in self.model_names if self.correct_runs[name] >= self.consistent_len]
+
+    def top_models(self, is_active: Callable[[str], bool], k: int = 3) -> List[str]:
+        """Sıralamada is_active koşulunu sağlayan ilk k model."""
+        top = []
+        for name in self.ranking:
+            if is_active(name):
+                top.append(name)
+                if len(top) == k: break
+        return top
+
 class ApplicationController:
-    def __init__(self):
+    def __init__(self, rules: Optional[BaccaratRules] = None, pattern_orders: Optional[Sequence[int]] = None):
         self.app = QApplication(sys.argv)
-        self.model = BaccaratModel(initial_balance=5000.0)
+        # Masa kural varyantı (ödemeler ve çekme tabloları); kasa modeli ve simülatör aynı kuralları okur
+        self.rules = rules if rules is not None else STANDARD_RULES
+        self.model = BaccaratModel(initial_balance=5000.0, rules=self.rules)
         self.view = BaccaratView()
-        self.simulator = BaccaratSimulator(num_decks=8, cut_card_depth_approx=14)
+        self.simulator = BaccaratSimulator(num_decks=8, cut_card_depth_approx=14, rules=self.rules)
+        self.hand_stream = self.simulator.iter_hands() # Kesme kartında kendi içinde karıştırır
 
         # Model parametreleri
         streak_len = 3; pattern_len = 3; dev_window = 30; dev_thresh = 4.0
@@ -362,6 +416,15 @@ class ApplicationController:
         dragon_min_len = 6; shoe_window = 15; shoe_thresh_ratio = 0.45
         orderly_model = f"Seri Takip ({streak_len})"
         choppy_model = "Kesme Takibi (Ping Pong)"
+
+        # Tüm modellerin paylaştığı, her elde artımlı güncellenen geçmiş bağlamı
+        self.history_context = HistoryContext()
+        # Desen modeli ailesi: her n için bir desen modeli; hepsi bağlamın tek bir bağlam ağacını
+        # paylaşır (ağaç her elde bir kez güncellenir ve tüm dereceleri tek yürüyüşte verir)
+        self.pattern_orders = sorted({max(2, min(MAX_ORDER, n)) for n in (pattern_orders or (pattern_len,))})
+        pattern_tree = self.history_context.context_tree(max(self.pattern_orders))
+        pattern_predictors = {f"Desen ({n}-gram)": PatternMatcherPredictor(n=n, tree=pattern_tree)
+                              for n in self.pattern_orders}
         
         # Tahmin modelleri sözlüğü
         self.predictors: Dict[str, Any] = {
@@ -371,7 +434,7 @@ class ApplicationController:
             f"Ejderha Takibi ({dragon_min_len}+)": DragonTailPredictor(min_dragon_length=dragon_min_len),
             choppy_model: ChopFollowerPredictor(), 
             "Çiftleri Kovalama": DoubleHunterPredictor(),
-            f"Desen ({pattern_len}-gram)": PatternMatcherPredictor(n=pattern_len),
+            **pattern_predictors,
             f"Sapma Analizi (W{dev_window}, T{dev_thresh}%)": StatisticalDeviationPredictor(window_size=dev_window, deviation_threshold=dev_thresh),
             f"Anti-Stats (Kabus!) (W{dev_window}, T{dev_thresh}%)": AntiStatsPredictor(window_size=dev_window, deviation_threshold=dev_thresh),
             "Kaos Yürüyüşçüsü (Saat)": ChaosWalkerPredictor(), 
@@ -386,21 +449,23 @@ class ApplicationController:
             "Paralel Evren Bahisçisi": MultiversePredictor(deviation_window=multi_window, deviation_influence=multi_influence, quantum_leap_chance=multi_leap),
             f"Ayakkabı Okuyucu (W{shoe_window})": ShoeReaderPredictor(window_size=shoe_window, chop_threshold_ratio=shoe_thresh_ratio, orderly_model_name=orderly_model, choppy_model_name=choppy_model),
             f"Konsensüs Kaçağı ({maverick_thresh}%)": ConsensusMaverickPredictor(threshold_percentage=maverick_thresh),
-            "Ters Köşe (Anti-Zigzag)": AntiTrendPredictor()
+            "Ters Köşe (Anti-Zigzag)": AntiTrendPredictor(primary_model_name="Zigzag")
          }
         
-        # Meta modeller (diğer modellerin tahminlerini kullananlar)
-        self.meta_model_names = {
-            f"Ayakkabı Okuyucu (W{shoe_window})", 
-            f"Konsensüs Kaçağı ({maverick_thresh}%)",
-            "Ters Köşe (Anti-Zigzag)"
-        }
+        # Modellerin bağımlılık grafiği; meta modeller (diğer modellerin sonuçlarını
+        # kullananlar) girdilerini 'inputs' ile bildirir
+        self.prediction_graph = PredictionGraph(self.predictors)
+        self.meta_model_names = self.prediction_graph.meta_names
         
         # Tahmin izleyici oluştur
         self.prediction_tracker = ModelPredictionTracker(history_len=10)
         # Modelleri kaydet
         for name in self.predictors:
             self.prediction_tracker.register_model(name)
+        # En iyi model seçimi için temel modellerin başarı sıralaması ve
+        # geçmiş revizyonuna göre saklanan son seçim: (revision, (model adı, sonuç))
+        self.leaderboard = ModelLeaderboard([name for name in self.predictors if name not in self.meta_model_names])
+        self._best_model_selection: Optional[Tuple[int, Tuple[Optional[str], Optional[Dict[str, Any]]]]] = None
         
         # Logger başlat
         self.logger = SimulationLogger()
@@ -419,6 +484,14 @@ class ApplicationController:
         self.simulation_timer = QTimer()
         self.simulation_timer.setInterval(150)
         self.simulation_timer.timeout.connect(self.run_single_simulation_step)
+        # True ise sapma tabanlı modeller sabit 8 deste oranları yerine simülatördeki
+        # kalan ayakkabının tam olasılıklarını kullanır (her el ~5 ms, NumPy gerekir)
+        self.use_live_shoe_probabilities = False
+        self.live_shoe_probabilities: Optional[Tuple[float, float, float]] = None
+        # True ise toplu simülasyon ayrıntılı el kaydı tutar ve sonunda yan bahis istatistiklerini yazdırır
+        self.track_side_bets = False
+        # Paralel mod (enable_parallel_predictions): temel modeller havuzda, el başına süre sınırıyla çalışır
+        self.prediction_executor: Optional[PredictionExecutor] = None
         self._connect_signals()
 
     def _connect_signals(self):
@@ -467,18 +540,34 @@ class ApplicationController:
              sim_button = getattr(self.view, 'sim_btn', None)
              if sim_button: sim_button.setText("▶️")
              return
-        result = self.simulator.deal_hand()
-        if result is None:
-            # self.handle_simulation_toggle() # Otomatik durdurma yerine sadece sıfırla ve devam et
-            print("--- Ayakkabı Bitti. Yeni Ayakkabı Karıştırılıyor ---")
-            self.simulator.shuffle_and_reset()
-        elif result == 'T': pass
-        elif result in ('P', 'B'): self.handle_add_result(result)
+        hand = next(self.hand_stream)
+        if hand.hand_index == 0 and hand.shoe_index > 0:
+            print("--- Ayakkabı Bitti. Yeni Ayakkabı Karıştırıldı ---")
+        result = hand.outcome
+        if result == 'T': pass
+        elif result in ('P', 'B'):
+            if self.use_live_shoe_probabilities: self.apply_live_shoe_probabilities()
+            self.handle_add_result(result, hand)
         else:
              print(f"Warning: Simulator returned unexpected result: {result}")
              self.handle_simulation_toggle()
 
-    def handle_add_result(self, actual_result: str):
+    def apply_live_shoe_probabilities(self):
+        """
+        Simülatörün kalan ayakkabısından bir sonraki elin tam P/B/T olasılıklarını
+        hesaplar ve set_base_probabilities destekleyen modellere (Tie'lar hariç yüzde olarak) verir.
+        """
+        probabilities = self.simulator.next_hand_probabilities()
+        if probabilities is None: return # Ayakkabıda tam hesap için yeterli kart yok
+        self.live_shoe_probabilities = probabilities
+        p_prob, b_prob, _ = probabilities
+        player_perc = p_prob / (p_prob + b_prob) * 100
+        banker_perc = b_prob / (p_prob + b_prob) * 100
+        for predictor in self.predictors.values():
+            if hasattr(predictor, 'set_base_probabilities'):
+                predictor.set_base_probabilities(player_perc, banker_perc)
+
+    def handle_add_result(self, actual_result: str, hand=None):
         # Get the best model's prediction
         best_model_name, best_model_data = self.find_best_model_prediction()
         predicted_result_for_bet = best_model_data.get('prediction', 'N/A') if best_model_data else 'N/A'
@@ -502,6 +591,8 @@ class ApplicationController:
                     # Record prediction in tracker
                     if self.prediction_tracker:
                         self.prediction_tracker.record_prediction(name, last_pred, actual_result)
+                    self.leaderboard.record(name, correct)
+            self.leaderboard.update_ranking()
             
             # Print which model was used for prediction (if any)
             if best_model_name:
@@ -525,7 +616,7 @@ class ApplicationController:
             bet_amount=self.model.current_bet
         )
         
-        self.model.add_result(actual_result, predicted_result_for_bet)
+        self.model.add_result(actual_result, predicted_result_for_bet, hand)
         if self.stats_dialog_instance and self.stats_dialog_instance.isVisible():
             self.stats_dialog_instance.update_data(self.predictor_stats)
 
@@ -549,6 +640,8 @@ class ApplicationController:
             self.prediction_tracker = ModelPredictionTracker(history_len=10)
             for name in self.predictors:
                 self.prediction_tracker.register_model(name)
+        self.leaderboard = ModelLeaderboard(self.leaderboard.model_names)
+        self._best_model_selection = None
                 
         # En son kullanılan modeli sıfırla
         self.last_best_model = None
@@ -579,68 +672,35 @@ class ApplicationController:
         """
         Son 2 elde doğru tahmin yapan ve aynı tahminde bulunan modelleri bulur.
         Eğer böyle bir model grubu bulunursa, en yüksek güven oranına sahip olanın
-        tahminini döndürür.
+        tahminini döndürür. Seçim geçmiş revizyonuna göre saklanır; aynı el için
+        (run_predictions ve handle_add_result) iki kez hesaplanmaz.
         """
-        # 1. Tahmin izleyiciyi kullanarak son 2 elde tutarlı şekilde doğru 
-        # tahmin yapan modelleri bul
+        revision = self.history_context.revision
+        if self._best_model_selection is not None and self._best_model_selection[0] == revision:
+            return self._best_model_selection[1]
+        selection = self._select_best_model()
+        self._best_model_selection = (revision, selection)
+        return selection
+
+    def _select_best_model(self) -> Tuple[str, Dict[str, Any]]:
+        """Seçimi başarı sıralamasından (ModelLeaderboard) yapar; sadece ilk birkaç modele bakılır."""
+        results = self.last_run_results
+        leaderboard = self.leaderboard
+
+        def has_prediction(name: str) -> bool:
+            # Sadece geçerli tahmini olan modeller dikkate alınır
+            return results.get(name, {}).get('prediction', 'N/A') in ('P', 'B')
+
+        # 1. Son 2 elde tutarlı şekilde doğru tahmin yapan modeller
         consistent_correct_models = []
-        
-        if self.prediction_tracker:
-            min_predictions = 2  # En az kaç tahminin doğru olması gerektiği
-            
-            for name, stats in self.predictor_stats.items():
-                # Meta modelleri atla
-                if name in self.meta_model_names:
-                    continue
-                
-                # Mevcut tahmini al
-                current_pred_data = self.last_run_results.get(name, {})
-                current_prediction = current_pred_data.get('prediction', 'N/A')
-                
-                # Sadece geçerli tahmini olan modelleri kontrol et
-                if current_prediction not in ('P', 'B'):
-                    continue
-                
-                # Son min_predictions elde tutarlı şekilde doğru tahmin yapmış mı?
-                if self.prediction_tracker.has_consistent_predictions(name, min_predictions):
-                    # Yeterince tutarlı tahmin var, modeli listeye ekle
-                    consistent_correct_models.append((name, current_pred_data))
-                    print(f"Model {name} was correct in last {min_predictions} predictions")
-        
-        # Eğer tahmin izleyici yoksa veya tutarlı model bulunamadıysa, 
-        # başarı oranlarına göre değerlendir
+        for name in leaderboard.consistent:
+            if has_prediction(name):
+                consistent_correct_models.append((name, results[name]))
+                print(f"Model {name} was correct in last {leaderboard.consistent_len} predictions")
+
+        # Tutarlı model bulunamadıysa başarı oranına göre ilk 3 model (en az 5 tahmini olanlar)
         if not consistent_correct_models:
-            # Get top 3 models by success rate
-            top_models = []
-            
-            for name, stats in self.predictor_stats.items():
-                # Skip meta models
-                if name in self.meta_model_names:
-                    continue
-                
-                # Get current prediction for this model
-                current_pred_data = self.last_run_results.get(name, {})
-                current_prediction = current_pred_data.get('prediction', 'N/A')
-                
-                # Only consider models with current predictions
-                if current_prediction not in ('P', 'B'):
-                    continue
-                
-                # Model must have at least 5 predictions
-                total = stats.get('total', 0)
-                correct = stats.get('correct', 0)
-                
-                if total >= 5:
-                    win_rate = correct / total
-                    top_models.append((name, current_pred_data, win_rate))
-            
-            # Sort by win rate and get top 3
-            if top_models:
-                top_models.sort(key=lambda x: x[2], reverse=True)
-                top_3_models = top_models[:min(3, len(top_models))]
-                
-                # Convert to format that's compatible with consistent_correct_models
-                consistent_correct_models = [(name, data) for name, data, _ in top_3_models]
+            consistent_correct_models = [(name, results[name]) for name in leaderboard.top_models(has_prediction, 3)]
         
         # Tahmin yapacak model bulunamadı
         if not consistent_correct_models:
@@ -663,7 +723,68 @@ class ApplicationController:
         print(f"Top models disagree: {[f'{model[0]}:{model[1].get('prediction')}' for model in consistent_correct_models]}")
         return None, None
 
+    def _prediction_runner(self):
+        """Modelleri çalıştıran nesne: paralel mod açıksa havuz, değilse sıralı bağımlılık grafiği."""
+        return self.prediction_executor or self.prediction_graph
+
+    def enable_parallel_predictions(self, max_workers: int = 4, deadline_ms: float = 50.0):
+        """
+        Temel modelleri bir iş parçacığı havuzunda çalıştırır. Her el en fazla deadline_ms
+        kadar beklenir; zamanında bitmeyen modeller o el için N/A sayılır.
+        """
+        self.disable_parallel_predictions()
+        self.prediction_executor = PredictionExecutor(self.prediction_graph, max_workers=max_workers,
+                                                      deadline_ms=deadline_ms)
+
+    def disable_parallel_predictions(self):
+        """Havuzu kapatır ve modelleri tekrar sıralı çalıştırır."""
+        if self.prediction_executor is not None:
+            self.prediction_executor.close()
+            self.prediction_executor = None
+
+    def enable_memoization(self, names: Optional[Sequence[str]] = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Verilen (varsayılan: tüm temel) modelleri sonek anahtarlı LRU önbellekle sarar.
+        Akış durumu modelde kaldığı için eller arasında istenildiği zaman açılıp kapatılabilir.
+        """
+        for name in (self.prediction_graph.base_names if names is None else names):
+            predictor = self.predictors[name]
+            if not isinstance(predictor, MemoizedPredictor):
+                self.predictors[name] = MemoizedPredictor(predictor, max_entries=max_entries)
+
+    def disable_memoization(self, names: Optional[Sequence[str]] = None):
+        """Verilen (varsayılan: tüm) modellerin önbelleğini kaldırır."""
+        for name in (list(self.predictors) if names is None else names):
+            predictor = self.predictors[name]
+            if isinstance(predictor, MemoizedPredictor):
+                self.predictors[name] = predictor.predictor
+
+    def print_memo_stats(self):
+        """Önbelleğe alınan modellerin isabet/ıska sayılarını yazdırır."""
+        memoized = {name: predictor for name, predictor in self.predictors.items()
+                    if isinstance(predictor, MemoizedPredictor) and predictor.hits + predictor.misses}
+        if not memoized:
+            return
+        print("Önbellek (isabet / ıska, isabet oranı):")
+        for name, predictor in memoized.items():
+            print(f"  {name}: {predictor.hits} / {predictor.misses}, %{predictor.hit_rate:.1f}")
+
+    def _feed_predictors(self, history, appended: bool):
+        """
+        Akış arayüzündeki modellere geçmişteki değişikliği iletir.
+        Olağan durumda sadece yeni sonuç observe() ile verilir (el başına sabit süre);
+        geri alma/temizleme gibi diğer değişikliklerde modeller sıfırlanıp geçmiş yeniden oynatılır.
+        """
+        self._prediction_runner().feed(history, appended)
+
     def run_predictions(self, history):
+        # Bağlamı modelin geçmişine eşitle (olağan durumda tek bir ekleme/geri alma)
+        context = self.history_context
+        revision = context.revision
+        appended = context.sync(history)
+        if context.revision != revision:
+            self._feed_predictors(history, appended)
+        self._best_model_selection = None # Sonuçlar yeniden hesaplanıyor; seçim bu el için bir kez yapılır
         if not history:
             self.last_predictions = {name: 'N/A' for name in self.predictors}
             self.last_run_results = {}
@@ -672,61 +793,15 @@ class ApplicationController:
                  self.stats_dialog_instance.update_data(self.predictor_stats)
             return
 
-        current_run_results: Dict[str, Dict[str, Any]] = {}
-
-        # Adım 1: Tüm Modelleri Çalıştır (Meta modellerle özel işlemler)
-        for name, predictor in self.predictors.items():
-            prediction = 'N/A'; confidence = 50.0; probability = 50.0
-            try:
-                if isinstance(predictor, AntiTrendPredictor):
-                    zigzag_pred = current_run_results.get("Zigzag", {}).get('prediction', 'N/A')
-                    zigzag_conf = current_run_results.get("Zigzag", {}).get('confidence', 50.0)
-                    zigzag_prob = current_run_results.get("Zigzag", {}).get('probability', 50.0)
-                    prediction = predictor.predict(history, zigzag_pred)
-                    if prediction != 'N/A':
-                         confidence = predictor.get_confidence(history, zigzag_conf)
-                         probability = predictor.get_probability(history, zigzag_prob)
-                elif isinstance(predictor, ConsensusMaverickPredictor):
-                     basic_preds_dict = {k: v['prediction'] for k,v in current_run_results.items() if k not in self.meta_model_names}
-                     prediction = predictor.predict(history, basic_preds_dict)
-                     if prediction != 'N/A':
-                          confidence = predictor.get_confidence(history, basic_preds_dict)
-                          probability = predictor.get_probability(history, basic_preds_dict)
-                elif isinstance(predictor, ShoeReaderPredictor):
-                     basic_results_dict = {k: v for k,v in current_run_results.items() if k not in self.meta_model_names}
-                     chosen_model_key = None
-                     relevant_history = [res for res in history if res in ('P', 'B')]
-                     window = relevant_history[-predictor.window_size:]
-                     window_len = len(window)
-                     if window_len >= 5:
-                          num_chops = predictor._calculate_chops(window)
-                          threshold_count = max(1, int((window_len - 1) * predictor.chop_threshold_ratio))
-                          if num_chops < threshold_count: chosen_model_key = predictor.orderly_model_key
-                          else: chosen_model_key = predictor.choppy_model_key
-
-                     if chosen_model_key:
-                          chosen_model_result = basic_results_dict.get(chosen_model_key)
-                          if chosen_model_result and chosen_model_result['prediction'] != 'N/A':
-                               prediction = chosen_model_result['prediction']
-                               confidence = predictor.get_confidence(history, basic_results_dict, chosen_model_result['confidence'])
-                               probability = predictor.get_probability(history, basic_results_dict, chosen_model_result['probability'])
-                          else: prediction = 'N/A'
-                     else: prediction = 'N/A'
-                else: # Temel modeller
-                    prediction = predictor.predict(history)
-                    if prediction != 'N/A':
-                        try: confidence = predictor.get_confidence(history)
-                        except AttributeError: pass
-                        try: probability = predictor.get_probability(history)
-                        except AttributeError: pass
-            except Exception as e:
-                print(f"Error running predictor {name}: {e}")
-                prediction = 'N/A'
-            current_run_results[name] = {'prediction': prediction, 'confidence': confidence, 'probability': probability}
-
-        # Adım 2: Tüm sonuçları sakla
-        self.last_run_results = current_run_results.copy()
-        self.last_predictions = {name: data['prediction'] for name, data in current_run_results.items()}
+        # Adım 1: Tüm Modelleri Çalıştır
+        # Bağımlılık grafiği önce temel modelleri, sonra girdileri hazır olan meta modelleri çalıştırır;
+        # her model tahmin, güven ve olasılığı kendi akış durumundan tek bir çağrıyla hesaplar.
+        results = self._prediction_runner().run(
+            on_error=lambda name, e: print(f"Error running predictor {name}: {e}"))
+
+        # Adım 2: Tüm sonuçları sakla (model sırasıyla)
+        self.last_run_results = {name: results[name]._asdict() for name in self.predictors}
+        self.last_predictions = {name: results[name].prediction for name in self.predictors}
 
         # Adım 3: Son 2 elde doğru tahmin yapan modelleri belirle
         best_model_name, best_model_data = self.find_best_model_prediction()
@@ -766,19 +841,22 @@ class ApplicationController:
         
         # Başlangıç durumunu sıfırla
         self.handle_clear()
+        self.prediction_graph.reset_timings()
+        if self.prediction_executor: self.prediction_executor.reset_late_counts()
+        for predictor in self.predictors.values():
+            if isinstance(predictor, MemoizedPredictor): predictor.reset_stats()
         
         print(f"Batch simülasyon başlatılıyor: {num_hands} el...")
+        detail_log = self.simulator.enable_detail_mode(num_hands) if self.track_side_bets else None
         
         # Simülasyonu çalıştır
-        for i in range(num_hands):
-            result = self.simulator.deal_hand()
-            if result is None:
-                print(f"Ayakkabı bitti, yenileniyor... ({i+1}/{num_hands})")
-                self.simulator.shuffle_and_reset()
-                continue
-                
+        for i, hand in enumerate(self.simulator.iter_hands(num_hands)):
+            if hand.hand_index == 0 and hand.shoe_index > 0:
+                print(f"Ayakkabı bitti, yenilendi... ({i+1}/{num_hands})")
+            result = hand.outcome
             if result in ('P', 'B'):
-                self.handle_add_result(result)
+                if self.use_live_shoe_probabilities: self.apply_live_shoe_probabilities()
+                self.handle_add_result(result, hand)
             
             # Her 100 elde bir bilgi ver
             if (i+1) % 100 == 0:
@@ -798,6 +876,26 @@ class ApplicationController:
         profit = self.model.current_balance - self.model.initial_balance
         print(f"Kâr/Zarar: ₺{profit:.2f} ({(profit/self.model.initial_balance)*100:.1f}%)")
         print(f"Max Kazanç Serisi: {self.model.max_win_streak}, Max Kayıp Serisi: {self.model.max_loss_streak}")
+        self.print_prediction_timings()
+        self.print_memo_stats()
+
+        if detail_log is not None:
+            from simulation.side_bets import evaluate_side_bets
+            print("Yan bahisler (isabet oranı / kasa avantajı):")
+            for bet_name, bet_stats in evaluate_side_bets(detail_log.records).items():
+                print(f"  {bet_name}: {bet_stats.hit_rate * 100:.2f}% / {bet_stats.house_edge * 100:.2f}%")
+            self.simulator.disable_detail_mode()
+
+    def print_prediction_timings(self, top: int = 5):
+        """En yavaş modellerin el başına ortalama sürelerini (ve paralel modda geç kalma sayılarını) yazdırır."""
+        if not self.hand_count:
+            return
+        total_timings = self.prediction_graph.total_timings
+        late_counts = self.prediction_executor.late_counts if self.prediction_executor else {}
+        print("En yavaş modeller (el başına ortalama ms):")
+        for name in sorted(total_timings, key=total_timings.get, reverse=True)[:top]:
+            late_info = f", süre aşımı: {late_counts[name]}" if late_counts.get(name) else ""
+            print(f"  {name}: {total_timings[name] / self.hand_count:.3f}{late_info}")
 
     def run(self):
         self.view.show()
@@ -806,13 +904,37 @@ class ApplicationController:
         sys.exit(self.app.exec())
 
 if __name__ == '__main__':
-    controller = ApplicationController()
+    # --rules <varyant>: Masa kural varyantı (standard, no_commission, ez_baccarat, super_6)
+    table_rules = None
+    if '--rules' in sys.argv:
+        rules_arg_index = sys.argv.index('--rules')
+        if rules_arg_index + 1 < len(sys.argv):
+            table_rules = get_rules(sys.argv[rules_arg_index + 1])
+        del sys.argv[rules_arg_index:rules_arg_index + 2]
+    # --pattern-orders <liste>: Desen modeli ailesinin n değerleri (örn. "2-12" veya "3,5,8")
+    pattern_orders = None
+    if '--pattern-orders' in sys.argv:
+        orders_arg_index = sys.argv.index('--pattern-orders')
+        if orders_arg_index + 1 < len(sys.argv):
+            pattern_orders = []
+            for part in sys.argv[orders_arg_index + 1].split(','):
+                low, _, high = part.partition('-')
+                pattern_orders.extend(range(int(low), int(high or low) + 1))
+        del sys.argv[orders_arg_index:orders_arg_index + 2]
+    controller = ApplicationController(rules=table_rules, pattern_orders=pattern_orders)
     
     # Eğer komut satırı argümanları varsa
     if len(sys.argv) > 1:
         # Toplu simülasyon modu için argüman kontrolü
         if sys.argv[1] == '--simulate' or sys.argv[1] == '-s':
             num_hands = 1000  # Varsayılan
+            # --corpus <dosya>: Ayakkabıları önceden üretilmiş külliyattan oynat (tekrarlanabilir karşılaştırma)
+            if '--corpus' in sys.argv:
+                corpus_arg_index = sys.argv.index('--corpus')
+                if corpus_arg_index + 1 < len(sys.argv):
+                    from simulation.shoe_corpus import ShoeCorpus
+                    controller.simulator.use_shoe_corpus(ShoeCorpus(sys.argv[corpus_arg_index + 1]))
+                del sys.argv[corpus_arg_index:corpus_arg_index + 2]
             if len(sys.argv) > 2:
                 try:
                     num_hands = int(sys.argv[2])
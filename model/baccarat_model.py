@@ -1,7 +1,9 @@
 # model/baccarat_model.py
 from collections import deque
 from PyQt6.QtCore import QObject, pyqtSignal
-from typing import List, Dict, Any # Tip ipuçları için
+from typing import List, Dict, Any, Optional # Tip ipuçları için
+from simulation.baccarat_rules import BaccaratRules, STANDARD_RULES
+from model.run_length_index import RunLengthIndex
 
 MATRIX_HISTORY_LEN = 25
 
@@ -15,10 +17,14 @@ class BaccaratModel(QObject):
     # Not: Eğer liste biterse ne olacağına karar vermek lazım (örn: başa dön, max'ta kal, dur?)
     # Şimdilik max'ta kalacak şekilde ayarlayalım.
 
-    def __init__(self, initial_balance=5000.0):
+    def __init__(self, initial_balance=5000.0, rules: Optional[BaccaratRules] = None):
         super().__init__()
+        # Kural varyantı: ödemeler, push kuralları ve özel eller bu tablolardan okunur
+        self.rules = rules if rules is not None else STANDARD_RULES
         # Geçmiş
         self.full_history_sequence: List[str] = []
+        # P/B serilerinin dizini (mevcut/önceki seri, almaşık uzunluğu, seri histogramı)
+        self.run_index = RunLengthIndex()
         # Genel İstatistik Sayaçları
         self.total_hands_overall = 0
         self.player_wins_overall = 0
@@ -36,32 +42,34 @@ class BaccaratModel(QObject):
         self.max_loss_streak = 0
 
     # --- Ana Metodlar ---
-    def add_result(self, actual_result: str, predicted_result: str):
+    def add_result(self, actual_result: str, predicted_result: str, hand=None):
         """
         Sonucu ekler, bahsi değerlendirir, kasayı günceller, sinyalleri tetikler.
         :param actual_result: Gerçekleşen sonuç ('P', 'B', 'T')
         :param predicted_result: O el için yapılan tahmin ('P', 'B', veya 'N/A')
+        :param hand: Biliniyorsa elin ayrıntısı (HandRecord); kural varyantının özel
+                     elleri (örn. Banker 6 ile yarım ödeme) ancak bununla uygulanır.
         """
         if actual_result not in ('P', 'B', 'T'): return # Geçersiz sonuç
 
         # 1. Geçmişe Ekle
         self.full_history_sequence.append(actual_result)
+        self.run_index.append(actual_result)
         self.total_hands_overall += 1
         if actual_result == 'P': self.player_wins_overall += 1
         elif actual_result == 'B': self.banker_wins_overall += 1
         elif actual_result == 'T': self.tie_wins_overall += 1
 
-        # 2. Bahsi Değerlendir (Tie durumunda bahis genellikle iade edilir - Push)
-        # Sadece P veya B tahmini yapıldıysa ve sonuç Tie DEĞİLSE bahsi değerlendir.
-        if predicted_result in ('P', 'B') and actual_result != 'T':
+        # 2. Bahsi Değerlendir (ödeme tablosu: >0 kazanç, <0 kayıp, 0 push; standartta Tie push'tur)
+        # Sadece P veya B tahmini yapıldıysa bahsi değerlendir.
+        payout_multiplier = self.rules.payout(predicted_result, actual_result, hand) \
+            if predicted_result in ('P', 'B') else 0.0
+        if payout_multiplier != 0.0:
             bet_amount = self.current_bet
-            won_bet = (predicted_result == actual_result)
+            won_bet = payout_multiplier > 0
 
             if won_bet:
-                # Kazandık!
-                # Banker kazancında %5 komisyon olduğunu varsayalım (yaklaşık Payout 0.95)
-                # Player kazancında payout 1.0
-                payout_multiplier = 0.95 if actual_result == 'B' else 1.0
+                # Kazandık! (örn. standart kurallarda Banker 0.95, Player 1.0 öder)
                 profit = bet_amount * payout_multiplier
                 self.current_balance += profit
                 # print(f"WIN! Bet: {bet_amount:.2f}, Won: {profit:.2f}, New Balance: {self.current_balance:.2f}") # Debug
@@ -91,8 +99,8 @@ class BaccaratModel(QObject):
                 self.loss_streak += 1
                 self.max_loss_streak = max(self.max_loss_streak, self.loss_streak)
 
-        elif actual_result == 'T':
-            # Beraberlikte bahis genellikle iade edilir (Push). Bakiye değişmez.
+        elif predicted_result in ('P', 'B'):
+            # Beraberlikte (veya varyantın push elinde) bahis iade edilir. Bakiye değişmez.
             # Martingale seviyesi ve seri değişmez. Bir sonraki bahis aynı kalır.
             # print("PUSH (Tie). Bet remains: {self.current_bet:.2f}") # Debug
             pass # Kasa/Martingale/Seri aynı kalır
@@ -114,6 +122,7 @@ class BaccaratModel(QObject):
         # Kasa ve Martingale durumu mevcut haliyle kalsın (basitleştirme).
         if self.full_history_sequence:
             popped_result = self.full_history_sequence.pop()
+            self.run_index.pop(popped_result)
             if self.total_hands_overall > 0:
                  self.total_hands_overall -= 1
                  if popped_result == 'P' and self.player_wins_overall > 0: self.player_wins_overall -= 1
@@ -125,6 +134,7 @@ class BaccaratModel(QObject):
     def clear_results(self):
         """Tüm geçmişi, sayaçları ve kasa durumunu sıfırlar."""
         self.full_history_sequence.clear()
+        self.run_index.clear()
         self.total_hands_overall = 0; self.player_wins_overall = 0
         self.banker_wins_overall = 0; self.tie_wins_overall = 0
         # Kasa ve Martingale'i de sıfırla
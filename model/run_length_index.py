@@ -0,0 +1,101 @@
+# model/run_length_index.py
+"""
+P/B geçmişinin seri (run-length) dizini.
+Geçmiş, aynı taraftan kesintisiz gelen sonuçların serileri olarak tutulur
+(örn. P P B P -> [P x2, B x1, P x1]); Tie'lar serileri bölmez ve dizine girmez.
+BaccaratModel her add_result'ta append, her undo_last'ta pop çağırır; böylece
+mevcut seri, bir önceki seri, almaşık (P-B-P...) uzunluğu ve oturumun seri
+uzunluğu histogramı geriye doğru tarama yapmadan O(1) sürede okunur.
+"""
+from typing import Dict, List, Optional, Tuple
+
+PB_RESULTS = ('P', 'B')
+
+
+class RunLengthIndex:
+    """
+    Serilerin (taraf, uzunluk) listesi ve uzunluk histogramı.
+    Histogram, devam eden seri dahil oturumdaki her seriyi güncel uzunluğuyla sayar.
+    """
+
+    def __init__(self):
+        self._sides: List[str] = []        # Her serinin tarafı ('P' / 'B')
+        self._lengths: List[int] = []      # Her serinin uzunluğu
+        self._singles_before: List[int] = []  # Seriden hemen önceki, art arda tek elemanlı seri sayısı
+        self.histogram: Dict[int, int] = {}   # Seri uzunluğu -> o uzunluktaki seri sayısı
+        self.pb_count = 0
+
+    def _count(self, length: int, delta: int):
+        count = self.histogram.get(length, 0) + delta
+        if count: self.histogram[length] = count
+        else: del self.histogram[length]
+
+    def append(self, result: str):
+        """Yeni bir sonucu ekler ('T' yok sayılır). O(1)."""
+        if result not in PB_RESULTS: return
+        self.pb_count += 1
+        if self._sides and self._sides[-1] == result:
+            length = self._lengths[-1]
+            self._count(length, -1)
+            self._lengths[-1] = length + 1
+            self._count(length + 1, 1)
+            return
+        if self._lengths:
+            previous_singles = self._singles_before[-1] + 1 if self._lengths[-1] == 1 else 0
+        else:
+            previous_singles = 0
+        self._sides.append(result)
+        self._lengths.append(1)
+        self._singles_before.append(previous_singles)
+        self._count(1, 1)
+
+    def pop(self, result: str):
+        """Son eklenen sonucu geri alır (undo); 'T' için dizin değişmez. O(1)."""
+        if result not in PB_RESULTS or not self._lengths: return
+        self.pb_count -= 1
+        length = self._lengths[-1]
+        self._count(length, -1)
+        if length > 1:
+            self._lengths[-1] = length - 1
+            self._count(length - 1, 1)
+        else:
+            self._sides.pop(); self._lengths.pop(); self._singles_before.pop()
+
+    def clear(self):
+        self._sides.clear(); self._lengths.clear(); self._singles_before.clear()
+        self.histogram.clear()
+        self.pb_count = 0
+
+    # --- Sorgular ---
+    @property
+    def run_count(self) -> int:
+        return len(self._lengths)
+
+    @property
+    def current_run(self) -> Optional[Tuple[str, int]]:
+        """Devam eden serinin (taraf, uzunluk) bilgisi; geçmiş boşsa None."""
+        return (self._sides[-1], self._lengths[-1]) if self._lengths else None
+
+    @property
+    def previous_run(self) -> Optional[Tuple[str, int]]:
+        """Devam eden seriden önceki serinin (taraf, uzunluk) bilgisi; yoksa None."""
+        return (self._sides[-2], self._lengths[-2]) if len(self._lengths) > 1 else None
+
+    @property
+    def streak_length(self) -> int:
+        """Mevcut serinin uzunluğu (HistoryContext.streak_length ile aynı)."""
+        return self._lengths[-1] if self._lengths else 0
+
+    @property
+    def alternation_length(self) -> int:
+        """Son sonuçla biten almaşık dizinin eleman sayısı (son iki aynıysa 1)."""
+        if not self._lengths: return 0
+        if self._lengths[-1] > 1: return 1
+        singles = self._singles_before[-1] + 1
+        # Tek elemanlı serilerden önce uzun bir seri varsa, onun son elemanı da almaşığa dahildir
+        return singles + (1 if len(self._lengths) > singles else 0)
+
+    @property
+    def longest_run(self) -> int:
+        """Oturumdaki en uzun serinin uzunluğu."""
+        return max(self.histogram, default=0)
@@ -1,46 +1,32 @@
-class AntiMirrorPredictor:
+from predictors.history_context import HistoryLike, as_context
+from predictors.base_predictor import BasePredictor, PredictionResult, NO_PREDICTION
+
+class AntiMirrorPredictor(BasePredictor):
     """
     Ayakkabının başındaki ele bakarak tahmin yapar.
     Tahmin edilecek elin sırasına bakar ve ayakkabının başındaki
     aynı sıradaki elin sonucunun TERSİNİ tahmin eder.
     """
-    def predict(self, history: list) -> str:
+    max_lookback = 0 # Tahmin edilecek el henüz geçmişte olmadığından geçmiş saklanmaz
+
+    def evaluate(self, history: HistoryLike) -> PredictionResult:
         """
         Tahmin edilecek elin index'ine bakar ve history'de o index'teki
-        elemanın tersini tahmin eder.
+        elemanın tersini tahmin eder. Mirror ile aynı mantık: sabit/düşük güven, %50 olasılık.
         """
-        relevant_history = [res for res in history if res in ('P', 'B')]
+        relevant_history = as_context(history).pb
         prediction_index = len(relevant_history) # Tahmin edilecek index
 
         # Geçmişte bu index'te bir el var mı?
         if prediction_index < len(relevant_history):
-            try:
-                mirrored_result = relevant_history[prediction_index]
-                # Tersini döndür
-                if mirrored_result == 'P':
-                    return 'B'
-                elif mirrored_result == 'B':
-                    return 'P'
-                else: # Beklenmedik bir durum (Tie olmamalı)
-                    return "N/A"
-            except IndexError:
-                 return "N/A"
+            mirrored_result = relevant_history[prediction_index]
+            # Tersini döndür
+            if mirrored_result == 'P':
+                return PredictionResult('B', 30.0, 50.0)
+            elif mirrored_result == 'B':
+                return PredictionResult('P', 30.0, 50.0)
+            else: # Beklenmedik bir durum (Tie olmamalı)
+                return NO_PREDICTION
         else:
              # Bu index'te henüz bir el yok
-             return "N/A"
-
-    def get_confidence(self, history: list) -> float:
-        """Tahminin güven oranını döndürür."""
-        # Mirror ile aynı mantık, sabit/düşük güven.
-        prediction = self.predict(history)
-        if prediction == "N/A":
-            return 0.0
-        return 30.0
-
-    def get_probability(self, history: list) -> float:
-        """Tahminin gerçekleşme olasılığını döndürür."""
-        # Mirror ile aynı mantık, %50.
-        prediction = self.predict(history)
-        if prediction == "N/A":
-            return 0.0
-        return 50.0
+             return NO_PREDICTION
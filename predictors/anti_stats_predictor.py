@@ -1,4 +1,7 @@
-class AntiStatsPredictor:
+from predictors.history_context import HistoryLike, as_context
+from predictors.base_predictor import BasePredictor, PredictionResult, NO_PREDICTION
+
+class AntiStatsPredictor(BasePredictor):
     """
     İstatistikçi'nin Kabusu! Sapma Analizcisinin tam tersini yapar.
     Bir taraf teorik olasılıklardan belirgin şekilde sapmışsa,
@@ -12,58 +15,50 @@ class AntiStatsPredictor:
     def __init__(self, window_size=30, deviation_threshold=4.0, min_hands=15):
         # Parametreler Sapma Analizcisi ile aynı veya farklı olabilir
         self.window_size = max(10, window_size)
+        self.max_lookback = self.window_size # Akış bağlamı sadece pencereyi saklar
+        self.windows = (self.window_size,)
         self.deviation_threshold = max(1.0, deviation_threshold)
         self.min_hands_in_window = max(5, min_hands)
 
-    def predict(self, history: list) -> str:
+    def set_base_probabilities(self, player_perc: float, banker_perc: float):
+        """Canlı (kalan ayakkabıdan hesaplanan, Tie'lar hariç) P/B yüzdelerini kullanır."""
+        self.THEO_PLAYER_PROB = player_perc
+        self.THEO_BANKER_PROB = banker_perc
+
+    def memo_key(self, context):
+        # Sonuç pencere sayılarına ve (canlı olabilen) teorik oranlara bağlıdır
+        return context.window_counts(self.window_size), self.THEO_PLAYER_PROB, self.THEO_BANKER_PROB
+
+    def evaluate(self, history: HistoryLike) -> PredictionResult:
         """
         Verilen geçmişe göre bir sonraki hamleyi tahmin eder.
         Sapma yeterince büyükse, FAZLA performans gösteren tarafı tahmin eder.
         """
-        relevant_history = [res for res in history if res in ('P', 'B')]
-        window = relevant_history[-self.window_size:]
-        window_len = len(window)
+        p_wins, b_wins = as_context(history).window_counts(self.window_size)
+        window_len = p_wins + b_wins
 
         if window_len < self.min_hands_in_window:
-            return "N/A"
+            return NO_PREDICTION
 
-        p_wins = window.count('P'); b_wins = window.count('B')
         actual_p_perc = (p_wins / window_len) * 100
         actual_b_perc = (b_wins / window_len) * 100
         p_deviation = actual_p_perc - self.THEO_PLAYER_PROB # P ne kadar fazla?
         b_deviation = actual_b_perc - self.THEO_BANKER_PROB # B ne kadar fazla?
 
-        # Hangi taraf eşiği pozitif yönde aştıysa, o tarafın devam edeceğini tahmin et
+        # Hangi taraf eşiği pozitif yönde aştıysa, o tarafın devam edeceğini tahmin et.
+        # Sapma Analizcisi ile benzer mantık: Sapma ne kadar büyükse güven o kadar yüksek.
+        # Olasılık olarak tahmin edilen tarafın son penceredeki gerçek yüzdesi kullanılır.
         if p_deviation >= self.deviation_threshold:
             # Player fazla kazanmış ve momentumda, Player devam eder!
-            return 'P'
+            return PredictionResult('P', self._confidence(p_deviation), self._probability(actual_p_perc))
         elif b_deviation >= self.deviation_threshold:
             # Banker fazla kazanmış ve momentumda, Banker devam eder!
-            return 'B'
+            return PredictionResult('B', self._confidence(b_deviation), self._probability(actual_b_perc))
         else:
             # Belirgin bir sapma (momentum) yok
-            return "N/A"
-
-    def get_confidence(self, history: list) -> float:
-        """Tahminin güven oranını döndürür."""
-        # Sapma Analizcisi ile benzer mantık: Sapma ne kadar büyükse güven o kadar yüksek.
-        prediction = self.predict(history)
-        if prediction == "N/A": return 0.0
-
-        relevant_history = [res for res in history if res in ('P', 'B')]
-        window = relevant_history[-self.window_size:]
-        window_len = len(window)
-        if window_len < self.min_hands_in_window: return 0.0
-
-        p_wins = window.count('P'); b_wins = window.count('B')
-        actual_p_perc = (p_wins / window_len) * 100; actual_b_perc = (b_wins / window_len) * 100
-        p_deviation = actual_p_perc - self.THEO_PLAYER_PROB
-        b_deviation = actual_b_perc - self.THEO_BANKER_PROB
-
-        deviation_magnitude = 0
-        if prediction == 'P': deviation_magnitude = p_deviation # P ne kadar fazla sapmışsa
-        elif prediction == 'B': deviation_magnitude = b_deviation # B ne kadar fazla sapmışsa
+            return NO_PREDICTION
 
+    def _confidence(self, deviation_magnitude: float) -> float:
         # Sapma Analizcisi ile aynı güven formülünü kullanabiliriz
         base_confidence = 40.0
         confidence_increase = max(0, deviation_magnitude - self.deviation_threshold) * 5.0
@@ -71,25 +66,32 @@ class AntiStatsPredictor:
 
         return max(30.0, min(90.0, confidence))
 
-    def get_probability(self, history: list) -> float:
-        """Tahminin gerçekleşme olasılığını döndürür."""
-        # Momentumun devam etme olasılığı ne kadar? Belki teorik olasılıktan biraz daha yüksek?
-        prediction = self.predict(history)
-        if prediction == "N/A": return 0.0
-
-        # Tahmin edilen tarafın son penceredeki gerçek yüzdesini olasılık olarak kullanabiliriz?
-        relevant_history = [res for res in history if res in ('P', 'B')]
-        window = relevant_history[-self.window_size:]
-        window_len = len(window)
-        if window_len < self.min_hands_in_window: return 50.0 # Emin değiliz
-
-        prob = 50.0
-        if prediction == 'P':
-            p_wins = window.count('P')
-            prob = (p_wins / window_len) * 100
-        elif prediction == 'B':
-            b_wins = window.count('B')
-            prob = (b_wins / window_len) * 100
-
+    def _probability(self, actual_perc: float) -> float:
         # Olasılığı biraz daha makul sınırlarda tutalım
-        return max(40.0, min(75.0, prob)) # %40-75 arası
+        return max(40.0, min(75.0, actual_perc)) # %40-75 arası
+
+    def evaluate_batch(self, outcomes):
+        """
+        Toplu değerlendirme: (simülasyon x el) int8 sonuç dizisinin her konumu için
+        tahmin, güven ve olasılık dizilerini tek vektörel geçişte döndürür (bkz. batch_features).
+        """
+        import numpy as np
+        from predictors.batch_features import as_batch_features, batch_result
+        from simulation.baccarat_tables import OUTCOME_PLAYER, OUTCOME_BANKER
+        features = as_batch_features(outcomes)
+        p_wins, b_wins = features.window_counts(self.window_size)
+        window_len = p_wins + b_wins
+        with np.errstate(divide='ignore', invalid='ignore'):
+            actual_p_perc = (p_wins / window_len) * 100
+            actual_b_perc = (b_wins / window_len) * 100
+        p_deviation = actual_p_perc - self.THEO_PLAYER_PROB
+        b_deviation = actual_b_perc - self.THEO_BANKER_PROB
+        # Eşiği pozitif yönde aşan taraf (önce Player) devam eder
+        p_over = p_deviation >= self.deviation_threshold
+        b_over = ~p_over & (b_deviation >= self.deviation_threshold)
+        active = (window_len >= self.min_hands_in_window) & (p_over | b_over)
+        deviation = np.where(p_over, p_deviation, b_deviation)
+        confidence = np.clip(40.0 + np.maximum(0, deviation - self.deviation_threshold) * 5.0, 30.0, 90.0)
+        prediction = np.where(p_over, OUTCOME_PLAYER, OUTCOME_BANKER)
+        probability = np.clip(np.where(p_over, actual_p_perc, actual_b_perc), 40.0, 75.0)
+        return batch_result(active, prediction, confidence, probability)
@@ -1,38 +1,45 @@
-class AntiTrendPredictor:
+from typing import Mapping
+from predictors.base_predictor import BasePredictor, PredictionResult
+
+class AntiTrendPredictor(BasePredictor):
     """
     Başka bir modelin tahmininin tersini yapan 'Ters Köşe' modeli.
     Genellikle en popüler veya ilk modelin tersini hedefler.
     """
+    max_lookback = 0 # Geçmişi kullanmaz, sadece birincil modelin sonucuna bakar
 
-    def predict(self, history: list, primary_prediction: str = 'N/A') -> str:
+    def __init__(self, primary_model_name="Zigzag"):
+        self.primary_model_name = primary_model_name # Tersi alınacak modelin adı (main.py'deki dict key'i)
+        self.inputs = (primary_model_name,)
+
+    def evaluate(self, history: list, primary: PredictionResult = PredictionResult('N/A', 50.0, 50.0)) -> PredictionResult:
         """
-        Verilen 'birincil' tahminin tersini tahmin eder.
-        'P', 'B' veya tahmin yapılamıyorsa 'N/A' döndürür.
+        Verilen 'birincil' sonucun tersini tahmin eder.
         'history' parametresi bu model için doğrudan kullanılmaz ama standart arayüz için vardır.
+        Güven ve olasılık, birincil modelin değerlerinin %100'den farkıdır (%10-90 arasında tutulur).
         """
-        if primary_prediction == 'P':
-            return 'B'
-        elif primary_prediction == 'B':
-            return 'P'
+        if primary.prediction == 'P':
+            prediction = 'B'
+        elif primary.prediction == 'B':
+            prediction = 'P'
         else: # Eğer birincil tahmin 'N/A' veya 'T' ise, ters köşe de 'N/A' döndürür.
-            return 'N/A'
+            prediction = 'N/A'
+        confidence = max(10.0, min(90.0, 100.0 - primary.confidence))
+        probability = max(10.0, min(90.0, 100.0 - primary.probability))
+        return PredictionResult(prediction, confidence, probability)
 
-    def get_confidence(self, history: list, primary_confidence: float = 50.0) -> float:
-        """
-        Tahminin güven oranını döndürür.
-        Basitçe, birincil modelin güveninin tersini (%100'den farkı) verebiliriz
-        veya daha basit bir mantık kullanabiliriz. Şimdilik %50'den farkını alalım.
-        """
-        # Güveni %10-90 arasında tutalım
-        confidence = 100.0 - primary_confidence
-        return max(10.0, min(90.0, confidence))
+    def current_with(self, results: Mapping[str, PredictionResult]) -> PredictionResult:
+        """Birincil modelin bu eldeki sonucunun tersini döndürür."""
+        return self.current(results[self.primary_model_name])
 
+    def predict(self, history: list, primary_prediction: str = 'N/A') -> str:
+        """Verilen 'birincil' tahminin tersini ('P', 'B' veya 'N/A') döndürür."""
+        return self.evaluate(history, PredictionResult(primary_prediction, 50.0, 50.0)).prediction
+
+    def get_confidence(self, history: list, primary_confidence: float = 50.0) -> float:
+        """Birincil modelin güveninin tersini (%100'den farkını) döndürür."""
+        return self.evaluate(history, PredictionResult('N/A', primary_confidence, 50.0)).confidence
 
     def get_probability(self, history: list, primary_probability: float = 50.0) -> float:
-        """
-        Tahminin gerçekleşme olasılığını döndürür.
-        Benzer şekilde, birincil modelin olasılığının tersini verebiliriz.
-        """
-         # Olasılığı %10-90 arasında tutalım
-        probability = 100.0 - primary_probability
-        return max(10.0, min(90.0, probability))
+        """Birincil modelin olasılığının tersini döndürür."""
+        return self.evaluate(history, PredictionResult('N/A', 50.0, primary_probability)).probability
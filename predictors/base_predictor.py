@@ -0,0 +1,134 @@
+# predictors/base_predictor.py
+"""
+Tüm tahmincilerin ortak arayüzü.
+Her model analizini tek bir geçişte yapan evaluate() metodunu uygular ve
+tahmin, güven ve olasılığı birlikte bir PredictionResult olarak döndürür.
+Eski predict / get_confidence / get_probability metodları evaluate()
+üzerinde ince sarmalayıcılar olarak korunur.
+
+Akış arayüzü (observe / current / reset): model her yeni sonucu observe() ile
+alır ve kendi küçük durumunu (seri sayaçları, pencere sayıları...) günceller;
+current() bu durumdan tahmini üretir. Varsayılan uygulama, modelin
+max_lookback kadar geriye baktığı sınırlı bir HistoryContext tutar; böylece her
+el, oturum uzunluğundan bağımsız olarak sabit sürede işlenir.
+
+Sonek tablosu: çıktısı sadece son suffix_lookback P/B sonucuna bağlı olan
+modeller asıl mantıklarını evaluate_suffix() içinde tutar; bu mantık olası her
+sonek için bir kez çalıştırılıp tabloya derlenir (bkz. suffix_table) ve
+evaluate() her elde lookup() ile tek bir tablo indekslemesi yapar.
+memo_key() ise sonucu belirleyen küçük durumu (MemoizedPredictor önbelleği için) verir.
+"""
+from typing import Hashable, Mapping, NamedTuple, Optional, Tuple
+from predictors.history_context import HistoryContext
+from predictors.suffix_table import compile_suffix_table, MAX_SUFFIX_LOOKBACK
+
+
+class PredictionResult(NamedTuple):
+    prediction: str     # 'P', 'B' veya 'N/A'
+    confidence: float   # Güven (%)
+    probability: float  # Gerçekleşme olasılığı (%)
+
+
+# Model yorum yapmadığında döndürülen sonuç (eski get_confidence/get_probability gibi 0.0)
+NO_PREDICTION = PredictionResult('N/A', 0.0, 0.0)
+
+# inputs içinde kullanıldığında: meta olmayan (sadece geçmişe bakan) tüm modellerin sonuçları
+ALL_BASE_MODELS = '*'
+
+
+class BasePredictor:
+    """
+    Tahmincilerin temel sınıfı. Alt sınıflar evaluate() metodunu uygular.
+    Meta modeller evaluate'e geçmişten sonra ek girdiler (diğer modellerin
+    sonuçları vb.) alır; sarmalayıcılar bu girdileri olduğu gibi iletir.
+    """
+
+    # Modelin geriye baktığı en fazla P/B (ve ham) sonuç sayısı; None ise tüm geçmiş.
+    # Akış bağlamı bundan eski kayıtları atar (oturum toplamları korunur).
+    max_lookback: Optional[int] = None
+    # Sonuçlarını girdi olarak kullandığı modellerin adları; boşsa sadece geçmişe bakan temel modeldir
+    inputs: Tuple[str, ...] = ()
+    # Worker havuzunda çalıştırılabilir mi? Durumunu başka bir nesnenin beslediği
+    # (ör. paylaşılan bağlam ağacını okuyan) modeller çağıranın iş parçacığında çalışır.
+    pool_safe: bool = True
+    # Çıktıyı belirleyen son P/B sonucu sayısı (daha uzun seriler/almaşıklar aynı sonucu verir).
+    # Tanımlıysa model evaluate_suffix'i tabloya derleyip lookup ile kullanabilir.
+    suffix_lookback: Optional[int] = None
+    # Okunan P/B pencere boyutları; akış bağlamı bunları kayan sayaçlara kaydeder (window_counts O(1))
+    windows: Tuple[int, ...] = ()
+
+    def evaluate(self, history, *inputs) -> PredictionResult:
+        """Tahmini, güveni ve olasılığı tek geçişte hesaplar."""
+        raise NotImplementedError
+
+    def predict(self, history, *inputs) -> str:
+        """Verilen geçmişe göre bir sonraki hamleyi ('P', 'B' veya 'N/A') döndürür."""
+        return self.evaluate(history, *inputs).prediction
+
+    def get_confidence(self, history, *inputs) -> float:
+        """Tahminin güven oranını döndürür."""
+        return self.evaluate(history, *inputs).confidence
+
+    def get_probability(self, history, *inputs) -> float:
+        """Tahminin gerçekleşme olasılığını döndürür."""
+        return self.evaluate(history, *inputs).probability
+
+    def evaluate_batch(self, outcomes):
+        """
+        Toplu değerlendirme: (simülasyon x el) int8 sonuç dizisinin her konumundaki geçmiş
+        için tahmin, güven ve olasılığı NumPy dizileri olarak (batch_features.BatchResult)
+        döndürür. Sadece geçmişe dayalı, vektörleştirilebilen modeller uygular.
+        """
+        raise NotImplementedError(f"{type(self).__name__} toplu değerlendirmeyi desteklemiyor")
+
+    # --- Sonek tablosu ---
+    def evaluate_suffix(self, history: HistoryContext) -> PredictionResult:
+        """Tabloya derlenen asıl mantık: en fazla suffix_lookback P/B sonucundan oluşan geçmiş için sonuç."""
+        raise NotImplementedError
+
+    def lookup(self, context: HistoryContext) -> PredictionResult:
+        """Bağlamın son suffix_lookback P/B sonucu için derlenmiş sonucu döndürür (tablo ilk çağrıda kurulur)."""
+        if self.suffix_lookback > MAX_SUFFIX_LOOKBACK:
+            return self.evaluate_suffix(context)  # Tablo çok büyük olurdu; mantık doğrudan çalışır
+        table = self.__dict__.get('_suffix_table')
+        if table is None:
+            table = self._suffix_table = compile_suffix_table(self.evaluate_suffix, self.suffix_lookback)
+        return table[context.suffix_key(self.suffix_lookback)]
+
+    def memo_key(self, context: HistoryContext) -> Optional[Hashable]:
+        """
+        Sonucu tek başına belirleyen durumun anahtarı (MemoizedPredictor için); aynı
+        anahtarlı iki geçmiş aynı sonucu vermelidir. None ise sonuç önbelleğe alınamaz.
+        Varsayılan: sonek tablosu olan modellerde son suffix_lookback P/B sonucu.
+        """
+        if self.suffix_lookback is None:
+            return None
+        return context.suffix_key(self.suffix_lookback)
+
+    # --- Akış arayüzü ---
+    def _stream_context(self) -> HistoryContext:
+        context = self.__dict__.get('_stream')
+        if context is None:
+            context = self._stream = HistoryContext(max_lookback=self.max_lookback)
+            for size in self.windows:
+                context.register_window(size)
+        return context
+
+    def observe(self, result: str):
+        """Yeni bir sonucu ('P', 'B' veya 'T') modelin akış durumuna ekler. O(1)."""
+        self._stream_context().append(result)
+
+    def current(self, *inputs) -> PredictionResult:
+        """Şimdiye kadar gözlenen sonuçlara göre tahmini, güveni ve olasılığı döndürür."""
+        return self.evaluate(self._stream_context(), *inputs)
+
+    def current_with(self, results: Mapping[str, PredictionResult]) -> PredictionResult:
+        """
+        Meta modeller için: 'inputs' ile bildirilen modellerin bu eldeki sonuçlarıyla
+        akış tahminini döndürür. Temel modellerde current() ile aynıdır.
+        """
+        return self.current()
+
+    def reset(self):
+        """Akış durumunu temizler (geri alma / temizleme sonrası yeniden oynatmadan önce)."""
+        self._stream_context().clear()
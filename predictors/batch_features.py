@@ -0,0 +1,95 @@
+# predictors/batch_features.py
+"""
+Çok sayıda bağımsız el geçmişi (simülasyon x el) için tahminci özelliklerinin
+NumPy ile toplu (vektörel) hesaplanması.
+Girdi, vectorized_engine.resolve_shoes çıktısı gibi bir int8 sonuç dizisidir
+(OUTCOME_PLAYER / OUTCOME_BANKER / OUTCOME_TIE; oynanmamış eller OUTCOME_NONE).
+Her [s, i] konumu, s. simülasyonda i. ele kadar (dahil) olan geçmişi temsil eder;
+tahminciler evaluate_batch ile bu geçmişten sonraki el için tahmin üretir.
+Tie ve oynanmamış eller, HistoryContext'te olduğu gibi P/B görünümünü değiştirmez.
+
+Özellikler (seri/almaşık uzunlukları, pencere sayıları) BatchFeatures'ta bir kez
+hesaplanıp önbelleğe alınır; aynı dizi üzerinde çalışan modeller onları paylaşır.
+"""
+from typing import Dict, NamedTuple, Tuple, Union
+
+import numpy as np
+
+from simulation.baccarat_tables import OUTCOME_PLAYER, OUTCOME_BANKER
+from simulation.vectorized_engine import OUTCOME_NONE
+
+PREDICTION_NONE = OUTCOME_NONE # Tahmin yok (N/A)
+
+
+class BatchResult(NamedTuple):
+    prediction: np.ndarray   # int8: OUTCOME_PLAYER, OUTCOME_BANKER veya PREDICTION_NONE
+    confidence: np.ndarray   # float64 (%); N/A konumlarında 0.0
+    probability: np.ndarray  # float64 (%); N/A konumlarında 0.0
+
+
+class BatchFeatures:
+    """Sonuç dizisinden türetilen, modellerin paylaştığı konum bazlı özellikler."""
+
+    def __init__(self, outcomes: np.ndarray):
+        outcomes = np.atleast_2d(np.asarray(outcomes, dtype=np.int8))
+        n_sims, n_hands = outcomes.shape
+        self.outcomes = outcomes
+        self.is_pb = (outcomes == OUTCOME_PLAYER) | (outcomes == OUTCOME_BANKER)
+        # pb_count[s, i]: i. ele kadar P/B sayısı; p_count: P sayısı
+        self.pb_count = np.cumsum(self.is_pb, axis=1, dtype=np.int32)
+        self.p_count = np.cumsum(outcomes == OUTCOME_PLAYER, axis=1, dtype=np.int32)
+
+        # Son P/B sonucu (henüz yoksa PREDICTION_NONE)
+        last_index = np.maximum.accumulate(np.where(self.is_pb, np.arange(n_hands), -1), axis=1)
+        self.last = np.where(last_index >= 0, np.take_along_axis(outcomes, np.maximum(last_index, 0), axis=1),
+                             PREDICTION_NONE).astype(np.int8)
+        # Her konumdan önceki son P/B sonucu
+        previous = np.concatenate([np.full((n_sims, 1), PREDICTION_NONE, dtype=np.int8), self.last[:, :-1]], axis=1)
+
+        # Seri / almaşık dizi başlangıçlarındaki pb_count değerleri ileri taşınarak uzunluklar bulunur
+        new_streak = self.is_pb & (outcomes != previous)
+        new_alternation = self.is_pb & ((outcomes == previous) | (previous == PREDICTION_NONE))
+        streak_start = np.maximum.accumulate(np.where(new_streak, self.pb_count, 0), axis=1)
+        alternation_start = np.maximum.accumulate(np.where(new_alternation, self.pb_count, 0), axis=1)
+        self.streak = np.where(self.pb_count > 0, self.pb_count - streak_start + 1, 0)
+        self.alternation = np.where(self.pb_count > 0, self.pb_count - alternation_start + 1, 0)
+
+        self._p_by_pb_count = None
+        self._windows: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+    def window_counts(self, size: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Her konumda son 'size' P/B sonucundaki (P sayısı, B sayısı) dizileri."""
+        if size not in self._windows:
+            if self._p_by_pb_count is None:
+                # _p_by_pb_count[s, k]: ilk k P/B sonucundaki P sayısı
+                n_sims, n_hands = self.outcomes.shape
+                p_by_pb_count = np.zeros((n_sims, n_hands + 1), dtype=np.int32)
+                rows, cols = np.nonzero(self.is_pb)
+                p_by_pb_count[rows, self.pb_count[rows, cols]] = self.p_count[rows, cols]
+                self._p_by_pb_count = p_by_pb_count
+            start = np.maximum(self.pb_count - size, 0)
+            p_wins = self.p_count - np.take_along_axis(self._p_by_pb_count, start, axis=1)
+            self._windows[size] = (p_wins, (self.pb_count - start) - p_wins)
+        return self._windows[size]
+
+
+BatchLike = Union[np.ndarray, BatchFeatures]
+
+
+def as_batch_features(outcomes: BatchLike) -> BatchFeatures:
+    """Sonuç dizisini özelliklere çevirir; zaten BatchFeatures ise olduğu gibi döndürür."""
+    if isinstance(outcomes, BatchFeatures):
+        return outcomes
+    return BatchFeatures(outcomes)
+
+
+def opposite(codes: np.ndarray) -> np.ndarray:
+    """P kodlarını B'ye, B kodlarını P'ye çevirir."""
+    return (OUTCOME_PLAYER + OUTCOME_BANKER - codes).astype(np.int8)
+
+
+def batch_result(active: np.ndarray, prediction: np.ndarray,
+                 confidence: np.ndarray, probability: np.ndarray) -> BatchResult:
+    """Tahmin yapılmayan konumları N/A (güven ve olasılık 0.0) olarak işaretler."""
+    return BatchResult(np.where(active, prediction, PREDICTION_NONE).astype(np.int8),
+                       np.where(active, confidence, 0.0), np.where(active, probability, 0.0))
@@ -1,12 +1,23 @@
 import time
 import random # Alternatif veya yedek için
+from predictors.base_predictor import BasePredictor, PredictionResult
 
-class ChaosWalkerPredictor:
+class ChaosWalkerPredictor(BasePredictor):
     """
     Baccarat'ın rastgeleliğine oynayan model.
     Tahminini sistem saatinin milisaniyesine göre yapar.
     Tek milisaniye -> P, Çift milisaniye -> B (veya tersi).
     """
+    max_lookback = 0 # Geçmişi kullanmaz
+
+    # Rastgeleliğe dayandığı için düşük/orta sabit bir güven (düşük ama sıfır değil)
+    # ve tamamen rastgele olduğu varsayıldığı için %50 olasılık
+    CONFIDENCE = 35.0
+    PROBABILITY = 50.0
+
+    def evaluate(self, history: list) -> PredictionResult:
+        """Saate dayalı tahmini sabit güven ve olasılıkla döndürür."""
+        return PredictionResult(self.predict(history), self.CONFIDENCE, self.PROBABILITY)
 
     def predict(self, history: list) -> str:
         """
@@ -37,18 +48,3 @@ class ChaosWalkerPredictor:
             # print(f"ChaosWalker time error: {e}") # Hata ayıklama için
             return random.choice(['P', 'B'])
 
-
-    def get_confidence(self, history: list) -> float:
-        """
-        Tahminin güven oranını döndürür.
-        Rastgeleliğe dayandığı için düşük/orta sabit bir güven verelim.
-        """
-        # Belki zamanla hafifçe değişen bir şey yapılabilir ama şimdilik sabit.
-        return 35.0 # Düşük ama sıfır değil
-
-    def get_probability(self, history: list) -> float:
-        """
-        Tahminin gerçekleşme olasılığını döndürür.
-        Tamamen rastgele olduğu varsayıldığı için %50 verelim.
-        """
-        return 50.0
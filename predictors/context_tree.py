@@ -0,0 +1,95 @@
+# predictors/context_tree.py
+"""
+Değişken dereceli bağlam ağacı (suffix sayım ağacı).
+Son k P/B sonucundan oluşan her bağlam için, o bağlamdan sonra gelen P ve B
+sayılarını tutar. Ağaç düz bir dizide yığın (heap) indekslemesiyle saklanır:
+k uzunluklu bağlamın düğümü (1 << k) | bitler'dir (P=1, B=0; en yeni el en
+düşük bit). Kök (k=0) tüm P/B sayılarını tutar; bir düğümün çocuğu bağlamı
+bir el daha geriye uzatır.
+
+Her elde tek bir kökten-yaprağa yürüyüşle güncellenir (O(max_order)) ve tek bir
+yürüyüşle 0..max_order arasındaki bütün derecelerin sayılarını verir. Böylece
+2'den 12'ye kadar her n için ayrı desen taraması yerine bütün desen modeli ailesi
+aynı ağacı paylaşır.
+"""
+from typing import List, Sequence, Tuple
+from predictors.ngram_table import pack_pattern
+
+MAX_ORDER = 12
+
+
+class ContextTree:
+    """
+    En fazla max_order uzunluklu bağlamların (sonraki P sayısı, sonraki B sayısı) ağacı.
+    observe / forget, NgramTable'da olduğu gibi P/B görünümüne yeni eklenen ya da
+    geri alınmak üzere olan son eleman için çağrılır.
+    """
+
+    def __init__(self, max_order: int = MAX_ORDER):
+        self.max_order = max(1, min(MAX_ORDER, max_order))
+        size = 2 << self.max_order  # k <= max_order için (1 << k) | bitler < 2^(max_order+1)
+        self.p_next: List[int] = [0] * size
+        self.b_next: List[int] = [0] * size
+        self.key = 0     # Son max_order P/B sonucunun paketlenmiş hali
+        self.length = 0  # Gözlenen P/B sonucu sayısı
+        self._walk: List[Tuple[int, int]] = []  # Son yürüyüşün sonucu (ağaç değişince boşaltılır)
+
+    def _update(self, key: int, depth: int, is_p: bool, delta: int):
+        """Bağlamı 'key' olan sonucun yolundaki (0..depth dereceli) düğümleri günceller."""
+        counts = self.p_next if is_p else self.b_next
+        node = 1
+        for k in range(depth + 1):
+            counts[node] += delta
+            if k < depth:
+                # Çocuk: (1 << (k+1)) | (bit << k) | alt bitler
+                node += (1 + ((key >> k) & 1)) << k
+        self._walk = []
+
+    def observe(self, pb: Sequence[str]):
+        """pb'nin son elemanını, kendinden önceki her dereceden bağlamın ardılı olarak sayar."""
+        is_p = pb[-1] == 'P'
+        self._update(self.key, min(self.length, self.max_order), is_p, 1)
+        self.key = ((self.key << 1) | is_p) & ((1 << self.max_order) - 1)
+        self.length += 1
+
+    def forget(self, pb: Sequence[str]):
+        """pb'nin son elemanının sayımını geri alır (eleman çıkarılmadan önce çağrılır)."""
+        self.length -= 1
+        self.key = pack_pattern(pb[-self.max_order - 1:-1])
+        self._update(self.key, min(self.length, self.max_order), pb[-1] == 'P', -1)
+
+    def clear(self):
+        size = 2 << self.max_order
+        self.p_next = [0] * size
+        self.b_next = [0] * size
+        self.key = 0
+        self.length = 0
+        self._walk = []
+
+    def walk(self) -> List[Tuple[int, int]]:
+        """
+        Kökten başlayıp son sonuçları geriye doğru izleyerek her derece için
+        (P sayısı, B sayısı) listesini döndürür: liste[k], son k sonuçtan oluşan
+        bağlamın sayılarıdır. Sonuç bir sonraki güncellemeye kadar saklanır.
+        """
+        if self._walk:
+            return self._walk
+        walk = []
+        node = 1; key = self.key
+        depth = min(self.length, self.max_order)
+        for k in range(depth + 1):
+            p_count = self.p_next[node]; b_count = self.b_next[node]
+            if not p_count and not b_count:
+                break  # Bu bağlam hiç görülmediyse daha uzunları da görülmemiştir
+            walk.append((p_count, b_count))
+            if k < depth:
+                node += (1 + ((key >> k) & 1)) << k
+        self._walk = walk
+        return walk
+
+    def counts(self, order: int) -> Tuple[int, int]:
+        """Son 'order' sonuçtan oluşan bağlamdan sonra gelen (P sayısı, B sayısı)."""
+        if order > self.max_order or self.length < order:
+            return 0, 0
+        walk = self.walk()
+        return walk[order] if order < len(walk) else (0, 0)
@@ -1,88 +1,66 @@
-class DragonTailPredictor:
+from predictors.history_context import HistoryLike, as_context
+from predictors.base_predictor import BasePredictor, PredictionResult, NO_PREDICTION
+
+class DragonTailPredictor(BasePredictor):
     """
     "Ejderha Takibi" Modeli: Belirli bir minimum uzunluktaki (genellikle 6+)
     kesintisiz P veya B serisini ("Ejderha") algılar ve kırılana kadar
     bu serinin devamını tahmin eder.
     """
+    max_lookback = 1 # Seri uzunluğu bağlamdan gelir; son el yeterli
+
     def __init__(self, min_dragon_length=6):
         # Ejderha olarak kabul edilecek minimum seri uzunluğu
         self.min_dragon_length = max(3, min_dragon_length) # En az 3 mantıklı olur
 
-    def predict(self, history: list) -> str:
+    def memo_key(self, context):
+        # 10 fazla elden sonra güven ve olasılık tavandadır; daha uzun ejderhalar aynı sonucu verir
+        return context.last, min(context.streak_length, self.min_dragon_length + 10)
+
+    def evaluate(self, history: HistoryLike) -> PredictionResult:
         """
         Geçmişe bakarak bir "Ejderha" serisi varsa ve devam ediyorsa,
         serinin bir sonraki adımını tahmin eder. Yoksa 'N/A' döner.
         """
-        relevant_history = [res for res in history if res in ('P', 'B')]
-        history_len = len(relevant_history)
+        context = as_context(history)
 
         # Tahmin için en az minimum ejderha uzunluğu kadar el olmalı
-        if history_len < self.min_dragon_length:
-            return "N/A"
+        if context.pb_count < self.min_dragon_length:
+            return NO_PREDICTION
 
-        # Mevcut serinin ne olduğunu ve ne kadar uzun olduğunu bulalım
-        current_streak_element = relevant_history[-1]
-        current_streak_length = 0
-        for i in range(history_len - 1, -1, -1):
-            if relevant_history[i] == current_streak_element:
-                current_streak_length += 1
-            else:
-                break # Seri bitti
+        # Mevcut serinin ne olduğu ve ne kadar uzun olduğu
+        current_streak_element = context.last
+        current_streak_length = context.streak_length
 
         # Şu anki seri bir Ejderha mı? (Yeterince uzun mu?)
-        if current_streak_length >= self.min_dragon_length:
-            # Evet, bir ejderhanın kuyruğundayız! Takip et!
-            # print(f"Following the Dragon ({current_streak_element})! Length: {current_streak_length}") # Debug
-            return current_streak_element
-        else:
+        if current_streak_length < self.min_dragon_length:
             # Ya seri kırıldı ya da henüz Ejderha boyutuna ulaşmadı.
-            return "N/A"
+            return NO_PREDICTION
 
-    def get_confidence(self, history: list) -> float:
-        """Tahminin güven oranını döndürür."""
-        prediction = self.predict(history)
-        if prediction == "N/A":
-            return 0.0
+        # Evet, bir ejderhanın kuyruğundayız! Takip et!
+        extra_length = max(0, current_streak_length - self.min_dragon_length)
 
         # Ejderha ne kadar uzunsa, güven o kadar yüksek olsun!
-        relevant_history = [res for res in history if res in ('P', 'B')]
-        current_streak_length = 0
-        # ... (predict'teki gibi serinin uzunluğunu bul) ...
-        if relevant_history:
-             current_streak_element = relevant_history[-1]
-             for i in range(len(relevant_history) - 1, -1, -1):
-                 if relevant_history[i] == current_streak_element: current_streak_length += 1
-                 else: break
-
-        # Min uzunluktan sonraki her adım için güveni artıralım
         base_confidence = 65.0 # Ejderhayı yakaladık, temel güven yüksek!
-        confidence_increase = max(0, current_streak_length - self.min_dragon_length) * 5.0
-        confidence = base_confidence + confidence_increase
-
-        return min(95.0, confidence) # Max %95 güven
-
-
-    def get_probability(self, history: list) -> float:
-        """Tahminin gerçekleşme olasılığını döndürür."""
-        prediction = self.predict(history)
-        if prediction == "N/A":
-            return 0.0
+        confidence = min(95.0, base_confidence + extra_length * 5.0) # Max %95 güven
 
         # Ejderhanın devam etme olasılığı genellikle %50'den biraz düşüktür
         # ama uzun serilerde bu kural bazen bozulur (veya öyle hissedilir).
-        # Güvene benzer şekilde, seri uzadıkça olasılığı hafifçe artıralım.
-        relevant_history = [res for res in history if res in ('P', 'B')]
-        current_streak_length = 0
-        # ... (predict'teki gibi serinin uzunluğunu bul) ...
-        if relevant_history:
-             current_streak_element = relevant_history[-1]
-             for i in range(len(relevant_history) - 1, -1, -1):
-                 if relevant_history[i] == current_streak_element: current_streak_length += 1
-                 else: break
-
-        base_probability = 50.0 # Başlangıç
-        # Uzun serilerde hafif artış (momentuma inanç)
-        probability_increase = max(0, current_streak_length - self.min_dragon_length) * 1.5
-        probability = base_probability + probability_increase
+        # Güvene benzer şekilde, seri uzadıkça olasılığı hafifçe artıralım (momentuma inanç).
+        probability = 50.0 + extra_length * 1.5
+        probability = max(45.0, min(65.0, probability)) # Olasılığı %45-65 arası tutalım
+        return PredictionResult(current_streak_element, confidence, probability)
 
-        return max(45.0, min(65.0, probability)) # Olasılığı %45-65 arası tutalım
+    def evaluate_batch(self, outcomes):
+        """
+        Toplu değerlendirme: (simülasyon x el) int8 sonuç dizisinin her konumu için
+        tahmin, güven ve olasılık dizilerini tek vektörel geçişte döndürür (bkz. batch_features).
+        """
+        import numpy as np
+        from predictors.batch_features import as_batch_features, batch_result
+        features = as_batch_features(outcomes)
+        active = features.streak >= self.min_dragon_length
+        extra_length = np.maximum(0, features.streak - self.min_dragon_length)
+        confidence = np.minimum(95.0, 65.0 + extra_length * 5.0)
+        probability = np.clip(50.0 + extra_length * 1.5, 45.0, 65.0)
+        return batch_result(active, features.last, confidence, probability)
@@ -2,8 +2,10 @@ import sys
 import math
 from collections import deque  # Son N eldeki performansı takip etmek için
 from .statistical_deviation_predictor import StatisticalDeviationPredictor # Örnek
+from .history_context import as_context
+from .base_predictor import BasePredictor, PredictionResult, NO_PREDICTION
 
-class GuardianMetaPredictor:
+class GuardianMetaPredictor(BasePredictor):
     """
     Geliştirilmiş Vasi Meta-Tahminci: Daha kapsamlı risk analizi yapar,
     geçmiş performansları daha akıllı değerlendirir ve modellerin tahminlerini
@@ -69,18 +71,15 @@ class GuardianMetaPredictor:
 
     def _assess_shoe_characteristic(self, history):
         """Ayakkabının düzenli mi yoksa karışık mı olduğunu değerlendirir."""
-        relevant_history = [res for res in history if res in ('P', 'B')]
-        if len(relevant_history) < 20:
+        context = as_context(history)
+        if context.pb_count < 20:
             return 0.5  # Yeterli veri yoksa orta değer
             
-        window = relevant_history[-20:]
-        chops = 0
-        for i in range(len(window) - 1):
-            if window[i] != window[i+1]:
-                chops += 1
+        window_len = 20
+        chops = context.window_chops(window_len)
                 
         # Chop oranı (değişim oranı)
-        chop_ratio = chops / (len(window) - 1) if len(window) > 1 else 0.5
+        chop_ratio = chops / (window_len - 1)
         
         # Ayakkabı karakteristiğini güncelle (biraz yumuşatma uygula)
         self.shoe_choppy_score = (self.shoe_choppy_score * 0.7) + (chop_ratio * 0.3)
@@ -97,8 +96,8 @@ class GuardianMetaPredictor:
         if len(history) < 10:  # Başlangıçta her zaman düşük risk
             return 'Low', 10, ["Başlangıç Aşaması"]
         
-        relevant_history = [res for res in history if res in ('P', 'B')]
-        history_len = len(relevant_history)
+        context = as_context(history)
+        history_len = context.pb_count
 
         # 1. Aşırı Sapma Kontrolü
         sapma_threshold = 4.0
@@ -111,8 +110,8 @@ class GuardianMetaPredictor:
                 break
 
         if history_len >= sapma_window:
-            window = relevant_history[-sapma_window:]
-            p_wins = window.count('P')
+            # Pencere bağlamın kayan sayaçlarına kaydedilir; sonraki ellerde sayım O(1) okunur
+            p_wins, _ = context.register_window(sapma_window).counts(sapma_window)
             actual_p_perc = (p_wins / sapma_window) * 100
             deviation = abs(actual_p_perc - StatisticalDeviationPredictor.THEO_PLAYER_PROB)
             high_risk_threshold = sapma_threshold * self.RISK_HIGH_DEVIATION_THRESHOLD_FACTOR
@@ -151,7 +150,7 @@ class GuardianMetaPredictor:
                 reasons.append(f"Düşük Model Başarısı ({best_model_accuracy:.1f}%)")
 
         # 4. Ayakkabı geçiş dönemlerini tespit et
-        shoe_characteristic = self._assess_shoe_characteristic(history)
+        shoe_characteristic = self._assess_shoe_characteristic(context)
         if 0.4 < shoe_characteristic < 0.6:
             risk_score += 30
             reasons.append("Ayakkabı Karakteristiği Belirsiz (Geçiş Dönemi)")
@@ -235,11 +234,27 @@ class GuardianMetaPredictor:
             
         return 'P' if p_weight > b_weight else 'B'
 
-    def predict(self, history, current_run_results, predictor_stats, predictors):
-        """Geliştirilmiş tahmin stratejisi."""
-        # Risk analizi yap
-        risk_level, risk_score, risk_reasons = self._assess_risk(history, current_run_results, predictor_stats, predictors)
-        
+    def evaluate(self, history, current_run_results, predictor_stats, predictors) -> PredictionResult:
+        """
+        Risk analizini bir kez yapar; tahmini, güveni ve olasılığı aynı risk
+        seviyesinden türetir.
+        """
+        context = as_context(history)
+        risk_level, risk_score, risk_reasons = self._assess_risk(context, current_run_results, predictor_stats, predictors)
+        prediction = self._decide(context, risk_level, current_run_results, predictor_stats)
+        if prediction == "N/A":
+            return NO_PREDICTION
+
+        if risk_level == 'High':
+            # Yüksek riskte tahmin yapıyorsak bile düşük güven ve olasılık göster
+            return PredictionResult(prediction, 35.0, 45.0) # Sabit düşük güven / olasılık
+
+        confidence = self._confidence(prediction, risk_level, current_run_results)
+        probability = self._probability(prediction, current_run_results, predictor_stats)
+        return PredictionResult(prediction, confidence, probability)
+
+    def _decide(self, history, risk_level, current_run_results, predictor_stats):
+        """Geliştirilmiş tahmin stratejisi: risk seviyesine göre tahmini seçer."""
         # Yüksek risk durumunda bile bazı tahminler yapabilelim
         if risk_level == 'High':
             # Yüksek riskte bile en iyi modeli kullan
@@ -308,22 +323,8 @@ class GuardianMetaPredictor:
                 # Ağırlıklı consensus kullan
                 return self._get_weighted_consensus(current_run_results, predictor_stats)
 
-    def get_confidence(self, history, current_run_results, predictor_stats, predictors):
-        """Tahminin güven oranını döndürür."""
-        risk_level, risk_score, _ = self._assess_risk(history, current_run_results, predictor_stats, predictors)
-        
-        if risk_level == 'High':
-            # Yüksek riskte tahmin yapıyorsak bile düşük güven göster
-            prediction = self.predict(history, current_run_results, predictor_stats, predictors)
-            if prediction == "N/A":
-                return 0.0
-            return 35.0  # Sabit düşük güven
-            
-        # Tahmini tekrar yap (ideal değil ama kodu basit tutmak için)
-        prediction = self.predict(history, current_run_results, predictor_stats, predictors)
-        if prediction == "N/A":
-            return 0.0
-            
+    def _confidence(self, prediction, risk_level, current_run_results):
+        """Orta/düşük riskte tahminin güven oranını hesaplar."""
         # Hazır tahmin değerlerini topla
         p_confidence = 0.0
         b_confidence = 0.0
@@ -364,17 +365,8 @@ class GuardianMetaPredictor:
         
         return max(20.0, min(95.0, confidence))
 
-    def get_probability(self, history, current_run_results, predictor_stats, predictors):
-        """Tahminin gerçekleşme olasılığını döndürür."""
-        prediction = self.predict(history, current_run_results, predictor_stats, predictors)
-        if prediction == "N/A":
-            return 0.0
-            
-        # Yüksek risk durumunda tahmin yapıyorsak bile düşük olasılık göster
-        risk_level, _, _ = self._assess_risk(history, current_run_results, predictor_stats, predictors)
-        if risk_level == 'High':
-            return 45.0  # Sabit düşük olasılık
-            
+    def _probability(self, prediction, current_run_results, predictor_stats):
+        """Orta/düşük riskte tahminin gerçekleşme olasılığını hesaplar."""
         # Benzer model tahminlerini topla
         p_probability = 0.0
         b_probability = 0.0
@@ -396,9 +388,6 @@ class GuardianMetaPredictor:
         # Tahminin olasılığını hesapla
         probability = avg_p_probability if prediction == 'P' else avg_b_probability
         
-        # Ayakkabı karakteristiğine göre olasılığı ayarla
-        shoe_characteristic = self._assess_shoe_characteristic(history)
-        
         # Tahmin eden modellerin başarı oranlarına göre olasılığı ayarla
         supporting_models = []
         
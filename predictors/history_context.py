@@ -0,0 +1,294 @@
+# predictors/history_context.py
+"""
+Tüm tahmincilerin paylaştığı, her elde artımlı güncellenen geçmiş bağlamı.
+Ham geçmişi (Tie'lar dahil) liste gibi sunar; ayrıca P/B görünümünü, mevcut
+seriyi, almaşık (chop) uzunluğunu ve herhangi bir pencere için P/B ve değişim
+sayılarını önek toplamlarıyla O(1) sürede verir. Böylece her modelin
+[res for res in history if res in ('P','B')] süzmesi ve geriye doğru taraması
+oturum uzunluğundan bağımsız hale gelir. suffix_key(k), son k P/B sonucunun
+paketlenmiş anahtarını (arama tablosuna derlenmiş modeller için) O(1) sürede
+verir; register_window ile kaydedilen pencere boyutlarının P/B sayıları kayan
+sayaçlarla (bkz. window_counters) tutulur.
+
+max_lookback verilirse bağlam yalnızca son max_lookback P/B sonucunu ve son
+max_lookback ham sonucu saklar (eski kayıtlar toplu olarak, amortize O(1)
+budanır). Oturum toplamları (pb_count, count, seri/almaşık uzunlukları) budamadan
+etkilenmez; pencere sorguları max_lookback'e kadar doğrudur.
+"""
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+from predictors.ngram_table import NgramTable
+from predictors.context_tree import ContextTree
+from predictors.window_counters import WindowCounters
+
+PB_RESULTS = ('P', 'B')
+# Kayan sonek anahtarında tutulan en fazla P/B sonucu sayısı
+SUFFIX_KEY_BITS = 24
+_SUFFIX_KEY_MASK = (1 << SUFFIX_KEY_BITS) - 1
+# Sınırlı bağlamda budama en az bu kadar fazlalık biriktiğinde yapılır
+TRIM_SLACK = 64
+
+
+class HistoryContext:
+    """
+    Ham geçmişin artımlı bir görünümü. append/pop ile el el güncellenir,
+    sync ile BaccaratModel'in geçmiş listesine (ekleme, geri alma, temizleme) eşitlenir.
+    len(), indeksleme ve dilimleme ham geçmiş (Tie'lar dahil) üzerinde çalışır;
+    bu sayede ham listeyi bekleyen modeller (Falcı, Görsel Yoğunluk) değişmeden çalışır.
+    Sınırlı bağlamda len() ve indeksleme sadece saklanan kayıtları kapsar; oturum
+    toplamı için raw_count ve pb_count kullanılır.
+    """
+
+    def __init__(self, history: Optional[Sequence[str]] = None, max_lookback: Optional[int] = None):
+        self.raw: List[str] = []              # Tie'lar dahil tüm sonuçlar
+        self.pb: List[str] = []               # Sadece P/B sonuçları
+        self._p_prefix: List[int] = [0]       # _p_prefix[k]: pb[:k] içindeki P sayısı
+        self._change_prefix: List[int] = [0]  # _change_prefix[k]: pb[1:k] içinde bir öncekinden farklı olanların sayısı
+        self._streaks: List[int] = []         # pb[i] ile biten serinin uzunluğu
+        self._alternations: List[int] = []    # pb[i] ile biten almaşık (P-B-P...) dizinin uzunluğu
+        self._suffix_keys: List[int] = []     # pb[i] ile biten son SUFFIX_KEY_BITS sonucun anahtarı (P=1, en yeni en düşük bit)
+        self.revision = 0                     # Her değişiklikte artar (önbellek anahtarı olarak kullanılabilir)
+        self.max_lookback = None if max_lookback is None else max(0, max_lookback)
+        self._raw_offset = 0                  # Budanmış ham sonuç sayısı
+        self._pb_offset = 0                   # Budanmış P/B sonucu sayısı
+        self._ngram_tables: Dict[int, NgramTable] = {}  # n -> artımlı desen sayım tablosu
+        self._context_tree: Optional[ContextTree] = None  # Tüm dereceler için paylaşılan bağlam ağacı
+        self._window_counters: Optional[WindowCounters] = None  # Kayıtlı pencerelerin kayan P/B sayaçları
+        self._pattern_indexes: List = []      # Her P/B değişikliğinde güncellenen tablolar, ağaç ve sayaçlar
+        if history:
+            self.extend(history)
+
+    # --- Liste arayüzü (ham geçmiş) ---
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.raw)
+
+    def __getitem__(self, index):
+        return self.raw[index]
+
+    # --- Güncelleme ---
+    def append(self, result: str):
+        """Yeni bir sonucu ekler. O(1)."""
+        self.raw.append(result)
+        self.revision += 1
+        if result not in PB_RESULTS:
+            return
+        pb = self.pb
+        if pb:
+            last = pb[-1]
+            streak = self._streaks[-1] + 1 if result == last else 1
+            alternation = self._alternations[-1] + 1 if result != last else 1
+            changed = 1 if result != last else 0
+            suffix_key = ((self._suffix_keys[-1] << 1) | (result == 'P')) & _SUFFIX_KEY_MASK
+        else:
+            streak = alternation = 1
+            changed = 0
+            suffix_key = int(result == 'P')
+        pb.append(result)
+        self._p_prefix.append(self._p_prefix[-1] + (result == 'P'))
+        self._change_prefix.append(self._change_prefix[-1] + changed)
+        self._streaks.append(streak)
+        self._alternations.append(alternation)
+        self._suffix_keys.append(suffix_key)
+        for index in self._pattern_indexes:
+            index.observe(pb)
+        if self.max_lookback is not None:
+            self._trim()
+
+    def _trim(self):
+        """Sınırlı bağlamda son max_lookback kaydın gerisini toplu olarak atar."""
+        keep = self.max_lookback
+        limit = keep + max(keep, TRIM_SLACK)
+        if len(self.raw) > limit:
+            drop = len(self.raw) - keep
+            del self.raw[:drop]
+            self._raw_offset += drop
+        if len(self.pb) > limit:
+            drop = len(self.pb) - keep
+            # Önek toplamları mutlak değerlerini korur; sadece baştaki kayıtlar atılır
+            del self.pb[:drop]; del self._p_prefix[:drop]; del self._change_prefix[:drop]
+            del self._streaks[:drop]; del self._alternations[:drop]; del self._suffix_keys[:drop]
+            self._pb_offset += drop
+
+    def extend(self, results: Sequence[str]):
+        for result in results:
+            self.append(result)
+
+    def pop(self) -> Optional[str]:
+        """
+        Son sonucu geri alır (undo). O(1).
+        Sınırlı bağlamda budanan kayıtlar geri getirilemez; bu durumda geçmiş
+        sync ile (veya yeniden oynatılarak) baştan kurulmalıdır.
+        """
+        if not self.raw:
+            return None
+        result = self.raw.pop()
+        self.revision += 1
+        if result in PB_RESULTS:
+            for index in self._pattern_indexes:
+                index.forget(self.pb)
+            self.pb.pop(); self._p_prefix.pop(); self._change_prefix.pop()
+            self._streaks.pop(); self._alternations.pop(); self._suffix_keys.pop()
+        return result
+
+    def clear(self):
+        self.raw.clear(); self.pb.clear()
+        self._p_prefix[:] = [0]; self._change_prefix[:] = [0]
+        self._streaks.clear(); self._alternations.clear(); self._suffix_keys.clear()
+        self._raw_offset = self._pb_offset = 0
+        for index in self._pattern_indexes:
+            index.clear()
+        self.revision += 1
+
+    def sync(self, history: Sequence[str]) -> bool:
+        """
+        Bağlamı verilen ham geçmişe eşitler. Model geçmişi el el değiştirdiği için
+        olağan durum tek bir append veya pop'tur; başka her farkta baştan kurulur.
+        Sadece tek bir sonuç eklendiyse True döndürür (akış modellerine yalnızca
+        bu sonucu vermek yeterlidir); değişiklik olup olmadığı revision'dan anlaşılır.
+        """
+        size = self.raw_count; target = len(history)
+        if target == size + 1 and (size == 0 or (self.raw and history[size - 1] == self.raw[-1])):
+            self.append(history[-1])
+            return True
+        # Budanmış bir bağlamda geri alma pencereyi max_lookback'in altına düşürür; baştan kurulur
+        trimmed = self._raw_offset or self._pb_offset
+        if target == size - 1 and not trimmed and (target == 0 or history[-1] == self.raw[-2]):
+            self.pop()
+        elif target != size or (self.raw and history[-1] != self.raw[-1]):
+            self.clear()
+            self.extend(history)
+        return False
+
+    @property
+    def raw_count(self) -> int:
+        """Oturumdaki toplam ham sonuç sayısı (budananlar dahil)."""
+        return self._raw_offset + len(self.raw)
+
+    # --- P/B görünümü ---
+    @property
+    def pb_count(self) -> int:
+        return self._pb_offset + len(self.pb)
+
+    @property
+    def last(self) -> Optional[str]:
+        """Son P/B sonucu (yoksa None)."""
+        return self.pb[-1] if self.pb else None
+
+    def tail(self, size: int) -> List[str]:
+        """Son 'size' P/B sonucu."""
+        return self.pb[-size:] if size > 0 else []
+
+    def count(self, result: str) -> int:
+        """Tüm oturumdaki P veya B sayısı."""
+        p_total = self._p_prefix[-1]
+        if result == 'P': return p_total
+        if result == 'B': return self.pb_count - p_total
+        return 0
+
+    @property
+    def streak_length(self) -> int:
+        """Mevcut (son P/B sonucuyla biten) serinin uzunluğu."""
+        return self._streaks[-1] if self._streaks else 0
+
+    @property
+    def alternation_length(self) -> int:
+        """Son P/B sonucuyla biten almaşık dizinin eleman sayısı (son iki aynıysa 1)."""
+        return self._alternations[-1] if self._alternations else 0
+
+    def suffix_key(self, size: int) -> int:
+        """
+        Son 'size' P/B sonucunun (daha az varsa hepsinin) anahtarı: m = min(size, pb_count)
+        için (1 << m) | bitler. Bağlam ağacındaki düğüm numaralarıyla aynı düzendedir;
+        farklı uzunluktaki sonekler çakışmaz. O(1); size en fazla SUFFIX_KEY_BITS olabilir.
+        """
+        length = min(size, self.pb_count)
+        if not length:
+            return 1
+        return (1 << length) | (self._suffix_keys[-1] & ((1 << length) - 1))
+
+    def register_window(self, size: int) -> WindowCounters:
+        """
+        'size' boyutlu pencereyi kayan sayaçlara kaydeder; bundan sonra window_counts(size)
+        sayaçlardan okunur. Sınırlı bağlamda pencere, budama başlamadan kaydedilmelidir
+        (geri almada son size+1 P/B sonucuna bakıldığı için max_lookback buna göre artar).
+        """
+        counters = self._window_counters
+        if counters is None:
+            counters = self._window_counters = WindowCounters()
+            counters.length = self.pb_count
+            self._pattern_indexes.append(counters)
+        if size not in counters.p_counts:
+            if len(self.pb) < min(size, self.pb_count):
+                raise ValueError(f"Pencere ({size}) budanmış bağlamdan doldurulamaz")
+            counters.add_window(size, self.pb)
+            if self.max_lookback is not None:
+                self.max_lookback = max(self.max_lookback, size + 1)
+        return counters
+
+    def window_counts(self, size: int) -> Tuple[int, int]:
+        """Son 'size' P/B sonucundaki (P sayısı, B sayısı). Pencere kısa ise mevcut kadarı sayılır."""
+        counters = self._window_counters
+        if counters is not None and size in counters.p_counts:
+            return counters.counts(size)
+        n = len(self.pb)
+        start = max(0, n - size)
+        p_wins = self._p_prefix[n] - self._p_prefix[start]
+        return p_wins, (n - start) - p_wins
+
+    def window_chops(self, size: int) -> int:
+        """Son 'size' P/B sonucu içindeki ardışık değişim (P->B, B->P) sayısı."""
+        n = len(self.pb)
+        start = max(0, n - size)
+        if n - start < 2:
+            return 0
+        return self._change_prefix[n] - self._change_prefix[start + 1]
+
+    # --- Desen (n-gram) sayımları ---
+    def ngram_table(self, n: int) -> NgramTable:
+        """
+        n uzunluklu desenlerin sayım tablosunu döndürür. İlk istekte mevcut P/B
+        görünümünden doldurulur, sonra her append/pop ile artımlı güncellenir.
+        Sınırlı bağlamda tablo, budama başlamadan (ilk gözlemlerde) istenmelidir.
+        """
+        table = self._ngram_tables.get(n)
+        if table is None:
+            table = self._ngram_tables[n] = self._register_pattern_index(NgramTable(n), n)
+        return table
+
+    def context_tree(self, max_order: int) -> ContextTree:
+        """
+        En az max_order dereceli paylaşılan bağlam ağacını döndürür. Daha yüksek
+        bir derece istenirse ağaç o dereceyle yeniden kurulur.
+        """
+        tree = self._context_tree
+        if tree is None or tree.max_order < max_order:
+            if tree is not None:
+                self._pattern_indexes.remove(tree)
+            tree = self._context_tree = self._register_pattern_index(ContextTree(max_order), max_order)
+        return tree
+
+    def _register_pattern_index(self, index, order: int):
+        """Tabloyu/ağacı mevcut P/B görünümünden doldurur ve artımlı güncellemeye kaydeder."""
+        for end in range(1, len(self.pb) + 1):
+            index.observe(self.pb[end - 1:end])
+        if self.max_lookback is not None:
+            # Geri almada son order+1 P/B sonucuna bakılır
+            self.max_lookback = max(self.max_lookback, order + 1)
+        self._pattern_indexes.append(index)
+        return index
+
+    def ngram_counts(self, n: int) -> Tuple[int, int]:
+        """Son n P/B sonucundan oluşan desenden sonra geçmişte gelen (P sayısı, B sayısı). O(1)."""
+        return self.ngram_table(n).current_counts()
+
+
+HistoryLike = Union[List[str], HistoryContext]
+
+
+def as_context(history: HistoryLike) -> HistoryContext:
+    """Tahmincilere verilen geçmişi bağlama çevirir; zaten bağlamsa kopyalamadan döndürür."""
+    if isinstance(history, HistoryContext):
+        return history
+    return HistoryContext(history)
@@ -0,0 +1,94 @@
+# predictors/matrix_bitboard.py
+"""
+Son 25 elin 5x5 matrisinin bit tahtası (bitboard) gösterimi.
+Matris iki 25 bitlik maske olarak tutulur: biri P hücreleri, biri B hücreleri için.
+Hücre (satır, sütun) r * 5 + c numaralı bittir; matris görünümündeki gibi son el
+sağ alt köşede (bit 24) durur. Tie ve boş hücreler iki maskede de yer almaz.
+
+Bitişik blok (4 yönlü komşuluk) sorguları maske kaydırmalarıyla yapılır ve
+sonuçlar maskeye göre önbelleğe alınır; aynı tahta tekrar geldiğinde en büyük
+blok birkaç tamsayı işlemiyle bulunur. Matris yorum kuralları (MatrixRule) da
+maske/popcount testleri olarak yazılır ve count_signs ile tek geçişte uygulanır.
+"""
+from functools import lru_cache
+from typing import Callable, NamedTuple, Sequence, Tuple
+
+MATRIX_ROWS = 5
+MATRIX_COLS = 5
+MATRIX_SIZE = MATRIX_ROWS * MATRIX_COLS
+FULL_MASK = (1 << MATRIX_SIZE) - 1
+
+
+def cell_bit(row: int, col: int) -> int:
+    """(satır, sütun) hücresinin bit maskesi."""
+    return 1 << (row * MATRIX_COLS + col)
+
+
+# Sık kullanılan bölge maskeleri
+ROW_MASKS = tuple(sum(cell_bit(r, c) for c in range(MATRIX_COLS)) for r in range(MATRIX_ROWS))
+COL_MASKS = tuple(sum(cell_bit(r, c) for r in range(MATRIX_ROWS)) for c in range(MATRIX_COLS))
+DIAGONAL_MASK = sum(cell_bit(i, i) for i in range(MATRIX_ROWS))
+ANTI_DIAGONAL_MASK = sum(cell_bit(i, MATRIX_COLS - 1 - i) for i in range(MATRIX_ROWS))
+CENTER_MASK = sum(cell_bit(r, c) for r in range(1, MATRIX_ROWS - 1) for c in range(1, MATRIX_COLS - 1))
+
+# Sola/sağa kaydırmada satır sonundan bir sonraki satıra taşan bitleri atmak için
+_NOT_FIRST_COL = FULL_MASK & ~COL_MASKS[0]
+_NOT_LAST_COL = FULL_MASK & ~COL_MASKS[-1]
+
+
+def board_masks(history: Sequence[str]) -> Tuple[int, int]:
+    """Ham geçmişin son 25 elinden (P maskesi, B maskesi) oluşturur."""
+    history_for_matrix = history[-MATRIX_SIZE:]
+    p_mask = 0; b_mask = 0
+    # Son el bit 24'e, ondan öncekiler sırayla daha düşük bitlere yerleşir
+    bit = 1 << (MATRIX_SIZE - len(history_for_matrix))
+    for result in history_for_matrix:
+        if result == 'P': p_mask |= bit
+        elif result == 'B': b_mask |= bit
+        bit <<= 1
+    return p_mask, b_mask
+
+
+def neighbours(mask: int) -> int:
+    """Maskedeki hücrelerin 4 yönlü komşularının maskesi."""
+    return (((mask << 1) & _NOT_FIRST_COL) | ((mask >> 1) & _NOT_LAST_COL) |
+            ((mask << MATRIX_COLS) & FULL_MASK) | (mask >> MATRIX_COLS))
+
+
+@lru_cache(maxsize=1 << 16)
+def largest_block(mask: int) -> int:
+    """Maskedeki en büyük bitişik (4 yönlü) bloğun hücre sayısı."""
+    largest = 0
+    remaining = mask
+    while remaining:
+        # En düşük hücreden başlayıp bloğu komşu maskeleriyle doldur
+        block = remaining & -remaining
+        while True:
+            grown = (block | neighbours(block)) & mask
+            if grown == block:
+                break
+            block = grown
+        largest = max(largest, block.bit_count())
+        remaining &= ~block
+    return largest
+
+
+class MatrixRule(NamedTuple):
+    """
+    Tahta üzerinde bir yorum kuralı: test(p_mask, b_mask) doğruysa 'side' tarafına
+    'signs' kadar işaret eklenir. Testler maske ve popcount işlemleriyle yazılır.
+    """
+    name: str
+    side: str   # 'P' veya 'B'
+    signs: int
+    test: Callable[[int, int], bool]
+
+
+def count_signs(p_mask: int, b_mask: int, rules: Sequence[MatrixRule]) -> Tuple[int, int]:
+    """Kuralları tahtaya uygular ve (P işaretleri, B işaretleri) toplamını döndürür."""
+    p_signs = 0; b_signs = 0
+    for rule in rules:
+        if rule.test(p_mask, b_mask):
+            if rule.side == 'P': p_signs += rule.signs
+            else: b_signs += rule.signs
+    return p_signs, b_signs
@@ -0,0 +1,100 @@
+# predictors/memoized_predictor.py
+"""
+Tahminci sonuçları için sonek anahtarlı, sınırlı (LRU) önbellek.
+Birçok modelin sonucu sadece son birkaç P/B sonucuna (ve birkaç sayaca) bağlıdır
+ve simülasyonda aynı sonekler sürekli tekrar gelir. Modeller bu küçük durumu
+memo_key() ile bildirir (sonek anahtarı, pencere sayıları, matris maskeleri...);
+MemoizedPredictor aynı anahtar için sonucu yeniden hesaplamadan döndürür.
+Anahtarı None olan modeller (oturum geneline veya rastgeleliğe bağlı olanlar)
+her elde doğrudan çalışır.
+
+Önbellek her sarmalayıcıya özeldir (anahtar, model kimliğiyle birlikte tutulmuş
+olur); isabet/ıska sayaçları kazancı ölçmek için kullanılır.
+"""
+from collections import OrderedDict
+from typing import Hashable, Mapping
+from predictors.history_context import HistoryLike, as_context
+from predictors.base_predictor import BasePredictor, PredictionResult
+
+DEFAULT_MAX_ENTRIES = 4096
+
+
+class MemoizedPredictor(BasePredictor):
+    """
+    Bir modeli sararak sonuçlarını memo_key'e göre önbelleğe alır. Akış durumu
+    (observe / reset) sarılan modelde kalır; sarmalayıcı eklenip çıkarıldığında
+    yeniden oynatma gerekmez. Sarılan modelin diğer öznitelikleri (window_size,
+    set_base_probabilities...) sarmalayıcı üzerinden de erişilebilir.
+    """
+
+    def __init__(self, predictor: BasePredictor, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.predictor = predictor
+        self.max_entries = max(1, max_entries)
+        self.max_lookback = predictor.max_lookback
+        self.inputs = predictor.inputs
+        self.pool_safe = predictor.pool_safe
+        self._cache: 'OrderedDict[Hashable, PredictionResult]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __getattr__(self, name):
+        # Sadece sarmalayıcıda bulunmayan öznitelikler için çağrılır
+        if name == 'predictor':
+            raise AttributeError(name)
+        return getattr(self.predictor, name)
+
+    def _lookup(self, context, compute) -> PredictionResult:
+        key = self.predictor.memo_key(context)
+        if key is None:
+            return compute()
+        cache = self._cache
+        result = cache.get(key)
+        if result is not None:
+            cache.move_to_end(key)
+            self.hits += 1
+            return result
+        self.misses += 1
+        result = cache[key] = compute()
+        if len(cache) > self.max_entries:
+            cache.popitem(last=False) # En uzun süredir kullanılmayan kaydı at
+        return result
+
+    def evaluate(self, history: HistoryLike, *inputs) -> PredictionResult:
+        if inputs:
+            return self.predictor.evaluate(history, *inputs)
+        context = as_context(history)
+        return self._lookup(context, lambda: self.predictor.evaluate(context))
+
+    def evaluate_batch(self, outcomes):
+        return self.predictor.evaluate_batch(outcomes)
+
+    # --- Akış arayüzü (durum sarılan modelde tutulur) ---
+    def observe(self, result: str):
+        self.predictor.observe(result)
+
+    def current(self, *inputs) -> PredictionResult:
+        if inputs:
+            return self.predictor.current(*inputs)
+        return self._lookup(self.predictor._stream_context(), self.predictor.current)
+
+    def current_with(self, results: Mapping[str, PredictionResult]) -> PredictionResult:
+        if self.inputs:
+            return self.predictor.current_with(results)
+        return self.current()
+
+    def reset(self):
+        self.predictor.reset()
+
+    # --- İstatistikler ---
+    @property
+    def hit_rate(self) -> float:
+        """Önbellek isabet oranı (%); anahtarlı çağrı yoksa 0.0."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups * 100 if lookups else 0.0
+
+    def reset_stats(self):
+        self.hits = self.misses = 0
+
+    def clear_cache(self):
+        self._cache.clear()
+        self.reset_stats()
@@ -1,7 +1,9 @@
 import random
 import math
+from predictors.history_context import HistoryLike, as_context
+from predictors.base_predictor import BasePredictor, PredictionResult
 
-class MultiversePredictor:
+class MultiversePredictor(BasePredictor):
     """
     Paralel Evren Bahisçisi (Basitleştirilmiş):
     Baccarat'ın temel P/B olasılıklarını alır, geçmişteki sapmalara göre
@@ -16,62 +18,53 @@ class MultiversePredictor:
     def __init__(self, deviation_window=20, deviation_influence=0.15, quantum_leap_chance=0.05):
         # Olasılıkları ayarlamak için bakılacak geçmiş penceresi
         self.deviation_window = max(5, deviation_window)
+        self.max_lookback = self.deviation_window # Akış bağlamı sadece sapma penceresini saklar
+        self.windows = (self.deviation_window,)
         # Geçmişteki sapmanın temel olasılıkları ne kadar etkileyeceği (0 ile 1 arası)
         # 0.15 = Sapma farkının %15'i kadar olasılık kaydırılır.
         self.deviation_influence = max(0.0, min(0.5, deviation_influence))
         # Bazen düşük olasılıklı tarafı seçme şansı (Kuantum Sıçraması!)
         self.quantum_leap_chance = max(0.0, min(0.2, quantum_leap_chance))
 
-    def predict(self, history: list) -> str:
+    def set_base_probabilities(self, player_perc: float, banker_perc: float):
+        """Sabit 8 deste oranları yerine canlı (kalan ayakkabıdan hesaplanan) P/B yüzdelerini kullanır."""
+        self.BASE_P_PROB_NO_TIE = player_perc
+        self.BASE_B_PROB_NO_TIE = banker_perc
+
+    def evaluate(self, history: HistoryLike) -> PredictionResult:
         """
         Ayarlanmış olasılıklara göre P veya B tahmin eder.
+        Güven iki ayarlanmış olasılık arasındaki farka göre belirlenir; olasılık,
+        tahmin edilen tarafın ayarlanmış olasılığıdır (Kuantum Sıçraması olasılığı
+        etkilemez, sadece seçimi değiştirir).
         """
-        relevant_history = [res for res in history if res in ('P', 'B')]
-        window = relevant_history[-self.deviation_window:]
-        window_len = len(window)
-
-        # Mevcut penceredeki P/B oranları
-        actual_p_prob = 0.0
-        if window_len > 0:
-            p_wins = window.count('P')
-            actual_p_prob = (p_wins / window_len) * 100
-        else:
-            # Yeterli geçmiş yoksa, temel olasılığa daha yakın olalım
-            actual_p_prob = self.BASE_P_PROB_NO_TIE
-
-        # Sapmayı hesapla (P'nin teorikten ne kadar saptığı)
-        deviation = actual_p_prob - self.BASE_P_PROB_NO_TIE
-
-        # Temel olasılıkları sapmaya göre ayarla
-        # Eğer P fazla geldiyse (deviation > 0), B'nin olasılığını artır, P'ninkini azalt.
-        # Eğer B fazla geldiyse (deviation < 0), P'nin olasılığını artır, B'ninkini azalt.
-        adjustment = deviation * self.deviation_influence
-        adjusted_p_prob = self.BASE_P_PROB_NO_TIE - adjustment
-        adjusted_b_prob = self.BASE_B_PROB_NO_TIE + adjustment
-
-        # Olasılıkları 0-100 arasında tut (çok küçük ihtimal ama garanti olsun)
-        adjusted_p_prob = max(0.1, min(99.9, adjusted_p_prob))
-        adjusted_b_prob = max(0.1, min(99.9, adjusted_b_prob))
+        # Geçmişteki sapmaya göre ayarlanmış P ve B olasılıkları
+        adjusted_p_prob, adjusted_b_prob = self._get_adjusted_probs(history)
 
         # --- Kuantum Sıçraması! ---
         if random.random() < self.quantum_leap_chance:
              # Düşük olasılıklı olanı seçme şansı
-             # print("Quantum Leap!") # Debug
-             return 'P' if adjusted_p_prob < adjusted_b_prob else 'B'
+             prediction = 'P' if adjusted_p_prob < adjusted_b_prob else 'B'
         # --- Normal Tahmin ---
         else:
              # Daha yüksek olasılıklı olanı seç
-             return 'P' if adjusted_p_prob >= adjusted_b_prob else 'B'
+             prediction = 'P' if adjusted_p_prob >= adjusted_b_prob else 'B'
+
+        # Fark ne kadar büyükse, o kadar güvenli.
+        # Fark 0 (%50/%50) ise min güven, fark ~100 ise max güven.
+        diff = abs(adjusted_p_prob - adjusted_b_prob)
+        confidence = 20.0 + (diff * 0.7) # %20 taban + farkın %70'i kadar ekle
+        confidence = max(20.0, min(90.0, confidence)) # %20-90 arası
 
+        probability = adjusted_p_prob if prediction == 'P' else adjusted_b_prob
+        return PredictionResult(prediction, confidence, probability)
 
-    def _get_adjusted_probs(self, history: list) -> tuple[float, float]:
+    def _get_adjusted_probs(self, history: HistoryLike) -> tuple[float, float]:
         """Yardımcı fonksiyon: Ayarlanmış P ve B olasılıklarını hesaplar."""
-        relevant_history = [res for res in history if res in ('P', 'B')]
-        window = relevant_history[-self.deviation_window:]
-        window_len = len(window)
+        p_wins, b_wins = as_context(history).window_counts(self.deviation_window)
+        window_len = p_wins + b_wins
         actual_p_prob = self.BASE_P_PROB_NO_TIE # Başlangıç değeri
         if window_len > 0:
-            p_wins = window.count('P')
             actual_p_prob = (p_wins / window_len) * 100
 
         deviation = actual_p_prob - self.BASE_P_PROB_NO_TIE
@@ -81,34 +74,3 @@ class MultiversePredictor:
         adjusted_p_prob = max(0.1, min(99.9, adjusted_p_prob))
         adjusted_b_prob = max(0.1, min(99.9, adjusted_b_prob))
         return adjusted_p_prob, adjusted_b_prob
-
-
-    def get_confidence(self, history: list) -> float:
-        """Tahminin güven oranını döndürür."""
-        # Güven, iki ayarlanmış olasılık arasındaki farka göre belirlenir.
-        adj_p, adj_b = self._get_adjusted_probs(history)
-        diff = abs(adj_p - adj_b)
-
-        # Fark ne kadar büyükse, o kadar güvenli.
-        # Fark 0 (%50/%50) ise min güven, fark ~100 ise max güven.
-        confidence = 20.0 + (diff * 0.7) # %20 taban + farkın %70'i kadar ekle
-
-        return max(20.0, min(90.0, confidence)) # %20-90 arası
-
-
-    def get_probability(self, history: list) -> float:
-        """Tahminin gerçekleşme olasılığını döndürür."""
-        # Tahmin edilen tarafın ayarlanmış olasılığını döndürür.
-        prediction = self.predict(history) # Predict'i tekrar çağırmak ideal değil ama basitlik için
-                                         # Not: Quantum leap olasılığı etkilemez, sadece seçimi değiştirir.
-        if prediction == "N/A": # Bu modelde N/A dönmez ama kontrol edelim
-            return 0.0
-
-        adj_p, adj_b = self._get_adjusted_probs(history)
-
-        if prediction == 'P':
-            return adj_p
-        elif prediction == 'B':
-            return adj_b
-        else:
-             return 0.0
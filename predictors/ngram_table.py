@@ -0,0 +1,70 @@
+# predictors/ngram_table.py
+"""
+Sabit uzunluklu (n) P/B desenlerinden sonra gelen sonuçların sayım tablosu.
+Her desen küçük bir tamsayıya paketlenir (P=1, B=0; en yeni el en düşük bit),
+böylece tablo 2^n yuvadan oluşur ve her yuva desenden sonra gelen P ve B
+sayılarını tutar. HistoryContext tabloyu her elde artımlı günceller; son desenin
+sayılarına erişim O(1)'dir.
+"""
+from typing import List, Sequence, Tuple
+
+
+def pack_pattern(pattern: Sequence[str]) -> int:
+    """P/B dizisini tamsayı anahtara çevirir (P=1, B=0; son eleman en düşük bit)."""
+    key = 0
+    for result in pattern:
+        key = (key << 1) | (result == 'P')
+    return key
+
+
+class NgramTable:
+    """
+    n uzunluklu desenler için (sonraki P sayısı, sonraki B sayısı) tablosu.
+    observe / forget, P/B görünümüne yeni eklenen ya da geri alınmak üzere olan
+    son eleman için çağrılır; desen, o elemandan önceki n sonuçtur.
+    Tablo ayrıca son n sonucun anahtarını kayan olarak tutar (current_counts için).
+    """
+
+    def __init__(self, n: int):
+        self.n = n
+        self.mask = (1 << n) - 1
+        self.p_next: List[int] = [0] * (1 << n)
+        self.b_next: List[int] = [0] * (1 << n)
+        self.key = 0     # Son n P/B sonucunun paketlenmiş hali
+        self.length = 0  # Gözlenen P/B sonucu sayısı
+
+    def observe(self, pb: Sequence[str]):
+        """pb'nin son elemanını, kendinden önceki n-gram'ın ardılı olarak sayar. O(1)."""
+        is_p = pb[-1] == 'P'
+        if self.length >= self.n:
+            if is_p: self.p_next[self.key] += 1
+            else: self.b_next[self.key] += 1
+        self.key = ((self.key << 1) | is_p) & self.mask
+        self.length += 1
+
+    def forget(self, pb: Sequence[str]):
+        """pb'nin son elemanının sayımını geri alır (eleman çıkarılmadan önce çağrılır). O(n)."""
+        n = self.n
+        self.length -= 1
+        # Anahtar, son elemandan önceki n sonuca geri kurulur
+        self.key = pack_pattern(pb[-n - 1:-1])
+        if self.length >= n:
+            if pb[-1] == 'P': self.p_next[self.key] -= 1
+            else: self.b_next[self.key] -= 1
+
+    def clear(self):
+        self.p_next = [0] * (1 << self.n)
+        self.b_next = [0] * (1 << self.n)
+        self.key = 0
+        self.length = 0
+
+    def counts(self, pattern: Sequence[str]) -> Tuple[int, int]:
+        """Verilen n uzunluklu desenden sonra gelen (P sayısı, B sayısı)."""
+        key = pack_pattern(pattern)
+        return self.p_next[key], self.b_next[key]
+
+    def current_counts(self) -> Tuple[int, int]:
+        """Son n sonuçtan oluşan desenden sonra gelen (P sayısı, B sayısı). O(1)."""
+        if self.length < self.n:
+            return 0, 0
+        return self.p_next[self.key], self.b_next[self.key]
@@ -0,0 +1,116 @@
+# predictors/prediction_executor.py
+"""
+Temel modelleri bir iş parçacığı havuzunda, el başına bir süre sınırıyla çalıştırır.
+Süre sınırında bitmeyen ya da hata veren modeller o el için N/A sayılır (sıralı
+çalıştırmadaki 'except Exception' yolu gibi); meta modeller girdileri toplandıktan
+sonra çağıranın iş parçacığında çalışır.
+
+Her havuz modelinin akış durumu sadece kendi görevinde değiştirilir: yeni sonuçlar
+(ve geri alma/temizlemedeki sıfırlama + yeniden oynatma) modelin gelen kutusuna
+eklenir ve görev, tahminden önce kutuyu boşaltır. Önceki eldeki görevi hâlâ süren
+bir modele yeni görev verilmez; gelen kutusu bir sonraki görevde işlenir. Böylece
+yavaş bir model arayüzü (tıklama işleyicisini, simülasyon zamanlayıcısını) en fazla
+süre sınırı kadar bekletir.
+"""
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from time import perf_counter
+from typing import Deque, Dict, Optional, Sequence, Tuple
+from predictors.base_predictor import PredictionResult
+from predictors.prediction_graph import PredictionGraph, ErrorHandler, NA_RESULT, feed_predictor
+
+# Gelen kutusunda sıfırlama işareti (sonuçlar 'P', 'B' veya 'T' olarak eklenir)
+_RESET = None
+
+
+class PredictionExecutor:
+    """
+    PredictionGraph'ın temel modellerini ThreadPoolExecutor üzerinde çalıştırır.
+    Zamanında bitmeyen modellerin sayısı late_counts'ta tutulur; süreler grafiğin
+    last_timings / total_timings sözlüklerine yazılır (geç kalanlar için None).
+    """
+
+    def __init__(self, graph: PredictionGraph, max_workers: int = 4, deadline_ms: float = 50.0):
+        self.graph = graph
+        self.deadline = max(0.0, deadline_ms) / 1000.0
+        self.pool = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="predictor")
+        self.pooled = [name for name in graph.base_names if graph.predictors[name].pool_safe]
+        self.inline = [name for name in graph.base_names if name not in self.pooled]
+        self._inboxes: Dict[str, Deque[Optional[str]]] = {name: deque() for name in self.pooled}
+        self._running: Dict[str, Future] = {}
+        self.late_counts: Dict[str, int] = {name: 0 for name in self.pooled}
+
+    def reset_late_counts(self):
+        self.late_counts = {name: 0 for name in self.pooled}
+
+    def feed(self, history: Sequence[str], appended: bool):
+        """Havuz modellerinin değişikliklerini gelen kutularına ekler, diğerlerini hemen besler."""
+        for name, predictor in self.graph.predictors.items():
+            inbox = self._inboxes.get(name)
+            if inbox is None:
+                feed_predictor(predictor, history, appended)
+            elif appended:
+                inbox.append(history[-1])
+            else:
+                inbox.append(_RESET)
+                inbox.extend(history)
+
+    def _task(self, name: str) -> Tuple[PredictionResult, float]:
+        """Havuzda çalışır: gelen kutusunu boşaltır ve modelin tahminini hesaplar."""
+        start = perf_counter()
+        predictor = self.graph.predictors[name]
+        inbox = self._inboxes[name]
+        while inbox:
+            event = inbox.popleft()
+            if event is _RESET: predictor.reset()
+            else: predictor.observe(event)
+        return self.graph.run_model(name, {}), perf_counter() - start
+
+    def run(self, on_error: Optional[ErrorHandler] = None) -> Dict[str, PredictionResult]:
+        """Tüm modelleri çalıştırır; havuz modelleri için en fazla 'deadline' kadar bekler."""
+        graph = self.graph
+        deadline = perf_counter() + self.deadline
+        graph.last_timings = {}
+        futures: Dict[str, Future] = {}
+        for name in self.pooled:
+            running = self._running.get(name)
+            if running is not None and not running.done():
+                continue # Önceki eldeki görevi sürüyor
+            futures[name] = self._running[name] = self.pool.submit(self._task, name)
+
+        results: Dict[str, PredictionResult] = {}
+        # Havuza verilemeyen temel modeller bu arada burada çalışır
+        graph.run_level(self.inline, results, on_error)
+        if futures:
+            wait(futures.values(), timeout=max(0.0, deadline - perf_counter()))
+
+        for name in self.pooled:
+            future = futures.get(name)
+            if future is None or not future.done():
+                results[name] = NA_RESULT
+                graph.last_timings[name] = None
+                self.late_counts[name] += 1
+                continue
+            try:
+                results[name], seconds = future.result()
+                graph.record_timing(name, seconds)
+            except Exception as e:
+                if on_error: on_error(name, e)
+                results[name] = NA_RESULT
+
+        for level in graph.levels[1:]:
+            graph.run_level(level, results, on_error)
+        return results
+
+    def close(self):
+        """
+        Havuzu kapatır: süren görevleri bekler ve gelen kutularında kalan sonuçları
+        bu iş parçacığında işler; modeller sıralı çalıştırmaya hazır halde kalır.
+        """
+        self.pool.shutdown(wait=True)
+        for name, inbox in self._inboxes.items():
+            predictor = self.graph.predictors[name]
+            while inbox:
+                event = inbox.popleft()
+                if event is _RESET: predictor.reset()
+                else: predictor.observe(event)
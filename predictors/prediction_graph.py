@@ -0,0 +1,118 @@
+# predictors/prediction_graph.py
+"""
+Tahmincilerin bağımlılık grafiği ve her el için çalıştırma sırası.
+Her model girdilerini 'inputs' ile bildirir: boşsa sadece geçmişe bakan temel
+bir modeldir; doluysa adı verilen modellerin (veya ALL_BASE_MODELS ile tüm temel
+modellerin) bu eldeki sonuçlarını kullanan bir meta modeldir. Grafik modelleri
+topolojik katmanlara ayırır: ilk katman birbirinden bağımsız temel modellerdir
+ve toplu olarak çalıştırılır; meta modeller girdileri hazır olduğunda, sadece
+kendi girdilerini içeren bir görünümle çalışır. Her modelin çalışma süresi
+ölçülür (last_timings / total_timings).
+"""
+from time import perf_counter
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+from predictors.base_predictor import BasePredictor, PredictionResult, ALL_BASE_MODELS
+
+# Tahmin yapmayan veya hata veren modeller için saklanan sonuç
+NA_RESULT = PredictionResult('N/A', 50.0, 50.0)
+
+ErrorHandler = Callable[[str, Exception], None]
+
+
+def feed_predictor(predictor: BasePredictor, history: Sequence[str], appended: bool):
+    """
+    Modelin akış durumuna geçmişteki değişikliği iletir: olağan durumda sadece yeni
+    sonuç verilir; geri alma/temizleme gibi diğer değişikliklerde model sıfırlanıp
+    geçmiş yeniden oynatılır.
+    """
+    if appended:
+        predictor.observe(history[-1])
+    else:
+        predictor.reset()
+        for result in history:
+            predictor.observe(result)
+
+
+class PredictionGraph:
+    """
+    Modelleri bağımlılıklarına göre sıralar ve her elde bir kez çalıştırır.
+    Sonuçlar PredictionResult olarak tutulur; N/A veya hata durumunda NA_RESULT saklanır.
+    """
+
+    def __init__(self, predictors: Dict[str, BasePredictor]):
+        self.predictors = predictors
+        self.base_names: List[str] = [name for name, predictor in predictors.items() if not predictor.inputs]
+        self.meta_names = {name for name in predictors if name not in self.base_names}
+        # Her meta model için girdi modellerinin adları (ALL_BASE_MODELS çözülmüş halde)
+        self.dependencies: Dict[str, Tuple[str, ...]] = {}
+        for name in self.meta_names:
+            dependencies = []
+            for input_name in predictors[name].inputs:
+                if input_name == ALL_BASE_MODELS:
+                    dependencies.extend(self.base_names)
+                elif input_name in predictors:
+                    dependencies.append(input_name)
+                else:
+                    raise ValueError(f"{name} modelinin girdisi bulunamadı: {input_name}")
+            self.dependencies[name] = tuple(dict.fromkeys(dependencies))
+        self.levels: List[List[str]] = self._topological_levels()
+        self.last_timings: Dict[str, Optional[float]] = {}  # Son eldeki süreler (ms; zamanında bitmeyenler None)
+        self.total_timings: Dict[str, float] = {name: 0.0 for name in predictors}  # Toplam süreler (ms)
+
+    def _topological_levels(self) -> List[List[str]]:
+        """Modelleri, her katman sadece önceki katmanlara bağlı olacak şekilde gruplar."""
+        levels = [list(self.base_names)]
+        done = set(self.base_names)
+        pending = [name for name in self.predictors if name in self.meta_names]
+        while pending:
+            level = [name for name in pending if all(dep in done for dep in self.dependencies[name])]
+            if not level:
+                raise ValueError(f"Model girdilerinde döngü var: {', '.join(pending)}")
+            levels.append(level)
+            done.update(level)
+            pending = [name for name in pending if name not in done]
+        return levels
+
+    def run_model(self, name: str, results: Mapping[str, PredictionResult]) -> PredictionResult:
+        """Tek bir modeli akış durumundan çalıştırır; meta modellere sadece girdilerinin görünümü verilir."""
+        predictor = self.predictors[name]
+        if name in self.meta_names:
+            result = predictor.current_with({dep: results[dep] for dep in self.dependencies[name]})
+        else:
+            result = predictor.current()
+        # N/A sonuçlar varsayılan %50 güven/olasılıkla saklanır
+        return result if result.prediction != 'N/A' else NA_RESULT
+
+    def reset_timings(self):
+        self.last_timings = {}
+        self.total_timings = {name: 0.0 for name in self.predictors}
+
+    def record_timing(self, name: str, seconds: float):
+        elapsed_ms = seconds * 1000.0
+        self.last_timings[name] = elapsed_ms
+        self.total_timings[name] += elapsed_ms
+
+    def feed(self, history: Sequence[str], appended: bool):
+        """Tüm modellere geçmişteki değişikliği iletir (bkz. feed_predictor)."""
+        for predictor in self.predictors.values():
+            feed_predictor(predictor, history, appended)
+
+    def run_level(self, names: Sequence[str], results: Dict[str, PredictionResult],
+                  on_error: Optional[ErrorHandler] = None):
+        """Verilen modelleri bu iş parçacığında sırayla çalıştırır; hata veren model N/A sayılır."""
+        for name in names:
+            start = perf_counter()
+            try:
+                results[name] = self.run_model(name, results)
+            except Exception as e:
+                if on_error: on_error(name, e)
+                results[name] = NA_RESULT
+            self.record_timing(name, perf_counter() - start)
+
+    def run(self, on_error: Optional[ErrorHandler] = None) -> Dict[str, PredictionResult]:
+        """Tüm modelleri katman katman çalıştırır."""
+        results: Dict[str, PredictionResult] = {}
+        self.last_timings = {}
+        for level in self.levels:
+            self.run_level(level, results, on_error)
+        return results
@@ -1,15 +1,27 @@
-class RhythmDisruptorPredictor:
+from predictors.history_context import HistoryLike, as_context
+from predictors.base_predictor import BasePredictor, PredictionResult, NO_PREDICTION
+
+class RhythmDisruptorPredictor(BasePredictor):
     """
     Kısa (3'lü veya 4'lü) PBPB... gibi almaşık (alternating)
     ritimleri tespit edip, ritmin devamını kırmayı hedefler.
     """
+    max_lookback = 4 # En fazla son 4 ele bakar
+    suffix_lookback = 4
+
+    def evaluate(self, history: HistoryLike) -> PredictionResult:
+        """Sonucu derlenmiş sonek tablosundan tek indekslemeyle alır (mantık: evaluate_suffix)."""
+        return self.lookup(as_context(history))
 
-    def predict(self, history: list) -> str:
+    def evaluate_suffix(self, history: HistoryLike) -> PredictionResult:
         """
         Son 3 veya 4 ele bakarak almaşık bir ritim varsa,
         bu ritmi bozacak tahmini yapar. Yoksa 'N/A' döner.
+        Model oldukça spesifik durumlarda tetiklendiği için, tetiklendiğinde
+        nispeten yüksek bir güven verir; 4'lü ritmi bozmak 3'lüden daha güvenli sayılır.
+        Ritmi bozmanın olasılığı %50'den biraz düşük tutulur.
         """
-        relevant_history = [res for res in history if res in ('P', 'B')]
+        relevant_history = as_context(history).pb
         history_len = len(relevant_history)
 
         # Önce 4'lü ritmi kontrol et (daha güçlü bir işaret olabilir)
@@ -21,8 +33,7 @@ class RhythmDisruptorPredictor:
                     last_4[1] == last_4[3] and # 2. ve 4. aynı
                     last_4[0] == last_4[2]):   # 1. ve 3. aynı
                 # Ritmin devamı 4. eleman ('B' gibi) olurdu, biz tam tersini ('A' gibi, yani 3. elemanı) tahmin edelim.
-                # print("Disrupting 4-beat rhythm!") # Debug
-                return last_4[2] # Ritmi bozmak için sondan bir öncekini tekrar et
+                return PredictionResult(last_4[2], 70.0, 48.0) # Ritmi bozmak için sondan bir öncekini tekrar et
 
         # 4'lü ritim yoksa veya yeterli el yoksa 3'lü ritmi kontrol et
         if history_len >= 3:
@@ -31,50 +42,7 @@ class RhythmDisruptorPredictor:
              # A!=B ve B!=A olmalı (zaten öyle) ve A==A olmalı
             if last_3[0] != last_3[1] and last_3[0] == last_3[2]:
                 # Ritmin devamı (Zigzag gibi) B olurdu, biz tam tersini (A'yı) tahmin edelim.
-                # print("Disrupting 3-beat rhythm!") # Debug
-                return last_3[2] # Ritmi bozmak için sonuncuyu tekrar et
+                return PredictionResult(last_3[2], 60.0, 45.0) # Ritmi bozmak için sonuncuyu tekrar et
 
         # Belirgin bir 3'lü veya 4'lü almaşık ritim bulunamadı
-        return "N/A"
-
-
-    def get_confidence(self, history: list) -> float:
-        """Tahminin güven oranını döndürür."""
-        # Bu model oldukça spesifik durumlarda tetiklendiği için,
-        # tetiklendiğinde nispeten daha yüksek bir güven verelim.
-        prediction = self.predict(history)
-        if prediction == "N/A":
-            return 0.0
-        else:
-            # Belki 4'lü ritmi bozmak 3'lüden daha güvenlidir?
-             relevant_history = [res for res in history if res in ('P', 'B')]
-             if len(relevant_history) >= 4:
-                 last_4 = relevant_history[-4:]
-                 if (last_4[0] != last_4[1] and last_4[1] == last_4[3] and last_4[0] == last_4[2]):
-                      return 70.0 # 4'lü ritim kırılması
-             if len(relevant_history) >= 3:
-                  last_3 = relevant_history[-3:]
-                  if last_3[0] != last_3[1] and last_3[0] == last_3[2]:
-                       return 60.0 # 3'lü ritim kırılması
-             # Eğer predict N/A değilse buraya düşmemeli ama yedek
-             return 50.0
-
-
-    def get_probability(self, history: list) -> float:
-        """Tahminin gerçekleşme olasılığını döndürür."""
-        # Ritmi bozmak ne kadar olası? %50'den biraz daha düşük tutabiliriz.
-        prediction = self.predict(history)
-        if prediction == "N/A":
-            return 0.0
-        else:
-            # Belki 4'lü ritmin kırılması 3'lüden biraz daha olasıdır?
-            relevant_history = [res for res in history if res in ('P', 'B')]
-            if len(relevant_history) >= 4:
-                last_4 = relevant_history[-4:]
-                if (last_4[0] != last_4[1] and last_4[1] == last_4[3] and last_4[0] == last_4[2]):
-                     return 48.0
-            if len(relevant_history) >= 3:
-                 last_3 = relevant_history[-3:]
-                 if last_3[0] != last_3[1] and last_3[0] == last_3[2]:
-                      return 45.0
-            return 40.0 # Yedek
+        return NO_PREDICTION
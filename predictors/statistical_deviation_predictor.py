@@ -1,6 +1,8 @@
 import math
+from predictors.history_context import HistoryLike, as_context
+from predictors.base_predictor import BasePredictor, PredictionResult, NO_PREDICTION
 
-class StatisticalDeviationPredictor:
+class StatisticalDeviationPredictor(BasePredictor):
     """
     Son N eldeki P/B kazanma oranlarının teorik olasılıklardan
     sapmasına bakarak 'ortalamaya dönüş' prensibiyle tahmin yapar.
@@ -12,29 +14,37 @@ class StatisticalDeviationPredictor:
     def __init__(self, window_size=30, deviation_threshold=4.0, min_hands=15):
         # İstatistikleri hesaplamak için bakılacak el sayısı
         self.window_size = max(10, window_size)
+        self.max_lookback = self.window_size # Akış bağlamı sadece pencereyi saklar
+        self.windows = (self.window_size,)
         # Tahmin yapmak için gereken minimum sapma (yüzde puanı)
         self.deviation_threshold = max(1.0, deviation_threshold)
         # Tahmin yapmak için pencerede gereken minimum el sayısı
         self.min_hands_in_window = max(5, min_hands)
 
-    def predict(self, history: list) -> str:
+    def set_base_probabilities(self, player_perc: float, banker_perc: float):
+        """
+        Sabit 8 deste teorik oranları yerine canlı (kalan ayakkabıdan hesaplanan,
+        Tie'lar hariç) P/B yüzdelerini kullanır. Sadece bu örneği etkiler.
+        """
+        self.THEO_PLAYER_PROB = player_perc
+        self.THEO_BANKER_PROB = banker_perc
+
+    def memo_key(self, context):
+        # Sonuç pencere sayılarına ve (canlı olabilen) teorik oranlara bağlıdır
+        return context.window_counts(self.window_size), self.THEO_PLAYER_PROB, self.THEO_BANKER_PROB
+
+    def evaluate(self, history: HistoryLike) -> PredictionResult:
         """
         Verilen geçmişe göre bir sonraki hamleyi tahmin eder.
         Sapma yeterince büyükse, az performans gösteren tarafı tahmin eder.
         """
-        relevant_history = [res for res in history if res in ('P', 'B')]
-
-        # Penceredeki son ellere bak
-        window = relevant_history[-self.window_size:]
-        window_len = len(window)
+        # Penceredeki son ellerin P/B sayıları
+        p_wins, b_wins = as_context(history).window_counts(self.window_size)
+        window_len = p_wins + b_wins
 
         # Tahmin için yeterli el var mı?
         if window_len < self.min_hands_in_window:
-            return "N/A"
-
-        # Penceredeki P/B sayılarını hesapla
-        p_wins = window.count('P')
-        b_wins = window.count('B')
+            return NO_PREDICTION
 
         # Gerçek yüzdeleri hesapla
         actual_p_perc = (p_wins / window_len) * 100
@@ -44,60 +54,48 @@ class StatisticalDeviationPredictor:
         p_deviation = actual_p_perc - self.THEO_PLAYER_PROB
         b_deviation = actual_b_perc - self.THEO_BANKER_PROB
 
-        # Hangi tarafın fazla saptığına (pozitif yönde) bak
+        # Hangi tarafın fazla saptığına (pozitif yönde) bak.
+        # Güven, tahmin edilen tarafın karşısındaki sapmanın büyüklüğüne göre artar:
+        # Player ne kadar fazla saptıysa o kadar güvenli B tahmini (ve tersi).
+        # Olasılık olarak basitçe tahmin edilen tarafın teorik olasılığı döndürülür.
         if p_deviation >= self.deviation_threshold:
             # Player fazla kazanmış, Banker'ın gelmesini bekle (Ortalamaya dönüş)
-            return 'B'
+            return PredictionResult('B', self._confidence(p_deviation), self.THEO_BANKER_PROB)
         elif b_deviation >= self.deviation_threshold:
             # Banker fazla kazanmış, Player'ın gelmesini bekle (Ortalamaya dönüş)
-            return 'P'
+            return PredictionResult('P', self._confidence(b_deviation), self.THEO_PLAYER_PROB)
         else:
             # Belirgin bir sapma yok
-            return "N/A"
-
-    def get_confidence(self, history: list) -> float:
-        """Tahminin güven oranını döndürür."""
-        prediction = self.predict(history)
-        if prediction == "N/A":
-            return 0.0
-
-        relevant_history = [res for res in history if res in ('P', 'B')]
-        window = relevant_history[-self.window_size:]
-        window_len = len(window)
-        if window_len < self.min_hands_in_window: return 0.0
-
-        p_wins = window.count('P'); b_wins = window.count('B')
-        actual_p_perc = (p_wins / window_len) * 100
-        actual_b_perc = (b_wins / window_len) * 100
-        p_deviation = actual_p_perc - self.THEO_PLAYER_PROB
-        b_deviation = actual_b_perc - self.THEO_BANKER_PROB
-
-        # Güven, sapmanın büyüklüğüne göre artsın
-        # Eğer 'B' tahmin ediliyorsa p_deviation'a, 'P' tahmin ediliyorsa b_deviation'a bak
-        deviation_magnitude = 0
-        if prediction == 'B':
-            deviation_magnitude = p_deviation # Player ne kadar fazla saptıysa o kadar güvenli B tahmini
-        elif prediction == 'P':
-            deviation_magnitude = b_deviation # Banker ne kadar fazla saptıysa o kadar güvenli P tahmini
+            return NO_PREDICTION
 
-        # Sapmayı güven skoruna dönüştür (örnek formül)
-        # Threshold'dan sonra her %1 sapma için güveni artıralım
+    def _confidence(self, deviation_magnitude: float) -> float:
+        """Sapmayı güven skoruna dönüştürür: threshold'dan sonra her %1 sapma için güveni artırır."""
         base_confidence = 40.0 # Minimum güven
         confidence_increase = max(0, deviation_magnitude - self.deviation_threshold) * 5.0 # Her % puan için +5
         confidence = base_confidence + confidence_increase
 
         return max(30.0, min(90.0, confidence)) # Güveni %30-90 arasında tut
 
-    def get_probability(self, history: list) -> float:
-        """Tahminin gerçekleşme olasılığını döndürür."""
-        prediction = self.predict(history)
-        if prediction == "N/A":
-            return 0.0 # veya 50.0?
-
-        # Basitçe, tahmin edilen tarafın teorik olasılığını döndürelim
-        if prediction == 'P':
-            return self.THEO_PLAYER_PROB
-        elif prediction == 'B':
-            return self.THEO_BANKER_PROB
-        else:
-            return 0.0 # N/A durumu
+    def evaluate_batch(self, outcomes):
+        """
+        Toplu değerlendirme: (simülasyon x el) int8 sonuç dizisinin her konumu için
+        tahmin, güven ve olasılık dizilerini tek vektörel geçişte döndürür (bkz. batch_features).
+        """
+        import numpy as np
+        from predictors.batch_features import as_batch_features, batch_result
+        from simulation.baccarat_tables import OUTCOME_PLAYER, OUTCOME_BANKER
+        features = as_batch_features(outcomes)
+        p_wins, b_wins = features.window_counts(self.window_size)
+        window_len = p_wins + b_wins
+        with np.errstate(divide='ignore', invalid='ignore'):
+            p_deviation = (p_wins / window_len) * 100 - self.THEO_PLAYER_PROB
+            b_deviation = (b_wins / window_len) * 100 - self.THEO_BANKER_PROB
+        # Player fazla saptıysa B, değilse ve Banker fazla saptıysa P (ortalamaya dönüş)
+        p_over = p_deviation >= self.deviation_threshold
+        b_over = ~p_over & (b_deviation >= self.deviation_threshold)
+        active = (window_len >= self.min_hands_in_window) & (p_over | b_over)
+        deviation = np.where(p_over, p_deviation, b_deviation)
+        confidence = np.clip(40.0 + np.maximum(0, deviation - self.deviation_threshold) * 5.0, 30.0, 90.0)
+        prediction = np.where(p_over, OUTCOME_BANKER, OUTCOME_PLAYER)
+        probability = np.where(p_over, self.THEO_BANKER_PROB, self.THEO_PLAYER_PROB)
+        return batch_result(active, prediction, confidence, probability)
@@ -1,74 +1,63 @@
-class StreakBreakerPredictor:
+from predictors.history_context import HistoryLike, as_context
+from predictors.base_predictor import BasePredictor, PredictionResult, NO_PREDICTION
+
+class StreakBreakerPredictor(BasePredictor):
     """
     Belirli bir uzunluktaki (streak_length) P veya B serisini algıladığında,
     serinin KIRILACAĞINI (yani tersini) tahmin eden model.
     """
+    max_lookback = 1 # Seri uzunluğu bağlamdan gelir; son el yeterli
+
     def __init__(self, streak_length=3):
         # Kırmayı düşünmek için gereken minimum seri uzunluğu
         self.streak_length = max(2, streak_length) # En az 2 olmalı
+        # 5 fazla elden sonra güven ve olasılık tavana ulaşır; daha uzun seriler aynı sonucu verir
+        self.suffix_lookback = self.streak_length + 5
+
+    def evaluate(self, history: HistoryLike) -> PredictionResult:
+        """Sonucu derlenmiş sonek tablosundan tek indekslemeyle alır (mantık: evaluate_suffix)."""
+        return self.lookup(as_context(history))
 
-    def predict(self, history: list) -> str:
+    def evaluate_suffix(self, history: HistoryLike) -> PredictionResult:
         """
         Verilen geçmişe göre bir sonraki hamleyi tahmin eder.
         Seri yeterince uzunsa tersini, değilse 'N/A' döndürür.
         """
-        relevant_history = [res for res in history if res in ('P', 'B')]
-
-        if len(relevant_history) < self.streak_length:
-            return "N/A" # Seri kırılması tahmini için yeterli veri yok
-
-        # Son 'streak_length' kadar elemana bak
-        last_streak_elements = relevant_history[-self.streak_length:]
+        context = as_context(history)
 
-        # Hepsi aynı mı diye kontrol et
-        first_element = last_streak_elements[0]
-        is_streak = all(elem == first_element for elem in last_streak_elements)
+        if context.pb_count < self.streak_length:
+            return NO_PREDICTION # Seri kırılması tahmini için yeterli veri yok
 
-        if is_streak:
-            # Seri varsa, serinin TERSİNİ tahmin et (kırılma)
-            return 'B' if first_element == 'P' else 'P'
-        else:
+        # Son 'streak_length' elemanın hepsi aynı mı? (Mevcut seri en az o kadar uzun mu?)
+        current_streak_len = context.streak_length
+        if current_streak_len < self.streak_length:
             # Yeterli uzunlukta bir seri yok
-            return "N/A"
+            return NO_PREDICTION
 
-    def get_confidence(self, history: list) -> float:
-        """Tahminin güven oranını döndürür."""
-        prediction = self.predict(history)
-        if prediction == "N/A":
-            return 0.0
-
-        relevant_history = [res for res in history if res in ('P', 'B')]
-        # Mevcut serinin gerçek uzunluğunu bul
-        current_streak_len = 0
-        if relevant_history:
-            last_val = relevant_history[-1]
-            for i in range(len(relevant_history) - 1, -1, -1):
-                if relevant_history[i] == last_val:
-                    current_streak_len += 1
-                else:
-                    break # Seri bitti
+        # Seri varsa, serinin TERSİNİ tahmin et (kırılma)
+        prediction = 'B' if context.last == 'P' else 'P'
+        extra_streak = max(0, current_streak_len - self.streak_length)
 
         # Seri ne kadar uzunsa, kırılma ihtimali (ve güven) o kadar artsın (basit örnek)
-        confidence = 40.0 + (max(0, current_streak_len - self.streak_length) * 10)
-        return max(30.0, min(90.0, confidence)) # Güveni %30-90 arasında tut
-
-    def get_probability(self, history: list) -> float:
-        """Tahminin gerçekleşme olasılığını döndürür."""
-        prediction = self.predict(history)
-        if prediction == "N/A":
-            return 0.0
+        confidence = 40.0 + (extra_streak * 10)
+        confidence = max(30.0, min(90.0, confidence)) # Güveni %30-90 arasında tut
 
         # Seri kırılma olasılığı genellikle serinin devam etme olasılığından
         # biraz daha düşüktür, ancak seri uzadıkça artar.
-        # Yine serinin uzunluğuna göre bir olasılık atayalım.
-        current_streak_len = 0
-        # ... (confidence'daki gibi serinin uzunluğunu bulma kodu) ...
-        relevant_history = [res for res in history if res in ('P', 'B')] # Yeniden ekleyelim
-        if relevant_history:
-            last_val = relevant_history[-1]
-            for i in range(len(relevant_history) - 1, -1, -1):
-                if relevant_history[i] == last_val: current_streak_len += 1
-                else: break
+        probability = 45.0 + (extra_streak * 5)
+        probability = max(35.0, min(70.0, probability)) # Olasılığı %35-70 arasında tut
+        return PredictionResult(prediction, confidence, probability)
 
-        probability = 45.0 + (max(0, current_streak_len - self.streak_length) * 5)
-        return max(35.0, min(70.0, probability)) # Olasılığı %35-70 arasında tut
+    def evaluate_batch(self, outcomes):
+        """
+        Toplu değerlendirme: (simülasyon x el) int8 sonuç dizisinin her konumu için
+        tahmin, güven ve olasılık dizilerini tek vektörel geçişte döndürür (bkz. batch_features).
+        """
+        import numpy as np
+        from predictors.batch_features import as_batch_features, batch_result, opposite
+        features = as_batch_features(outcomes)
+        active = features.streak >= self.streak_length
+        extra_streak = np.maximum(0, features.streak - self.streak_length)
+        confidence = np.clip(40.0 + extra_streak * 10, 30.0, 90.0)
+        probability = np.clip(45.0 + extra_streak * 5, 35.0, 70.0)
+        return batch_result(active, opposite(features.last), confidence, probability)
@@ -1,78 +1,65 @@
-class StreakFollowerPredictor:
+from predictors.history_context import HistoryLike, as_context
+from predictors.base_predictor import BasePredictor, PredictionResult, NO_PREDICTION
+
+class StreakFollowerPredictor(BasePredictor):
     """
     Belirli bir uzunluktaki (streak_length) P veya B serisini algıladığında,
     serinin devam edeceğini tahmin eden model.
     """
+    max_lookback = 1 # Seri uzunluğu bağlamdan gelir; son el yeterli
+
     def __init__(self, streak_length=3):
         # Takip etmeye başlamak için gereken minimum seri uzunluğu
         self.streak_length = max(2, streak_length) # En az 2 olmalı
+        # 9 fazla elden sonra güven ve olasılık tavana ulaşır; daha uzun seriler aynı sonucu verir
+        self.suffix_lookback = self.streak_length + 9
+
+    def evaluate(self, history: HistoryLike) -> PredictionResult:
+        """Sonucu derlenmiş sonek tablosundan tek indekslemeyle alır (mantık: evaluate_suffix)."""
+        return self.lookup(as_context(history))
 
-    def predict(self, history: list) -> str:
+    def evaluate_suffix(self, history: HistoryLike) -> PredictionResult:
         """
         Verilen geçmişe göre bir sonraki hamleyi tahmin eder.
         Seri yeterince uzunsa devamını, değilse 'N/A' döndürür.
         """
-        relevant_history = [res for res in history if res in ('P', 'B')]
-
-        if len(relevant_history) < self.streak_length:
-            return "N/A" # Seri takibi için yeterli veri yok
-
-        # Son 'streak_length' kadar elemana bak
-        last_streak_elements = relevant_history[-self.streak_length:]
+        context = as_context(history)
 
-        # Hepsi aynı mı diye kontrol et
-        first_element = last_streak_elements[0]
-        is_streak = all(elem == first_element for elem in last_streak_elements)
+        if context.pb_count < self.streak_length:
+            return NO_PREDICTION # Seri takibi için yeterli veri yok
 
-        if is_streak:
-            # Seri varsa, serinin devamını (yani aynı elemanı) tahmin et
-            return first_element
-        else:
+        # Son 'streak_length' elemanın hepsi aynı mı? (Mevcut seri en az o kadar uzun mu?)
+        current_streak_len = context.streak_length
+        if current_streak_len < self.streak_length:
             # Yeterli uzunlukta bir seri yok
-            return "N/A"
+            return NO_PREDICTION
 
-    def get_confidence(self, history: list) -> float:
-        """Tahminin güven oranını döndürür."""
-        prediction = self.predict(history)
-        if prediction == "N/A":
-            return 0.0
-
-        relevant_history = [res for res in history if res in ('P', 'B')]
-        # Mevcut serinin gerçek uzunluğunu bul
-        current_streak_len = 0
-        if relevant_history:
-            last_val = relevant_history[-1]
-            for i in range(len(relevant_history) - 1, -1, -1):
-                if relevant_history[i] == last_val:
-                    current_streak_len += 1
-                else:
-                    break
+        # Seri varsa, serinin devamını (yani aynı elemanı) tahmin et
+        prediction = context.last
+        extra_streak = max(0, current_streak_len - self.streak_length)
 
         # Seri ne kadar uzunsa, güven o kadar artsın (basit örnek)
         # self.streak_length'den sonra her ek adım için güveni artıralım
-        confidence = 50.0 + (max(0, current_streak_len - self.streak_length) * 8)
-        return max(30.0, min(90.0, confidence)) # Güveni %30-90 arasında tut
-
-    def get_probability(self, history: list) -> float:
-        """Tahminin gerçekleşme olasılığını döndürür."""
-        prediction = self.predict(history)
-        if prediction == "N/A":
-            return 0.0
-
-        relevant_history = [res for res in history if res in ('P', 'B')]
-        if not relevant_history: return 50.0
+        confidence = 50.0 + (extra_streak * 8)
+        confidence = max(30.0, min(90.0, confidence)) # Güveni %30-90 arasında tut
 
         # Genel P/B oranını kullanabiliriz ama seri takibi için çok anlamlı değil.
-        # Belki serinin uzunluğuna göre sabit bir olasılık verebiliriz?
         # Veya geçmişte benzer uzunluktaki serilerin ne kadar devam ettiğine bakılabilir (daha karmaşık)
         # Şimdilik, serinin uzunluğuna göre hafif artan bir olasılık verelim.
-        current_streak_len = 0
-        # ... (confidence'daki gibi serinin uzunluğunu bulma kodu) ...
-        if relevant_history:
-            last_val = relevant_history[-1]
-            for i in range(len(relevant_history) - 1, -1, -1):
-                if relevant_history[i] == last_val: current_streak_len += 1
-                else: break
+        probability = 50.0 + (extra_streak * 3)
+        probability = max(40.0, min(75.0, probability)) # Olasılığı %40-75 arasında tut
+        return PredictionResult(prediction, confidence, probability)
 
-        probability = 50.0 + (max(0, current_streak_len - self.streak_length) * 3)
-        return max(40.0, min(75.0, probability)) # Olasılığı %40-75 arasında tut
+    def evaluate_batch(self, outcomes):
+        """
+        Toplu değerlendirme: (simülasyon x el) int8 sonuç dizisinin her konumu için
+        tahmin, güven ve olasılık dizilerini tek vektörel geçişte döndürür (bkz. batch_features).
+        """
+        import numpy as np
+        from predictors.batch_features import as_batch_features, batch_result
+        features = as_batch_features(outcomes)
+        active = features.streak >= self.streak_length
+        extra_streak = np.maximum(0, features.streak - self.streak_length)
+        confidence = np.clip(50.0 + extra_streak * 8, 30.0, 90.0)
+        probability = np.clip(50.0 + extra_streak * 3, 40.0, 75.0)
+        return batch_result(active, features.last, confidence, probability)
@@ -0,0 +1,39 @@
+# predictors/suffix_table.py
+"""
+Kısa geçmişe bakan modellerin arama tablosuna derlenmesi.
+Çıktısı sadece son k P/B sonucuna bağlı olan bir model (geçmiş daha kısaysa
+bütün P/B görünümüne) sonlu bir durum makinesidir: olası her sonek için sonuç
+bir kez hesaplanıp tabloya yazılırsa, her elde yapılan iş
+HistoryContext.suffix_key(k) ile tek bir tamsayı indekslemedir.
+
+Tablo, bağlam ağacındaki gibi yığın indekslemesiyle düz bir listedir: m uzunluklu
+(m <= k) sonekin yeri (1 << m) | bitler'dir (P=1, B=0; en yeni el en düşük bit).
+"""
+from typing import Callable, List, TypeVar
+from predictors.history_context import HistoryContext, SUFFIX_KEY_BITS
+
+# Tablo boyutu 2^(k+1) olduğu için derlenebilecek en uzun sonek
+MAX_SUFFIX_LOOKBACK = 16
+assert MAX_SUFFIX_LOOKBACK <= SUFFIX_KEY_BITS
+
+T = TypeVar('T')
+
+
+def unpack_suffix(length: int, bits: int) -> List[str]:
+    """Paketlenmiş soneki P/B listesine çevirir (en eski el başta)."""
+    return ['P' if (bits >> shift) & 1 else 'B' for shift in range(length - 1, -1, -1)]
+
+
+def compile_suffix_table(evaluate: Callable[[HistoryContext], T], lookback: int) -> List[T]:
+    """
+    0..lookback uzunluğundaki bütün P/B sonekleri için evaluate'i bir kez çalıştırır
+    ve sonuçları suffix_key(lookback) ile indekslenen bir listeye yazar.
+    evaluate'in sonucu, sonekten eski sonuçlardan bağımsız olmalıdır.
+    """
+    if not 0 <= lookback <= MAX_SUFFIX_LOOKBACK:
+        raise ValueError(f"Sonek uzunluğu 0-{MAX_SUFFIX_LOOKBACK} arasında olmalı: {lookback}")
+    table: List[T] = [None] * (2 << lookback)  # İndeks 0 kullanılmaz
+    for length in range(lookback + 1):
+        for bits in range(1 << length):
+            table[(1 << length) | bits] = evaluate(HistoryContext(unpack_suffix(length, bits)))
+    return table
@@ -0,0 +1,53 @@
+# predictors/window_counters.py
+"""
+Kayıtlı pencere boyutları için kayan P/B sayaçları.
+Sapma tabanlı modeller (Sapma Analizi, Anti-Stats, Paralel Evren, Vasi) her elde
+son N P/B sonucundaki P ve B sayılarına bakar. Bu yapı, bağlamda kayıtlı her
+pencere boyutu için P sayısını tutar: yeni sonuç pencereye girerken, pencereden
+düşen sonuç çıkarılır. Güncelleme kayıtlı pencere sayısı kadar, sorgu O(1)'dir.
+HistoryContext sayaçları desen tabloları gibi her append/pop'ta günceller.
+"""
+from typing import Dict, Sequence, Tuple
+
+
+class WindowCounters:
+    """
+    Pencere boyutu -> son 'boyut' P/B sonucundaki P sayısı.
+    observe / forget, NgramTable'da olduğu gibi P/B görünümüne yeni eklenen ya da
+    geri alınmak üzere olan son eleman için çağrılır; pb en az boyut+1 sonucu saklamalıdır.
+    """
+
+    def __init__(self):
+        self.p_counts: Dict[int, int] = {}
+        self.length = 0  # Gözlenen P/B sonucu sayısı
+
+    def add_window(self, size: int, pb: Sequence[str]):
+        """Yeni bir pencere boyutunu kaydeder ve mevcut P/B görünümünden doldurur."""
+        self.p_counts[size] = sum(1 for result in pb[-size:] if result == 'P') if size > 0 else 0
+
+    def observe(self, pb: Sequence[str]):
+        """pb'nin son elemanını pencerelere ekler; pencereden düşen sonucu çıkarır."""
+        is_p = pb[-1] == 'P'
+        length = self.length
+        for size, p_count in self.p_counts.items():
+            if length >= size: p_count -= pb[-size - 1] == 'P'
+            self.p_counts[size] = p_count + is_p
+        self.length = length + 1
+
+    def forget(self, pb: Sequence[str]):
+        """pb'nin son elemanını pencerelerden çıkarır; pencereye geri giren sonucu ekler."""
+        is_p = pb[-1] == 'P'
+        length = self.length
+        for size, p_count in self.p_counts.items():
+            if length > size: p_count += pb[-size - 1] == 'P'
+            self.p_counts[size] = p_count - is_p
+        self.length = length - 1
+
+    def clear(self):
+        self.p_counts = dict.fromkeys(self.p_counts, 0)
+        self.length = 0
+
+    def counts(self, size: int) -> Tuple[int, int]:
+        """Son 'size' P/B sonucundaki (P sayısı, B sayısı). O(1)."""
+        p_count = self.p_counts[size]
+        return p_count, min(self.length, size) - p_count
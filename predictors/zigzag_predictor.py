@@ -1,20 +1,37 @@
-class ZigzagPredictor:
+from predictors.history_context import HistoryLike, as_context
+from predictors.base_predictor import BasePredictor, PredictionResult, NO_PREDICTION
+
+class ZigzagPredictor(BasePredictor):
     """
     Baccarat için basit bir Zigzag tahmin modeli.
     - Son iki farklı sonuç (Tie hariç) aynıysa (PP/BB), diğerini tahmin eder (B/P - Zig).
     - Son iki farklı sonuç farklıysa (PB/BP), son sonucu tekrar tahmin eder (B/P - Zag).
     """
-    def predict(self, history: list) -> str:
-        relevant_history = [res for res in history if res in ('P', 'B')]
-        if len(relevant_history) < 2: return "N/A"
+    max_lookback = 6 # Güven için son 6 ele bakar (olasılık oturum toplamlarını kullanır)
+    suffix_lookback = 6 # Tahmin ve güven tablodan gelir; olasılık her elde oturum sayılarından hesaplanır
+
+    def evaluate(self, history: HistoryLike) -> PredictionResult:
+        context = as_context(history)
+        prediction, confidence, _ = self.lookup(context)
+        if prediction == 'N/A': return NO_PREDICTION
+        return PredictionResult(prediction, confidence, self._probability(context, prediction))
+
+    def memo_key(self, context):
+        # Olasılık oturumdaki P ve P/B sayılarına bağlıdır
+        return context.suffix_key(self.suffix_lookback), context.count('P'), context.pb_count
+
+    def evaluate_suffix(self, history: HistoryLike) -> PredictionResult:
+        """Tahmin ve güven (sonekten); olasılık sonekten hesaplanamadığı için 0.0 bırakılır."""
+        context = as_context(history)
+        relevant_history = context.pb
+        if len(relevant_history) < 2: return NO_PREDICTION
         last_result, second_last_result = relevant_history[-1], relevant_history[-2]
-        if last_result == second_last_result: return 'B' if last_result == 'P' else 'P'
-        else: return last_result
+        if last_result == second_last_result: prediction = 'B' if last_result == 'P' else 'P'
+        else: prediction = last_result
+        return PredictionResult(prediction, self._confidence(context), 0.0)
 
-    def get_confidence(self, history: list) -> float:
-        prediction = self.predict(history)
-        if prediction == "N/A": return 0.0
-        relevant = [res for res in history if res in ('P', 'B')][-6:]
+    def _confidence(self, context) -> float:
+        relevant = context.tail(6)
         if len(relevant) < 3: return 40.0
         correct_zigzags = 0; total_checks = 0
         for i in range(len(relevant) - 2):
@@ -29,12 +46,9 @@ class ZigzagPredictor:
         else: base_confidence -= 5
         return max(20.0, min(95.0, base_confidence))
 
-    def get_probability(self, history: list) -> float:
-        prediction = self.predict(history)
-        if prediction == "N/A": return 0.0
-        relevant = [res for res in history if res in ('P', 'B')]
-        if not relevant: return 50.0
-        total_pb = len(relevant); count = relevant.count(prediction)
+    def _probability(self, context, prediction: str) -> float:
+        if not context.pb_count: return 50.0
+        total_pb = context.pb_count; count = context.count(prediction)
         probability = (count / total_pb) * 100
         balanced_prob = 50.0 + (probability - 50.0) * 0.8
         return max(10.0, min(90.0, balanced_prob))
@@ -0,0 +1,131 @@
+# simulation/baccarat_rules.py
+"""
+Tablo tabanlı Baccarat kural varyantları (Standart, Komisyonsuz, EZ Baccarat, Super 6).
+Her varyant oluşturulurken arama tablolarına derlenir: çekme kuralları ve
+bahis başına net ödeme tablosu (push ve özel eller dahil). Simülatör, kasa
+modeli (BaccaratModel) ve toplu motorlar sadece bu tabloları okur; yeni bir
+varyant eklemek iç döngülerde değişiklik gerektirmez.
+"""
+from typing import Dict, NamedTuple, Optional, Sequence, Tuple
+
+from simulation.baccarat_tables import (
+    PLAYER_DRAWS, BANKER_DRAWS, OUTCOME_TABLE, OUTCOME_LABEL_TABLE,
+    OUTCOME_PLAYER, OUTCOME_BANKER, OUTCOME_TIE, OUTCOME_LABELS
+)
+
+BET_CODES = {label: code for code, label in enumerate(OUTCOME_LABELS)} # 'P' -> 0, 'B' -> 1, 'T' -> 2
+
+
+class SpecialHand(NamedTuple):
+    """Kazanan tarafın belirli bir skorla (ve isteğe bağlı kart sayısıyla) kazandığı özel el."""
+    bet: str                             # 'P' veya 'B'
+    score: int                           # Kazanan tarafın son skoru
+    three_cards: Optional[bool] = None   # True: üç kartla, False: iki kartla, None: fark etmez
+    payout: float = 0.0                  # Bu elde birim bahis başına net ödeme (0 = push)
+
+
+class BaccaratRules:
+    """
+    Bir Baccarat kural varyantı. Parametreler derlenerek aşağıdaki tablolar üretilir:
+      player_draws[player skoru], banker_draws[banker skoru][player 3. kart / PLAYER_STOOD]
+      payout_table[bahis][player skoru][banker skoru][player üç kart][banker üç kart] -> net ödeme
+      outcome_payouts[bahis][sonuç] -> el ayrıntısı bilinmediğinde net ödeme
+    """
+    def __init__(self, name: str, player_payout: float = 1.0, banker_payout: float = 0.95,
+                 tie_payout: float = 8.0, tie_pushes_main_bets: bool = True,
+                 special_hands: Sequence[SpecialHand] = (),
+                 player_draws: Sequence[bool] = PLAYER_DRAWS,
+                 banker_draws: Sequence[Sequence[bool]] = BANKER_DRAWS):
+        self.name = name
+        self.player_payout = player_payout
+        self.banker_payout = banker_payout
+        self.tie_payout = tie_payout
+        self.tie_pushes_main_bets = tie_pushes_main_bets
+        self.special_hands = tuple(special_hands)
+        self.player_draws: Tuple[bool, ...] = tuple(player_draws)
+        self.banker_draws: Tuple[Tuple[bool, ...], ...] = tuple(tuple(row) for row in banker_draws)
+        self.outcome_table = OUTCOME_TABLE
+        self.outcome_label_table = OUTCOME_LABEL_TABLE
+        self.payout_table = self._compile_payout_table()
+        self.outcome_payouts: Dict[str, Dict[str, float]] = {
+            bet: {outcome: self._base_payout(BET_CODES[bet], BET_CODES[outcome]) for outcome in OUTCOME_LABELS}
+            for bet in OUTCOME_LABELS}
+        self._payout_array = None
+
+    def _base_payout(self, bet: int, outcome: int) -> float:
+        """Özel eller hesaba katılmadan, sadece sonuca göre net ödeme."""
+        if outcome == bet:
+            return (self.player_payout, self.banker_payout, self.tie_payout)[bet]
+        if outcome == OUTCOME_TIE and self.tie_pushes_main_bets:
+            return 0.0
+        return -1.0
+
+    def _compile_payout_table(self) -> tuple:
+        table = []
+        for bet in (OUTCOME_PLAYER, OUTCOME_BANKER, OUTCOME_TIE):
+            by_player = []
+            for player_score in range(10):
+                by_banker = []
+                for banker_score in range(10):
+                    outcome = OUTCOME_TABLE[player_score][banker_score]
+                    by_draws = []
+                    for player_three in (False, True):
+                        row = []
+                        for banker_three in (False, True):
+                            payout = self._base_payout(bet, outcome)
+                            for special in self.special_hands:
+                                if BET_CODES[special.bet] != bet or outcome != bet: continue
+                                winner_score = player_score if bet == OUTCOME_PLAYER else banker_score
+                                winner_three = player_three if bet == OUTCOME_PLAYER else banker_three
+                                if winner_score == special.score and special.three_cards in (None, winner_three):
+                                    payout = special.payout
+                            row.append(payout)
+                        by_draws.append(tuple(row))
+                    by_banker.append(tuple(by_draws))
+                by_player.append(tuple(by_banker))
+            table.append(tuple(by_player))
+        return tuple(table)
+
+    def payout(self, bet: str, outcome: str, hand=None) -> float:
+        """
+        Birim bahis başına net ödeme. hand (HandRecord benzeri; player_score, banker_score,
+        player_drew, banker_drew alanları) verilirse özel eller de uygulanır.
+        """
+        if hand is None:
+            return self.outcome_payouts[bet][outcome]
+        return self.payout_table[BET_CODES[bet]][hand.player_score][hand.banker_score][int(hand.player_drew)][int(hand.banker_drew)]
+
+    def net_payouts(self, details, bet: str):
+        """HAND_DETAIL_DTYPE ellerinin tamamı için bahsin net ödemelerini tek seferde döndürür (NumPy)."""
+        import numpy as np
+        if self._payout_array is None:
+            self._payout_array = np.array(self.payout_table, dtype=np.float64)
+        return self._payout_array[BET_CODES[bet], details['player_score'], details['banker_score'],
+                                  details['player_drew'].astype(np.intp), details['banker_drew'].astype(np.intp)]
+
+    def __repr__(self) -> str:
+        return f"BaccaratRules({self.name!r})"
+
+
+STANDARD_RULES = BaccaratRules('standard')
+# Banker komisyonsuz öder; Banker 6 ile kazanırsa yarım öder
+NO_COMMISSION_RULES = BaccaratRules('no_commission', banker_payout=1.0,
+                                    special_hands=(SpecialHand('B', 6, None, 0.5),))
+# Banker komisyonsuz öder; Banker üç kartla 7 ile kazanırsa (Dragon 7) Banker bahsi push olur
+EZ_BACCARAT_RULES = BaccaratRules('ez_baccarat', banker_payout=1.0,
+                                  special_hands=(SpecialHand('B', 7, True, 0.0),))
+# Super 6: Banker komisyonsuz, 6 ile kazanırsa yarım öder
+SUPER_6_RULES = BaccaratRules('super_6', banker_payout=1.0,
+                              special_hands=(SpecialHand('B', 6, None, 0.5),))
+
+RULE_VARIANTS: Dict[str, BaccaratRules] = {
+    rules.name: rules for rules in (STANDARD_RULES, NO_COMMISSION_RULES, EZ_BACCARAT_RULES, SUPER_6_RULES)
+}
+
+
+def get_rules(name: str) -> BaccaratRules:
+    """Adıyla kayıtlı bir kural varyantını döndürür."""
+    try:
+        return RULE_VARIANTS[name]
+    except KeyError:
+        raise ValueError(f"Bilinmeyen kural varyantı: {name} (seçenekler: {', '.join(RULE_VARIANTS)})")
@@ -1,103 +1,202 @@
 import random
-from collections import deque
-from typing import List, Tuple, Optional # Tip ipuçları için
+from array import array
+from typing import Iterator, List, NamedTuple, Tuple, Optional # Tip ipuçları için
+from simulation.baccarat_tables import (
+    CARD_VALUE_BY_CODE, CARD_PIP_BY_CODE, HAND_TOTAL, NATURAL, PLAYER_STOOD
+)
+from simulation.baccarat_rules import BaccaratRules, STANDARD_RULES
+
+class HandRecord(NamedTuple):
+    """iter_hands tarafından üretilen tek bir elin özeti."""
+    shoe_index: int    # Simülatörün başından beri kaçıncı ayakkabı (0-bazlı)
+    hand_index: int    # Ayakkabı içindeki el sırası (0-bazlı)
+    outcome: str       # 'P', 'B' veya 'T'
+    player_score: int
+    banker_score: int
+    natural: bool      # İlk iki kartta 8/9 (doğal) var mı?
+    player_drew: bool  # Player üçüncü kart çekti mi?
+    banker_drew: bool  # Banker üçüncü kart çekti mi?
 
 class BaccaratSimulator:
     """
     Baccarat oyunu için bir simülasyon motoru.
     Ayakkabı oluşturma, karıştırma, yakma kartı, kesme kartı ve
     standart Baccarat kurallarına göre el dağıtma işlemlerini yapar.
+    Ayakkabı, kart kodlarından (RANK_CODES) oluşan sabit bir array('b')
+    tamponunda tutulur; yakma, dağıtma ve kesme kartı kontrolü sadece
+    okuma imlecini (shoe_position) ilerletir.
     """
     CARD_VALUES = {'A': 1, '2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8, '9': 9, 'T': 0, 'J': 0, 'Q': 0, 'K': 0}
     CARD_PIP_VALUES = {'A': 1, '2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8, '9': 9, 'T': 10, 'J': 10, 'Q': 10, 'K': 10}
+    # Ayakkabı tamponunda ve toplu motorda kullanılan tam sayı kart kodları
+    RANK_CODES = {'A': 1, '2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8, '9': 9, 'T': 10, 'J': 11, 'Q': 12, 'K': 13}
+    RANK_NAMES = ('-', 'A', '2', '3', '4', '5', '6', '7', '8', '9', 'T', 'J', 'Q', 'K') # Kod -> kart adı
 
-    def __init__(self, num_decks: int = 8, cut_card_depth_approx: int = 14):
+    def __init__(self, num_decks: int = 8, cut_card_depth_approx: int = 14,
+                 seed: Optional[int] = None, rng: Optional[random.Random] = None,
+                 rules: Optional[BaccaratRules] = None):
         """
         Simülatörü başlatır.
         :param num_decks: Ayakkabıdaki deste sayısı.
         :param cut_card_depth_approx: Kesme kartının ayakkabının SONUNDAN itibaren
                                       yaklaşık olarak kaç kart önce yerleştirileceği.
                                       Standart olarak ~14 kart kala (1 desteye yakın).
+        :param seed: Verilirse simülatör kendi random.Random örneğini bu tohumla kullanır
+                     (tekrarlanabilir sonuçlar için).
+        :param rng: Karıştırma için kullanılacak random.Random örneği (seed'den önceliklidir).
+                    İkisi de verilmezse global random modülü kullanılır.
+        :param rules: Kural varyantı (çekme tabloları buradan okunur). Varsayılan: STANDARD_RULES.
         """
+        self.rules = rules if rules is not None else STANDARD_RULES
+        if rng is not None: self.rng = rng
+        elif seed is not None: self.rng = random.Random(seed)
+        else: self.rng = random # Eski davranış: global random modülü
         self.num_decks = num_decks
         self.cut_card_depth = cut_card_depth_approx
-        self.shoe = deque()
+        self.shoe = self._create_shoe() # Bir kez oluşturulur, her karıştırmada yerinde karıştırılır
+        # Kalan ayakkabının değer sınıfı sayıları (index = Baccarat değeri, 0 = 10/J/Q/K)
+        self._full_value_counts = array('h', [0] * 10)
+        for code in self.shoe: self._full_value_counts[CARD_VALUE_BY_CODE[code]] += 1
+        self.value_counts = array('h', self._full_value_counts)
+        self.shoe_position = 0 # Sıradaki kartın tampondaki index'i (okuma imleci)
+        self.deal_start_position = 0 # Yakma sonrası ilk dağıtılacak kartın index'i
         self.initial_shoe_size_after_burn = 0 # Yakma sonrası kart sayısı (index takibi için)
-        self.cards_dealt_count = 0 # Dağıtılan kart sayısı
-        self.cut_card_position_index = -1 # Kesme kartının *tam olarak* arkasındaki kartın index'i
+        self.cut_card_position_index = -1 # Kesme kartının *tam olarak* arkasındaki kartın index'i (yakma sonrasına göre)
         self.cut_card_reached = False
         self.play_one_more_hand_after_cut = False
+        self.shoe_number = -1 # shuffle_and_reset ilk çağrıda 0 yapar
+        self.hands_played_in_shoe = 0
+        self.detail_log = None # Ayrıntılı el kaydı (enable_detail_mode ile açılır)
+        self.corpus = None # Oynatılan ayakkabı külliyatı (use_shoe_corpus ile bağlanır)
+        self.corpus_index = 0 # Külliyattan okunacak sıradaki ayakkabının index'i
         self.shuffle_and_reset()
 
-    def _create_shoe(self) -> List[str]:
-        """Belirtilen sayıda deste ile bir kart listesi oluşturur."""
-        suits = ['H', 'D', 'C', 'S']
-        ranks = ['A', '2', '3', '4', '5', '6', '7', '8', '9', 'T', 'J', 'Q', 'K']
-        deck = [rank for rank in ranks for _ in suits]
-        full_shoe = deck * self.num_decks
-        return full_shoe
+    def _create_shoe(self) -> array:
+        """Belirtilen sayıda deste ile kart kodlarından oluşan bir tampon oluşturur."""
+        deck = [code for code in range(1, 14) for _ in range(4)] # 13 değer x 4 renk
+        return array('b', deck * self.num_decks)
 
-    def _burn_cards(self):
-        """Yakma kartı kurallarını uygular."""
-        if not self.shoe: return
+    @property
+    def cards_remaining(self) -> int:
+        """Ayakkabıda kalan (dağıtılmamış) kart sayısı."""
+        return len(self.shoe) - self.shoe_position
 
-        first_card_rank = self.shoe.popleft()
-        burn_value = self.CARD_PIP_VALUES.get(first_card_rank, 0)
-        num_to_burn = 0
+    @property
+    def cards_dealt_count(self) -> int:
+        """Yakma sonrası dağıtılan kart sayısı."""
+        return self.shoe_position - self.deal_start_position
 
-        if burn_value == 1: num_to_burn = 1
-        elif burn_value == 10: num_to_burn = 10 # T, J, Q, K pip değeri 10
-        elif 2 <= burn_value <= 9: num_to_burn = burn_value
+    def _burn_cards(self):
+        """Yakma kartı kurallarını uygular (ilk kartı aç, değeri kadar kart yak)."""
+        if self.cards_remaining <= 0: return
 
-        # print(f"Burning: First card was {first_card_rank}, burning {num_to_burn} cards.")
-        for _ in range(num_to_burn):
-            if self.shoe: self.shoe.popleft()
-            else: break
+        first_card_code = self.shoe[self.shoe_position]
+        num_to_burn = CARD_PIP_BY_CODE[first_card_code] # A=1, 2-9, T/J/Q/K=10
+        # print(f"Burning: First card was {self.RANK_NAMES[first_card_code]}, burning {num_to_burn} cards.")
+        burn_end = min(len(self.shoe), self.shoe_position + 1 + num_to_burn)
+        for position in range(self.shoe_position, burn_end):
+            self.value_counts[CARD_VALUE_BY_CODE[self.shoe[position]]] -= 1
+        self.shoe_position = burn_end
 
     def _place_cut_card(self):
         """Kesme kartının pozisyonunu belirler (sondan X kart önce)."""
         # Ayakkabıda kalan kart sayısından kesme derinliğini çıkar.
         # Bu, kesme kartının hemen arkasındaki kartın index'i olur (0-bazlı).
-        self.cut_card_position_index = max(0, len(self.shoe) - self.cut_card_depth -1) # -1 çünkü 0-bazlı index
+        self.cut_card_position_index = max(0, self.cards_remaining - self.cut_card_depth -1) # -1 çünkü 0-bazlı index
+        # Kesme kartı kontrolünün doğrudan imleçle yapılabilmesi için mutlak pozisyon
+        self._cut_card_cursor = self.deal_start_position + self.cut_card_position_index
         # print(f"Cut card placed effectively after index {self.cut_card_position_index} (approx. {self.cut_card_depth} cards from end)")
 
     def shuffle_and_reset(self):
-        """Yeni bir ayakkabı oluşturur, karıştırır, yakar ve kesme kartını yerleştirir."""
+        """Ayakkabıyı yerinde karıştırır, yakar ve kesme kartını yerleştirir."""
         # print("\n--- SHUFFLING NEW SHOE ---")
-        shoe_list = self._create_shoe()
-        random.shuffle(shoe_list)
-        self.shoe = deque(shoe_list)
+        if self.corpus is not None:
+            # Külliyat modu: karıştırma yerine sıradaki ayakkabı kopyalanmadan (mmap) okunur
+            self.shoe = self.corpus.shoe(self.corpus_index % len(self.corpus))
+            self.corpus_index += 1
+        else:
+            self.rng.shuffle(self.shoe) # Yeni nesne ayırmadan, tamponun kendisi karıştırılır
+        self.shoe_position = 0
+        self.value_counts[:] = self._full_value_counts
         self._burn_cards() # Önce yak
-        self.initial_shoe_size_after_burn = len(self.shoe) # Yakma sonrası boyutu sakla
+        self.deal_start_position = self.shoe_position
+        self.initial_shoe_size_after_burn = self.cards_remaining # Yakma sonrası boyutu sakla
         self._place_cut_card() # Sonra kesme kartını yerleştir (pozisyonunu belirle)
-        self.cards_dealt_count = 0 # Dağıtılan kart sayacını sıfırla
         self.cut_card_reached = False
         self.play_one_more_hand_after_cut = False
+        self.shoe_number += 1
+        self.hands_played_in_shoe = 0
 
-    def _deal_card(self) -> Optional[str]:
-        """Ayakkabıdan bir kart çeker, sayacı artırır ve kesme kartını kontrol eder."""
-        if not self.shoe:
+    def _deal_card(self) -> Optional[int]:
+        """Ayakkabıdan bir kart kodu çeker, imleci ilerletir ve kesme kartını kontrol eder."""
+        position = self.shoe_position
+        if position >= len(self.shoe):
             self.cut_card_reached = True # Ayakkabı bittiyse de kesme kartı geçmiş sayılır
             return None
 
         # Kesme kartına ulaşıldı mı?
         # Eğer dağıtılan kart sayısı kesme kartı pozisyonunu geçtiyse.
-        if not self.cut_card_reached and self.cards_dealt_count > self.cut_card_position_index:
+        if not self.cut_card_reached and position > self._cut_card_cursor:
             # print(f"CUT CARD REACHED at card {self.cards_dealt_count + 1} (Position was after index {self.cut_card_position_index})!")
             self.cut_card_reached = True
             # Kural 2 & 3: Bu eli bitir, bir el daha oyna.
             # Bu bayrak deal_hand sonunda kontrol edilecek.
             self.play_one_more_hand_after_cut = True
 
-        card = self.shoe.popleft()
-        self.cards_dealt_count += 1 # Dağıtılan kart sayısını artır
-        # print(f"Dealt card #{self.cards_dealt_count}: {card}") # Debug
+        card = self.shoe[position]
+        self.shoe_position = position + 1
+        self.value_counts[CARD_VALUE_BY_CODE[card]] -= 1
+        # print(f"Dealt card #{self.cards_dealt_count}: {self.RANK_NAMES[card]}") # Debug
         return card
 
-    def _get_baccarat_value(self, cards: List[str]) -> int:
-        """Verilen kart listesinin Baccarat değerini (0-9) hesaplar."""
-        total = sum(self.CARD_VALUES.get(card, 0) for card in cards)
-        return total % 10
+    def next_hand_probabilities(self) -> Optional[Tuple[float, float, float]]:
+        """
+        Kalan ayakkabı bileşimine (value_counts) göre bir sonraki elin tam
+        (Player, Banker, Tie) olasılıklarını döndürür. NumPy gerektirir.
+        """
+        from simulation.shoe_probability import exact_hand_probabilities
+        return exact_hand_probabilities(self.value_counts)
+
+    def _get_baccarat_value(self, cards: List[int]) -> int:
+        """Verilen kart kodu listesinin Baccarat değerini (0-9) hesaplar."""
+        total = 0
+        for card in cards:
+            total = HAND_TOTAL[total][CARD_VALUE_BY_CODE[card]]
+        return total
+
+    def use_shoe_corpus(self, corpus, start_index: int = 0):
+        """
+        Ayakkabıları karıştırmak yerine bir ShoeCorpus dosyasından sırayla oynatır
+        (sona gelince başa döner) ve ilk ayakkabıya geçer. None verilirse normal
+        karıştırmaya döner.
+        :param corpus: simulation.shoe_corpus.ShoeCorpus örneği veya None.
+        :param start_index: Oynatmaya başlanacak ayakkabının index'i.
+        """
+        if corpus is not None:
+            if corpus.num_decks != self.num_decks:
+                raise ValueError(f"Külliyat {corpus.num_decks} desteli, simülatör {self.num_decks} desteli.")
+            if len(corpus) == 0:
+                raise ValueError("Külliyatta ayakkabı yok.")
+        elif self.corpus is not None:
+            self.shoe = self._create_shoe() # Külliyat dilimini bırak, kendi tamponuna dön
+        self.corpus = corpus
+        self.corpus_index = start_index
+        self.shuffle_and_reset()
+
+    def enable_detail_mode(self, capacity: int = 100000):
+        """
+        Ayrıntılı el kaydını açar: her el (kartlar, skorlar, çekme bayrakları, sonuç)
+        önceden ayrılmış bir NumPy yapılı dizisine yazılır. NumPy gerektirir.
+        :param capacity: Önceden ayrılacak el sayısı.
+        :return: Kayıtların tutulduğu HandDetailLog.
+        """
+        from simulation.hand_detail import HandDetailLog
+        self.detail_log = HandDetailLog(capacity)
+        return self.detail_log
+
+    def disable_detail_mode(self):
+        """Ayrıntılı el kaydını kapatır."""
+        self.detail_log = None
 
     def needs_shuffle(self) -> bool:
         """Ayakkabının karıştırılması gerekip gerekmediğini kontrol eder."""
@@ -109,6 +208,15 @@ class BaccaratSimulator:
         Bir el Baccarat oynar ve sonucu ('P', 'B', 'T') döndürür.
         Ayakkabı karıştırılması gerekiyorsa veya bittiyse None döner.
         """
+        hand = self._play_hand()
+        return hand[0] if hand is not None else None
+
+    def _play_hand(self) -> Optional[Tuple[str, int, int, bool, bool, bool]]:
+        """
+        Bir el oynar ve (sonuç, player skoru, banker skoru, doğal mı, player çekti mi,
+        banker çekti mi) döndürür. Çekme ve sonuç tabloları self.rules'tan okunur.
+        Ayakkabı karıştırılması gerekiyorsa veya el ortasında bittiyse None döner.
+        """
         if self.needs_shuffle():
             # print("Shuffle required before next hand.")
             return None # Karıştırılması lazım
@@ -118,78 +226,94 @@ class BaccaratSimulator:
         if is_last_hand:
             self.play_one_more_hand_after_cut = False # Bayrağı indir, bu el sondu.
 
-        player_hand: List[str] = []
-        banker_hand: List[str] = []
-
-        # İlk iki kartı dağıt
-        for _ in range(2):
-            p_card = self._deal_card()
-            if p_card is None: return None # Ayakkabı bitti
-            player_hand.append(p_card)
+        values = CARD_VALUE_BY_CODE
+        rules = self.rules
+        # İlk iki kartı dağıt (P, B, P, B)
+        p1 = self._deal_card()
+        if p1 is None: return None # Ayakkabı bitti
+        b1 = self._deal_card()
+        if b1 is None: return None
+        p2 = self._deal_card()
+        if p2 is None: return None
+        b2 = self._deal_card()
+        if b2 is None: return None
 
-            b_card = self._deal_card()
-            if b_card is None: return None # Ayakkabı bitti
-            banker_hand.append(b_card)
-
-        player_score = self._get_baccarat_value(player_hand)
-        banker_score = self._get_baccarat_value(banker_hand)
+        player_score = HAND_TOTAL[values[p1]][values[p2]]
+        banker_score = HAND_TOTAL[values[b1]][values[b2]]
 
         # Doğal (Natural) kontrolü
-        is_player_natural = player_score >= 8
-        is_banker_natural = banker_score >= 8
-
-        if is_player_natural or is_banker_natural:
-            # print(f"Natural! P:{player_score} B:{banker_score}") # Debug
-            if player_score > banker_score: return 'P'
-            elif banker_score > player_score: return 'B'
-            else: return 'T'
-
-        # Player için üçüncü kart kuralı
-        player_draws = False
-        if player_score <= 5:
+        if NATURAL[player_score] or NATURAL[banker_score]:
+            self.hands_played_in_shoe += 1
+            if self.detail_log is not None:
+                self.detail_log.append(p1, p2, 0, b1, b2, 0, player_score, banker_score,
+                                       rules.outcome_table[player_score][banker_score])
+            return rules.outcome_label_table[player_score][banker_score], player_score, banker_score, True, False, False
+
+        # Player için üçüncü kart kuralı (6 veya 7 ile durur)
+        player_third_card_value = PLAYER_STOOD
+        p_third_card = b_third_card = 0 # 0 = kart çekilmedi
+        if rules.player_draws[player_score]:
             p_third_card = self._deal_card()
             if p_third_card is None: return None # Ayakkabı bitti
-            player_hand.append(p_third_card)
-            player_score = self._get_baccarat_value(player_hand)
-            player_draws = True
-            player_third_card_value = self.CARD_VALUES.get(p_third_card, 0) # Banker kuralı için
-        # else: Player 6 veya 7 ile durur
-
-        # Banker için üçüncü kart kuralı
-        banker_draws = False
-        if not player_draws: # Eğer Player üçüncü kart çekmediyse (6 veya 7 ile durduysa)
-            if banker_score <= 5:
-                b_third_card = self._deal_card()
-                if b_third_card is None: return None
-                banker_hand.append(b_third_card)
-                banker_score = self._get_baccarat_value(banker_hand)
-                banker_draws = True
-            # else: Banker 6 veya 7 ile durur
-        else: # Eğer Player üçüncü kart çektiyse
-            if banker_score <= 2:
-                banker_draws = True
-            elif banker_score == 3 and player_third_card_value != 8:
-                banker_draws = True
-            elif banker_score == 4 and player_third_card_value in (2, 3, 4, 5, 6, 7):
-                banker_draws = True
-            elif banker_score == 5 and player_third_card_value in (4, 5, 6, 7):
-                banker_draws = True
-            elif banker_score == 6 and player_third_card_value in (6, 7):
-                banker_draws = True
-            # else: Banker 7 ile durur veya diğer durumlarda durur
-
-            if banker_draws:
-                b_third_card = self._deal_card()
-                if b_third_card is None: return None
-                banker_hand.append(b_third_card)
-                banker_score = self._get_baccarat_value(banker_hand)
-
-        # print(f"Final Hands: P={player_hand} ({player_score}), B={banker_hand} ({banker_score})") # Debug
+            player_third_card_value = values[p_third_card]
+            player_score = HAND_TOTAL[player_score][player_third_card_value]
+
+        # Banker için üçüncü kart kuralı (tablodan: banker skoru x player üçüncü kartı)
+        if rules.banker_draws[banker_score][player_third_card_value]:
+            b_third_card = self._deal_card()
+            if b_third_card is None: return None
+            banker_score = HAND_TOTAL[banker_score][values[b_third_card]]
 
         # Sonucu belirle
-        if player_score > banker_score: return 'P'
-        elif banker_score > player_score: return 'B'
-        else: return 'T'
+        self.hands_played_in_shoe += 1
+        if self.detail_log is not None:
+            self.detail_log.append(p1, p2, p_third_card, b1, b2, b_third_card, player_score, banker_score,
+                                   rules.outcome_table[player_score][banker_score])
+        return (rules.outcome_label_table[player_score][banker_score], player_score, banker_score, False,
+                p_third_card != 0, b_third_card != 0)
+
+    def iter_hands(self, num_hands: Optional[int] = None, shoes: Optional[int] = None) -> Iterator[HandRecord]:
+        """
+        Elleri akış halinde üretir (generator). Kesme kartına gelindiğinde veya
+        ayakkabı el ortasında bittiğinde içeride yeniden karıştırır; tüketicinin
+        None kontrolü yapmasına gerek yoktur.
+        :param num_hands: Üretilecek el sayısı (None: sınırsız).
+        :param shoes: En fazla kaç ayakkabı oynanacağı (mevcut ayakkabı dahil, None: sınırsız).
+        """
+        produced = 0
+        shoes_started = 1
+        if self.needs_shuffle():
+            self.shuffle_and_reset()
+        while num_hands is None or produced < num_hands:
+            hand_index = self.hands_played_in_shoe
+            hand = self._play_hand()
+            if hand is None:
+                if hand_index == 0:
+                    return # Yeni karıştırılmış ayakkabıdan bile el çıkmıyor (çok küçük ayakkabı)
+                if shoes is not None and shoes_started >= shoes:
+                    return
+                self.shuffle_and_reset()
+                shoes_started += 1
+                continue
+            yield HandRecord(self.shoe_number, hand_index, *hand)
+            produced += 1
+            if self.needs_shuffle():
+                # Kesme kartı sonrası son el oynandı; sonraki ayakkabıya geç
+                if shoes is not None and shoes_started >= shoes:
+                    return
+                self.shuffle_and_reset()
+                shoes_started += 1
+
+    def resolve_shoe_batch(self, rank_codes) -> list:
+        """
+        Karıştırılmış tam bir ayakkabıyı (RANK_CODES ile kodlanmış tam sayı dizisi,
+        örn. self.shoe)
+        tek seferde, dizi işlemleriyle oynar ve sonuçları ('P', 'B', 'T') döndürür.
+        Aynı kart sırası için deal_hand döngüsüyle birebir aynı sonuçları verir.
+        NumPy gerektirir.
+        """
+        from simulation.vectorized_engine import resolve_shoe, outcome_labels
+        return outcome_labels(resolve_shoe(rank_codes, cut_card_depth=self.cut_card_depth, rules=self.rules))
 
     # Simülasyonu çalıştırmak için örnek bir metod (opsiyonel)
     def run_simulation(self, num_hands=100):
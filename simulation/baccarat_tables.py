@@ -0,0 +1,59 @@
+# simulation/baccarat_tables.py
+"""
+Baccarat çekme kuralları ve sonuçları için önceden hesaplanmış arama tabloları.
+Kurallar modül yüklenirken bir kez değerlendirilir; simülasyonun iç döngüsü
+(deal_hand ve toplu motorlar) dallanma yerine sabit zamanlı indeksleme yapar.
+"""
+from typing import Tuple
+
+# Kart kodları: 1=A, 2..9, 10=T, 11=J, 12=Q, 13=K (0 = kart yok / dolgu)
+CARD_VALUE_BY_CODE: Tuple[int, ...] = (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 0, 0, 0, 0)
+CARD_PIP_BY_CODE: Tuple[int, ...] = (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10)
+
+# Banker tablosunda "Player üçüncü kart çekmedi" sütunu
+PLAYER_STOOD = 10
+
+OUTCOME_PLAYER = 0
+OUTCOME_BANKER = 1
+OUTCOME_TIE = 2
+OUTCOME_LABELS = ('P', 'B', 'T')
+
+
+def _banker_draws(banker_score: int, player_third: int) -> bool:
+    """Standart Banker çekme kuralı (tablolar bundan bir kez üretilir)."""
+    if player_third == PLAYER_STOOD:
+        return banker_score <= 5 # Player 6/7 ile durduysa Banker 0-5 ile çeker
+    if banker_score <= 2: return True
+    if banker_score == 3: return player_third != 8
+    if banker_score == 4: return player_third in (2, 3, 4, 5, 6, 7)
+    if banker_score == 5: return player_third in (4, 5, 6, 7)
+    if banker_score == 6: return player_third in (6, 7)
+    return False # Banker 7 ile durur
+
+
+def _outcome_code(player_score: int, banker_score: int) -> int:
+    if player_score > banker_score: return OUTCOME_PLAYER
+    elif banker_score > player_score: return OUTCOME_BANKER
+    return OUTCOME_TIE
+
+
+# HAND_TOTAL[eldeki toplam][yeni kart değeri] -> yeni Baccarat toplamı (0-9)
+HAND_TOTAL: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple((total + value) % 10 for value in range(10)) for total in range(10))
+
+# NATURAL[skor] -> 8 veya 9 (doğal) mı?
+NATURAL: Tuple[bool, ...] = tuple(score >= 8 for score in range(10))
+
+# PLAYER_DRAWS[player skoru] -> Player üçüncü kart çeker mi? (doğal olmayan eller için)
+PLAYER_DRAWS: Tuple[bool, ...] = tuple(score <= 5 for score in range(10))
+
+# BANKER_DRAWS[banker skoru][player üçüncü kart değeri veya PLAYER_STOOD] -> Banker çeker mi?
+BANKER_DRAWS: Tuple[Tuple[bool, ...], ...] = tuple(
+    tuple(_banker_draws(banker_score, player_third) for player_third in range(PLAYER_STOOD + 1))
+    for banker_score in range(10))
+
+# OUTCOME_TABLE[player skoru][banker skoru] -> sonuç kodu; OUTCOME_LABEL_TABLE aynı tablonun 'P'/'B'/'T' hali
+OUTCOME_TABLE: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(_outcome_code(p, b) for b in range(10)) for p in range(10))
+OUTCOME_LABEL_TABLE: Tuple[Tuple[str, ...], ...] = tuple(
+    tuple(OUTCOME_LABELS[code] for code in row) for row in OUTCOME_TABLE)
@@ -0,0 +1,58 @@
+# simulation/hand_detail.py
+"""
+Ayrıntılı el kaydı (detail mode).
+Her el; Player'ın ve Banker'ın en fazla 3 kartını, iki skoru, üçüncü kart çekme
+bayraklarını ve sonuç kodunu önceden ayrılmış bir NumPy yapılı dizisine yazar.
+El başına 11 bayt kullanılır; 1 milyon ellik ayrıntılı bir koşu ~11 MB tutar.
+"""
+import numpy as np
+
+from simulation.baccarat_tables import OUTCOME_LABELS
+
+# Kartlar RANK_CODES kodlamasıyla tutulur (0 = kart çekilmedi), sonuç OUTCOME_* kodudur
+HAND_DETAIL_DTYPE = np.dtype([
+    ('player_cards', np.int8, (3,)),
+    ('banker_cards', np.int8, (3,)),
+    ('player_score', np.int8),
+    ('banker_score', np.int8),
+    ('player_drew', np.bool_),
+    ('banker_drew', np.bool_),
+    ('outcome', np.int8),
+])
+
+
+class HandDetailLog:
+    """
+    Elleri sırasıyla önceden ayrılmış bir yapılı diziye yazan kayıt tamponu.
+    Kapasite aşılırsa dizi iki katına büyütülür (beklenen el sayısını vererek
+    yeniden ayırmadan kaçınılabilir).
+    """
+    def __init__(self, capacity: int = 100000):
+        self._records = np.zeros(max(1, capacity), dtype=HAND_DETAIL_DTYPE)
+        self.count = 0
+
+    @property
+    def capacity(self) -> int:
+        return len(self._records)
+
+    @property
+    def records(self) -> np.ndarray:
+        """Doldurulmuş kısmın görünümü (kopya değildir)."""
+        return self._records[:self.count]
+
+    def append(self, p1: int, p2: int, p3: int, b1: int, b2: int, b3: int,
+               player_score: int, banker_score: int, outcome: int):
+        """Bir eli kaydeder. Çekilmeyen üçüncü kartlar için 0 verilir."""
+        if self.count == len(self._records):
+            self._records = np.resize(self._records, 2 * len(self._records))
+        self._records[self.count] = ((p1, p2, p3), (b1, b2, b3), player_score, banker_score,
+                                     p3 != 0, b3 != 0, outcome)
+        self.count += 1
+
+    def clear(self):
+        """Kayıtları siler (ayrılmış bellek korunur)."""
+        self.count = 0
+
+    def outcome_labels(self) -> list:
+        """Kaydedilen ellerin sonuçlarını 'P'/'B'/'T' listesi olarak döndürür."""
+        return [OUTCOME_LABELS[code] for code in self.records['outcome']]
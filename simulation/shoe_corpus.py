@@ -0,0 +1,105 @@
+# simulation/shoe_corpus.py
+"""
+Diskte, bellek eşlemeli (mmap) karıştırılmış ayakkabı külliyatı.
+Ayakkabılar bir kez üretilip düz bir ikili dosyaya yazılır; farklı tahminci
+ayarları aynı dosyayı oynatarak birebir aynı kartları görür.
+
+Dosya biçimi: 32 baytlık başlık (sihirli bayt dizisi, ayakkabı sayısı, ayakkabı
+başına kart, deste sayısı, ana tohum) ve ardından ayakkabı sırasıyla int8 kart
+kodları (BaccaratSimulator.RANK_CODES). i. ayakkabının tohumu shoe_farm ile
+aynı şekilde türetildiği için külliyat ve çiftlik aynı ayakkabıları üretir.
+"""
+import mmap
+import struct
+import sys
+from typing import Optional
+
+from simulation.shoe_farm import generate_shoes, CARDS_PER_DECK
+
+CORPUS_MAGIC = b'BACSHOE1'
+_HEADER = struct.Struct('<8sIIIIq') # sihirli, ayakkabı, kart, deste, (ayrılmış), ana tohum
+HEADER_SIZE = _HEADER.size
+
+
+def write_shoe_corpus(path: str, num_shoes: int, master_seed: int = 0, num_decks: int = 8,
+                      chunk_size: int = 1000) -> None:
+    """
+    num_shoes adet karıştırılmış ayakkabıyı üretir ve dosyaya yazar.
+    Bellekte aynı anda en fazla chunk_size ayakkabı tutulur.
+    """
+    cards_per_shoe = num_decks * CARDS_PER_DECK
+    with open(path, 'wb') as corpus_file:
+        corpus_file.write(_HEADER.pack(CORPUS_MAGIC, num_shoes, cards_per_shoe, num_decks, 0, master_seed))
+        for start in range(0, num_shoes, chunk_size):
+            stop = min(start + chunk_size, num_shoes)
+            corpus_file.write(generate_shoes(master_seed, start, stop, num_decks).tobytes())
+
+
+class ShoeCorpus:
+    """
+    Ayakkabı külliyatı dosyasını mmap ile açar. Dosya belleğe okunmaz; ayakkabılar
+    index ile, kopyalanmadan (memoryview dilimi olarak) okunur.
+    Kapatmadan önce dışarı verilen dilimlerin bırakılması gerekir (örn. simülatörde
+    use_shoe_corpus(None)).
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError: # Boş dosya eşlenemez
+            self._file.close()
+            raise ValueError(f"Geçersiz ayakkabı külliyatı: {path}")
+        if len(self._map) < HEADER_SIZE:
+            self.close()
+            raise ValueError(f"Geçersiz ayakkabı külliyatı: {path}")
+        magic, self.num_shoes, self.cards_per_shoe, self.num_decks, _, self.master_seed = \
+            _HEADER.unpack_from(self._map, 0)
+        if magic != CORPUS_MAGIC or len(self._map) < HEADER_SIZE + self.num_shoes * self.cards_per_shoe:
+            self.close()
+            raise ValueError(f"Geçersiz veya eksik ayakkabı külliyatı: {path}")
+        self._cards = memoryview(self._map)[HEADER_SIZE:HEADER_SIZE + self.num_shoes * self.cards_per_shoe].cast('b')
+
+    def __len__(self) -> int:
+        return self.num_shoes
+
+    def shoe(self, index: int) -> memoryview:
+        """index. ayakkabının kart kodlarını kopyalamadan (salt okunur memoryview) döndürür."""
+        if not 0 <= index < self.num_shoes:
+            raise IndexError(f"Ayakkabı index'i aralık dışında: {index} (toplam {self.num_shoes})")
+        start = index * self.cards_per_shoe
+        return self._cards[start:start + self.cards_per_shoe]
+
+    def as_array(self, start: int = 0, stop: Optional[int] = None):
+        """[start, stop) ayakkabılarını kopyasız (ayakkabı, kart) int8 NumPy dizisi olarak döndürür (toplu motor için)."""
+        import numpy as np
+        stop = self.num_shoes if stop is None else min(stop, self.num_shoes)
+        shoes = np.frombuffer(self._cards, dtype=np.int8).reshape(self.num_shoes, self.cards_per_shoe)
+        return shoes[start:stop]
+
+    def close(self):
+        if getattr(self, '_cards', None) is not None:
+            self._cards.release()
+            self._cards = None
+        if getattr(self, '_map', None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+if __name__ == '__main__':
+    # Kullanım: python -m simulation.shoe_corpus <dosya> [ayakkabı sayısı] [ana tohum]
+    if len(sys.argv) < 2:
+        print("Kullanım: python -m simulation.shoe_corpus <dosya> [ayakkabı sayısı] [ana tohum]")
+        sys.exit(1)
+    corpus_path = sys.argv[1]
+    shoe_count = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+    seed = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+    write_shoe_corpus(corpus_path, shoe_count, master_seed=seed)
+    print(f"{shoe_count} ayakkabı {corpus_path} dosyasına yazıldı (ana tohum {seed}).")
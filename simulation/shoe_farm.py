@@ -0,0 +1,128 @@
+# simulation/shoe_farm.py
+"""
+Çok süreçli Monte Carlo ayakkabı çiftliği.
+Bağımsız ayakkabıları bir süreç havuzuna dağıtır, her ayakkabıyı toplu motorla
+(vectorized_engine) oynar ve işçilerin sonuç sayılarını ve el dizilerini birleştirir.
+
+Tekrarlanabilirlik: Her ayakkabının tohumu, tek bir ana tohumdan ayakkabı
+index'i ile türetilir (SeedSequence(ana_tohum, spawn_key=(index,))). İşler sabit
+boyutlu parçalara bölündüğü ve parçalar sırasıyla birleştirildiği için aynı
+ana tohum, işçi sayısından bağımsız olarak birebir aynı sonuçları verir.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from simulation.vectorized_engine import resolve_shoes, resolve_shoes_detailed, OUTCOME_NONE, OUTCOME_LABELS
+from simulation.side_bets import side_bet_totals, main_bet_totals, merge_side_bet_totals, side_bet_stats
+from simulation.baccarat_rules import get_rules
+
+CARDS_PER_DECK = 52
+
+
+class ShoeFarmResult(NamedTuple):
+    counts: dict               # {'P': ..., 'B': ..., 'T': ...}
+    num_shoes: int
+    num_hands: int
+    sequences: Optional[np.ndarray]     # Tüm ellerin sonuç kodları (ayakkabı sırasıyla), keep_sequences=False ise None
+    shoe_offsets: Optional[np.ndarray]  # sequences içinde i. ayakkabının elleri: sequences[offsets[i]:offsets[i+1]]
+    side_bets: Optional[dict] = None    # {bahis adı: SideBetStats}, side_bets=False ise None
+
+
+def shoe_seed_sequence(master_seed: int, shoe_index: int) -> np.random.SeedSequence:
+    """Ana tohumdan, verilen ayakkabıya özel bağımsız bir tohum dizisi türetir."""
+    return np.random.SeedSequence(entropy=master_seed, spawn_key=(shoe_index,))
+
+
+def base_shoe(num_decks: int = 8) -> np.ndarray:
+    """Karıştırılmamış ayakkabının kart kodları (BaccaratSimulator.RANK_CODES kodlaması)."""
+    return np.tile(np.repeat(np.arange(1, 14, dtype=np.int8), 4), num_decks)
+
+
+def generate_shoes(master_seed: int, start: int, stop: int, num_decks: int = 8) -> np.ndarray:
+    """[start, stop) aralığındaki ayakkabıları kendi tohumlarıyla karıştırıp (adet, kart) dizisi döndürür."""
+    template = base_shoe(num_decks)
+    shoes = np.empty((stop - start, template.size), dtype=np.int8)
+    for row, shoe_index in enumerate(range(start, stop)):
+        shoes[row] = np.random.default_rng(shoe_seed_sequence(master_seed, shoe_index)).permutation(template)
+    return shoes
+
+
+def _farm_chunk(task: Tuple[int, int, int, int, int, bool, bool, str]):
+    """İşçi süreç görevi: bir ayakkabı aralığını oynar, sayıları (ve istenirse dizileri, yan bahisleri) döndürür."""
+    master_seed, start, stop, num_decks, cut_card_depth, keep_sequences, side_bets, rules_name = task
+    rules = get_rules(rules_name)
+    shoes = generate_shoes(master_seed, start, stop, num_decks)
+    bet_totals = None
+    if side_bets:
+        details, outcomes = resolve_shoes_detailed(shoes, cut_card_depth, return_outcomes=True, rules=rules)
+        bet_totals = side_bet_totals(details)
+        bet_totals.update(main_bet_totals(details, rules))
+    else:
+        outcomes = resolve_shoes(shoes, cut_card_depth, rules=rules)
+    played = outcomes != OUTCOME_NONE
+    counts = np.bincount(outcomes[played], minlength=len(OUTCOME_LABELS))
+    if not keep_sequences:
+        return counts, None, None, bet_totals
+    # Oynanan eller her satırda başta ve bitişik olduğu için satır bazında düzleştirmek sırayı korur
+    hands_per_shoe = played.sum(axis=1)
+    return counts, outcomes[played], hands_per_shoe, bet_totals
+
+
+def run_shoe_farm(num_shoes: int, master_seed: int = 0, workers: Optional[int] = None,
+                  num_decks: int = 8, cut_card_depth: int = 14, chunk_size: int = 1000,
+                  keep_sequences: bool = False, side_bets: bool = False,
+                  rules: str = 'standard') -> ShoeFarmResult:
+    """
+    num_shoes bağımsız ayakkabıyı süreç havuzunda oynar ve sonuçları birleştirir.
+    :param workers: İşçi süreç sayısı (None: CPU sayısı, 1: havuz kullanmadan aynı süreçte).
+    :param chunk_size: Bir işçi görevindeki ayakkabı sayısı (sonuçları etkilemez).
+    :param keep_sequences: True ise tüm el dizileri de döndürülür (ayakkabı başına ~80 bayt).
+    :param side_bets: True ise aynı ellerde yan bahisler (simulation.side_bets.SIDE_BETS) ve
+                      kural varyantına göre ana bahisler ('main_P', 'main_B', 'main_T') de değerlendirilir.
+    :param rules: Kural varyantının adı (simulation.baccarat_rules.RULE_VARIANTS).
+    """
+    chunk_size = max(1, chunk_size)
+    tasks = [(master_seed, start, min(start + chunk_size, num_shoes), num_decks, cut_card_depth, keep_sequences, side_bets, rules)
+             for start in range(0, num_shoes, chunk_size)]
+
+    if workers is None: workers = os.cpu_count() or 1
+    if workers <= 1 or len(tasks) <= 1:
+        chunk_results = [_farm_chunk(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunk_results = list(pool.map(_farm_chunk, tasks)) # map, görev sırasını korur
+
+    total_counts = np.zeros(len(OUTCOME_LABELS), dtype=np.int64)
+    sequence_parts: List[np.ndarray] = []; hands_parts: List[np.ndarray] = []
+    for counts, sequence, hands_per_shoe, _ in chunk_results:
+        total_counts += counts
+        if keep_sequences:
+            sequence_parts.append(sequence); hands_parts.append(hands_per_shoe)
+
+    sequences = shoe_offsets = None
+    if keep_sequences:
+        sequences = np.concatenate(sequence_parts) if sequence_parts else np.empty(0, dtype=np.int8)
+        hands = np.concatenate(hands_parts) if hands_parts else np.empty(0, dtype=np.int64)
+        shoe_offsets = np.zeros(num_shoes + 1, dtype=np.int64)
+        np.cumsum(hands, out=shoe_offsets[1:])
+
+    bet_stats = None
+    if side_bets:
+        bet_stats = side_bet_stats(merge_side_bet_totals(part[3] for part in chunk_results))
+
+    counts = {label: int(total_counts[code]) for code, label in enumerate(OUTCOME_LABELS)}
+    return ShoeFarmResult(counts, num_shoes, int(total_counts.sum()), sequences, shoe_offsets, bet_stats)
+
+
+if __name__ == '__main__':
+    result = run_shoe_farm(num_shoes=20000, master_seed=2024, side_bets=True)
+    total = result.num_hands
+    print(f"{result.num_shoes} ayakkabı, {total} el")
+    for label, count in result.counts.items():
+        print(f"  {label}: {count} ({count / total * 100:.2f}%)")
+    print("Yan bahisler (isabet oranı, kasa avantajı):")
+    for name, stats in result.side_bets.items():
+        print(f"  {name}: {stats.hit_rate * 100:.3f}%, {stats.house_edge * 100:.2f}%")
@@ -0,0 +1,86 @@
+# simulation/shoe_probability.py
+"""
+Kalan ayakkabı bileşiminden bir sonraki elin TAM P/B/T olasılıklarını hesaplar.
+Bileşim, 10 değer sınıfının (0=10/J/Q/K, 1=A, 2..9) kalan kart sayılarıdır.
+
+Yöntem: İlk 6 kartın (P, B, P, B, 5., 6.) tüm değer kombinasyonları için el
+sonucu bir kez hesaplanır (bileşimden bağımsız). Her çağrıda, iadesiz çekme
+olasılıkları 6. ve 5. kart üzerinden matris çarpımlarıyla toplanır; kullanılmayan
+kartlar kendiliğinden 1'e marjinalleşir. Sonuçlar bileşime göre önbelleğe alınır.
+"""
+from functools import lru_cache
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from simulation.vectorized_engine import hand_tables
+
+NUM_VALUE_CLASSES = 10
+MIN_CARDS_FOR_EXACT = 6 # Bir el en fazla 6 kart kullanır
+
+_tables = None
+
+
+def _build_tables():
+    """Bileşimden bağımsız kombinatorik tabloları bir kez hazırlar."""
+    global _tables
+    if _tables is not None:
+        return _tables
+    v = NUM_VALUE_CLASSES
+    cards = np.indices((v,) * 6, dtype=np.int8).reshape(6, -1) # (6, 10^6): p1, b1, p2, b2, 5., 6. kart
+    outcomes = hand_tables(np.ascontiguousarray(cards.T))[0][:, 0] # Her satır, 0. pozisyondan başlayan el
+    onehot = (outcomes[:, None] == np.arange(3)).reshape(v ** 5, v, 3) # [ilk 5 kart, 6. kart, sonuç]
+
+    # Önceki kartlar arasında aynı değerden kaç tane olduğu (iadesiz çekme payı için)
+    same_before = np.zeros_like(cards)
+    for k in range(6):
+        for j in range(k):
+            same_before[k] += (cards[j] == cards[k])
+    d6 = same_before[5].reshape(v ** 5, v)
+
+    # (10^5 * 3, 10): tek bir matris-vektör çarpımı için düzleştirilmiş
+    sixth_outcomes = np.ascontiguousarray(onehot.transpose(0, 2, 1), dtype=np.float32).reshape(-1, v)
+    sixth_removed = np.einsum('ij,ijk->ik', d6, onehot.astype(np.int32)).astype(np.float64) # (10^5, 3)
+    fifth_removed = same_before[4].reshape(v ** 5, v)[:, 0].reshape(v ** 4, v).astype(np.float64) # (10^4, 10)
+    first_four = cards[:4].reshape(4, v ** 5, v)[:, :, 0].reshape(4, v ** 4, v)[:, :, 0]
+    first_four_removed = same_before[:4].reshape(4, v ** 5, v)[:, :, 0].reshape(4, v ** 4, v)[:, :, 0]
+
+    _tables = (sixth_outcomes, sixth_removed, fifth_removed,
+               first_four.astype(np.intp), first_four_removed.astype(np.float64))
+    return _tables
+
+
+@lru_cache(maxsize=4096)
+def _exact_probabilities(value_counts: Tuple[int, ...]) -> Optional[Tuple[float, float, float]]:
+    n = np.asarray(value_counts, dtype=np.float64)
+    total = n.sum()
+    if total < MIN_CARDS_FOR_EXACT:
+        return None
+    sixth_outcomes, sixth_removed, fifth_removed, first_four, first_four_removed = _build_tables()
+
+    # 6. kart: Σ (n[c6] - önceki aynılar) / (N - 5) -> (ilk 5 kart, sonuç)
+    given_five = ((sixth_outcomes @ n.astype(np.float32)).reshape(-1, 3) - sixth_removed) / (total - 5)
+    # 5. kart: Σ (n[c5] - önceki aynılar) / (N - 4) -> (ilk 4 kart, sonuç)
+    fifth_prob = (n[None, :] - fifth_removed) / (total - 4)
+    given_four = np.einsum('ij,ijk->ik', fifth_prob, given_five.reshape(-1, NUM_VALUE_CLASSES, 3))
+    # İlk 4 kartın iadesiz çekilme olasılığı
+    weights = np.ones(first_four.shape[1])
+    for k in range(4):
+        weights *= (n[first_four[k]] - first_four_removed[k]) / (total - k)
+    p, b, t = weights @ given_four
+    return float(p), float(b), float(t)
+
+
+def exact_hand_probabilities(value_counts: Sequence[int]) -> Optional[Tuple[float, float, float]]:
+    """
+    Verilen kalan kart bileşimi için bir sonraki elin (Player, Banker, Tie)
+    olasılıklarını (0-1 arası) döndürür. 6'dan az kart kaldıysa None döner.
+    :param value_counts: 10 elemanlı dizi; index = Baccarat değeri (0 = 10/J/Q/K).
+    """
+    return _exact_probabilities(tuple(int(count) for count in value_counts))
+
+
+def no_tie_percentages(probabilities: Tuple[float, float, float]) -> Tuple[float, float]:
+    """(P, B, T) olasılıklarını Tie'lar hariç P/B yüzdelerine çevirir (tahmincilerin kullandığı biçim)."""
+    p, b, _ = probabilities
+    return p / (p + b) * 100, b / (p + b) * 100
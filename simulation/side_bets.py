@@ -0,0 +1,172 @@
+# simulation/side_bets.py
+"""
+Yan bahislerin (Pair, Dragon Bonus, Tiger vb.) toplu (vektörel) değerlendirmesi.
+Girdi, HAND_DETAIL_DTYPE ayrıntılı el dizisidir (BaccaratSimulator detail mode
+veya vectorized_engine.resolve_shoes_detailed). Her bahis, tüm eller için tek
+seferde birim bahis başına net kazanç dizisi (-1 kayıp, 0 push, +x kazanç) üretir.
+"""
+from typing import Callable, Dict, Iterable, NamedTuple, Optional
+
+import numpy as np
+
+from simulation.baccarat_tables import OUTCOME_PLAYER, OUTCOME_BANKER, OUTCOME_TIE
+
+# Dragon Bonus: doğal olmayan galibiyette fark -> ödeme (1'e karşı); 4'ten az fark kaybeder
+DRAGON_MARGIN_PAYOUTS = np.array([-1, -1, -1, -1, 1, 2, 4, 6, 10, 30], dtype=np.float64)
+
+
+class SideBetStats(NamedTuple):
+    hands: int         # Değerlendirilen el sayısı
+    hits: int          # Bahsin kazandığı el sayısı
+    hit_rate: float    # hits / hands
+    house_edge: float  # Birim bahis başına ortalama kayıp (pozitif = kasa lehine)
+    net_return: float  # Toplam net kazanç (birim bahis)
+
+
+def player_pair(details: np.ndarray) -> np.ndarray:
+    """Player'ın ilk iki kartı aynı rütbe (kart kodları rütbedir): 11'e 1."""
+    cards = details['player_cards']
+    return np.where(cards[:, 0] == cards[:, 1], 11.0, -1.0)
+
+
+def banker_pair(details: np.ndarray) -> np.ndarray:
+    """Banker'ın ilk iki kartı aynı rütbe: 11'e 1."""
+    cards = details['banker_cards']
+    return np.where(cards[:, 0] == cards[:, 1], 11.0, -1.0)
+
+
+def either_pair(details: np.ndarray) -> np.ndarray:
+    """Player veya Banker'da çift: 5'e 1."""
+    player_cards = details['player_cards']; banker_cards = details['banker_cards']
+    hit = (player_cards[:, 0] == player_cards[:, 1]) | (banker_cards[:, 0] == banker_cards[:, 1])
+    return np.where(hit, 5.0, -1.0)
+
+
+def _natural(details: np.ndarray) -> np.ndarray:
+    """İki kartla biten ve 8/9 içeren el (doğal)."""
+    two_cards = ~details['player_drew'] & ~details['banker_drew']
+    return two_cards & ((details['player_score'] >= 8) | (details['banker_score'] >= 8))
+
+
+def _dragon_bonus(details: np.ndarray, side: int) -> np.ndarray:
+    """Dragon Bonus: doğal galibiyet 1'e 1, doğal beraberlik push, diğer galibiyetler farka göre."""
+    natural = _natural(details)
+    outcome = details['outcome']
+    if side == OUTCOME_PLAYER:
+        margin = details['player_score'].astype(np.int64) - details['banker_score']
+    else:
+        margin = details['banker_score'].astype(np.int64) - details['player_score']
+    won = outcome == side
+    payout = np.where(won, DRAGON_MARGIN_PAYOUTS[np.clip(margin, 0, 9)], -1.0)
+    payout = np.where(natural & won, 1.0, payout)
+    return np.where(natural & (outcome == OUTCOME_TIE), 0.0, payout)
+
+
+def dragon_bonus_player(details: np.ndarray) -> np.ndarray:
+    return _dragon_bonus(details, OUTCOME_PLAYER)
+
+
+def dragon_bonus_banker(details: np.ndarray) -> np.ndarray:
+    return _dragon_bonus(details, OUTCOME_BANKER)
+
+
+def _banker_wins_with(details: np.ndarray, score: int) -> np.ndarray:
+    return (details['outcome'] == OUTCOME_BANKER) & (details['banker_score'] == score)
+
+
+def tiger(details: np.ndarray) -> np.ndarray:
+    """Banker 6 ile kazanır: iki kartla 12'ye 1, üç kartla 20'ye 1."""
+    hit = _banker_wins_with(details, 6)
+    return np.where(hit, np.where(details['banker_drew'], 20.0, 12.0), -1.0)
+
+
+def small_tiger(details: np.ndarray) -> np.ndarray:
+    """Banker iki kartla 6 ile kazanır: 22'ye 1."""
+    return np.where(_banker_wins_with(details, 6) & ~details['banker_drew'], 22.0, -1.0)
+
+
+def big_tiger(details: np.ndarray) -> np.ndarray:
+    """Banker üç kartla 6 ile kazanır: 50'ye 1."""
+    return np.where(_banker_wins_with(details, 6) & details['banker_drew'], 50.0, -1.0)
+
+
+def tiger_tie(details: np.ndarray) -> np.ndarray:
+    """6-6 beraberlik: 35'e 1."""
+    hit = (details['outcome'] == OUTCOME_TIE) & (details['player_score'] == 6)
+    return np.where(hit, 35.0, -1.0)
+
+
+def dragon_7(details: np.ndarray) -> np.ndarray:
+    """Banker üç kartla 7 ile kazanır (EZ Baccarat): 40'a 1."""
+    return np.where(_banker_wins_with(details, 7) & details['banker_drew'], 40.0, -1.0)
+
+
+def panda_8(details: np.ndarray) -> np.ndarray:
+    """Player üç kartla 8 ile kazanır (EZ Baccarat): 25'e 1."""
+    hit = (details['outcome'] == OUTCOME_PLAYER) & (details['player_score'] == 8) & details['player_drew']
+    return np.where(hit, 25.0, -1.0)
+
+
+# Bahis adı -> birim bahis başına net kazanç fonksiyonu (yeni bahisler buraya eklenir)
+SIDE_BETS: Dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    'player_pair': player_pair,
+    'banker_pair': banker_pair,
+    'either_pair': either_pair,
+    'dragon_bonus_player': dragon_bonus_player,
+    'dragon_bonus_banker': dragon_bonus_banker,
+    'tiger': tiger,
+    'small_tiger': small_tiger,
+    'big_tiger': big_tiger,
+    'tiger_tie': tiger_tie,
+    'dragon_7': dragon_7,
+    'panda_8': panda_8,
+}
+
+
+def side_bet_totals(details: np.ndarray, bets: Optional[Iterable[str]] = None) -> Dict[str, tuple]:
+    """
+    Her bahis için (el sayısı, kazanılan el, toplam net kazanç) döndürür.
+    Parçalar halinde (örn. shoe_farm işçileri) toplanıp birleştirilmeye uygundur.
+    """
+    names = SIDE_BETS.keys() if bets is None else bets
+    totals = {}
+    for name in names:
+        payouts = SIDE_BETS[name](details)
+        totals[name] = (len(payouts), int(np.count_nonzero(payouts > 0)), float(payouts.sum()))
+    return totals
+
+
+def main_bet_totals(details: np.ndarray, rules) -> Dict[str, tuple]:
+    """
+    Ana bahislerin (Player, Banker, Tie) verilen kural varyantındaki toplamları;
+    side_bet_totals ile aynı biçimde ('main_P', 'main_B', 'main_T' anahtarlarıyla).
+    """
+    totals = {}
+    for bet in ('P', 'B', 'T'):
+        payouts = rules.net_payouts(details, bet)
+        totals[f'main_{bet}'] = (len(payouts), int(np.count_nonzero(payouts > 0)), float(payouts.sum()))
+    return totals
+
+
+def merge_side_bet_totals(parts: Iterable[Dict[str, tuple]]) -> Dict[str, tuple]:
+    """side_bet_totals sonuçlarını toplar."""
+    merged: Dict[str, tuple] = {}
+    for part in parts:
+        for name, (hands, hits, net) in part.items():
+            old_hands, old_hits, old_net = merged.get(name, (0, 0, 0.0))
+            merged[name] = (old_hands + hands, old_hits + hits, old_net + net)
+    return merged
+
+
+def side_bet_stats(totals: Dict[str, tuple]) -> Dict[str, SideBetStats]:
+    """Toplamları isabet oranı ve kasa avantajı ile SideBetStats'a çevirir."""
+    stats = {}
+    for name, (hands, hits, net) in totals.items():
+        stats[name] = SideBetStats(hands, hits, hits / hands if hands else 0.0,
+                                   -net / hands if hands else 0.0, net)
+    return stats
+
+
+def evaluate_side_bets(details: np.ndarray, bets: Optional[Iterable[str]] = None) -> Dict[str, SideBetStats]:
+    """Verilen ellerde yan bahislerin isabet oranı ve kasa avantajını hesaplar."""
+    return side_bet_stats(side_bet_totals(details, bets))
@@ -0,0 +1,190 @@
+# simulation/vectorized_engine.py
+"""
+Toplu (vektörel) Baccarat el çözümleme motoru.
+BaccaratSimulator.deal_hand ile birebir aynı kuralları (doğal eller, Player
+üçüncü kart kuralı, Banker çekme tablosu, yakma ve kesme kartı) NumPy dizi
+işlemleriyle uygular. Aynı kart sırası için deal_hand ile aynı sonuçları verir.
+"""
+import numpy as np
+from typing import Optional, Tuple
+from simulation.baccarat_tables import (
+    CARD_VALUE_BY_CODE, CARD_PIP_BY_CODE, HAND_TOTAL, NATURAL, PLAYER_DRAWS,
+    BANKER_DRAWS, PLAYER_STOOD, OUTCOME_TABLE,
+    OUTCOME_PLAYER, OUTCOME_BANKER, OUTCOME_TIE, OUTCOME_LABELS
+)
+from simulation.baccarat_rules import BaccaratRules
+
+OUTCOME_NONE = -1 # El oynanmadı (ayakkabı bitti / kesme kartı sonrası)
+
+# baccarat_tables tablolarının NumPy kopyaları (dizi indeksleme için)
+RANK_VALUES = np.array(CARD_VALUE_BY_CODE, dtype=np.int8)
+RANK_PIP_VALUES = np.array(CARD_PIP_BY_CODE, dtype=np.int8)
+HAND_TOTAL_ARRAY = np.array(HAND_TOTAL, dtype=np.int8)
+NATURAL_ARRAY = np.array(NATURAL, dtype=bool)
+PLAYER_DRAWS_ARRAY = np.array(PLAYER_DRAWS, dtype=bool)
+BANKER_DRAWS_ARRAY = np.array(BANKER_DRAWS, dtype=bool)
+OUTCOME_ARRAY = np.array(OUTCOME_TABLE, dtype=np.int8)
+
+HAND_PAD = 6 # Bir el en fazla 6 kart kullanır
+
+_rule_arrays_cache = {}
+
+
+def _rule_arrays(rules: Optional[BaccaratRules]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Kural varyantının (player çekme, banker çekme, sonuç) tablolarının NumPy kopyaları."""
+    if rules is None:
+        return PLAYER_DRAWS_ARRAY, BANKER_DRAWS_ARRAY, OUTCOME_ARRAY
+    arrays = _rule_arrays_cache.get(rules.name)
+    if arrays is None or arrays[0] is not rules:
+        arrays = (rules, np.array(rules.player_draws, dtype=bool), np.array(rules.banker_draws, dtype=bool),
+                  np.array(rules.outcome_table, dtype=np.int8))
+        _rule_arrays_cache[rules.name] = arrays
+    return arrays[1:]
+
+
+def hand_tables(card_values: np.ndarray, rules: Optional[BaccaratRules] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Her olası başlangıç pozisyonu için, elin o pozisyondan başlaması
+    durumundaki sonucunu ve kullanılan kart sayısını hesaplar.
+    :param card_values: (ayakkabı sayısı, kart sayısı) boyutunda Baccarat değerleri (0-9).
+    :param rules: Çekme ve sonuç tablolarının okunacağı kural varyantı (None: standart).
+    :return: (sonuç kodları, kullanılan kart sayısı), ikisi de card_values ile aynı boyutta.
+    """
+    n_shoes, n_cards = card_values.shape
+    player_draws_table, banker_draws_table, outcome_table = _rule_arrays(rules)
+    padded = np.zeros((n_shoes, n_cards + HAND_PAD), dtype=np.int8)
+    padded[:, :n_cards] = card_values
+
+    p1 = padded[:, 0:n_cards]; b1 = padded[:, 1:n_cards + 1]
+    p2 = padded[:, 2:n_cards + 2]; b2 = padded[:, 3:n_cards + 3]
+    fifth = padded[:, 4:n_cards + 4]; sixth = padded[:, 5:n_cards + 5]
+
+    player_score = HAND_TOTAL_ARRAY[p1, p2]
+    banker_score = HAND_TOTAL_ARRAY[b1, b2]
+    natural = NATURAL_ARRAY[player_score] | NATURAL_ARRAY[banker_score]
+
+    # Player 0-5 ile çeker, 6-7 ile durur
+    player_draws = ~natural & player_draws_table[player_score]
+    # Banker: tablo sütunu Player'ın üçüncü kartı veya PLAYER_STOOD
+    player_third = np.where(player_draws, fifth, PLAYER_STOOD)
+    banker_draws = ~natural & banker_draws_table[banker_score, player_third]
+
+    final_player = np.where(player_draws, HAND_TOTAL_ARRAY[player_score, fifth], player_score)
+    banker_third = np.where(player_draws, sixth, fifth)
+    final_banker = np.where(banker_draws, HAND_TOTAL_ARRAY[banker_score, banker_third], banker_score)
+
+    outcomes = outcome_table[final_player, final_banker]
+    consumed = (4 + player_draws + banker_draws).astype(np.int16)
+    return outcomes, consumed
+
+
+def _walk_shoes(codes: np.ndarray, cut_card_depth: int, burn: bool, rules: Optional[BaccaratRules] = None):
+    """
+    resolve_shoes ve resolve_shoes_detailed için ortak el yürüyüşü.
+    :return: (sonuç kodları, ellerin başladığı kart pozisyonları, kullanılan kart tablosu)
+    """
+    n_shoes, n_cards = codes.shape
+    values = RANK_VALUES[codes]
+    outcome_table, consumed_table = hand_tables(values, rules)
+
+    rows = np.arange(n_shoes)
+    if burn and n_cards > 0:
+        # İlk kart + değeri kadar yakılan kart (ayakkabıdan fazlası yakılamaz)
+        start = np.minimum(1 + RANK_PIP_VALUES[codes[:, 0]].astype(np.int64), n_cards)
+    else:
+        start = np.zeros(n_shoes, dtype=np.int64)
+    remaining = n_cards - start
+    cut_index = np.maximum(0, remaining - cut_card_depth - 1)
+
+    max_hands = n_cards // 4 + 1
+    results = np.full((n_shoes, max_hands), OUTCOME_NONE, dtype=np.int8)
+    positions = np.zeros((n_shoes, max_hands), dtype=np.int64)
+    dealt = np.zeros(n_shoes, dtype=np.int64)
+    active = remaining > 0
+    last_hand = np.zeros(n_shoes, dtype=bool) # Kesme kartı geçildi, sıradaki el son el
+
+    for hand_index in range(max_hands):
+        if not active.any():
+            break
+        position = np.minimum(start + dealt, n_cards - 1)
+        used = consumed_table[rows, position]
+        complete = active & (dealt + used <= remaining)
+        results[complete, hand_index] = outcome_table[rows[complete], position[complete]]
+        positions[:, hand_index] = position
+
+        # Bu el son eldiyse veya ayakkabı el ortasında bittiyse dur
+        finished = complete & last_hand
+        active = complete & ~finished
+        # Elin son kartı kesme kartını geçtiyse bir el daha oyna
+        last_hand = active & (dealt + used - 1 > cut_index)
+        dealt = dealt + np.where(active, used, 0)
+
+    return results, positions, consumed_table
+
+
+def resolve_shoes(rank_codes: np.ndarray, cut_card_depth: int = 14, burn: bool = True,
+                  rules: Optional[BaccaratRules] = None) -> np.ndarray:
+    """
+    Karıştırılmış ayakkabıları (kart kodu dizisi) topluca oynar.
+    Yakma kartı, kesme kartı ve 'kesme kartından sonra bir el daha' kuralları
+    BaccaratSimulator ile aynıdır. Ayakkabı el ortasında biterse o el sayılmaz.
+    :param rank_codes: (ayakkabı sayısı, kart sayısı) veya tek ayakkabı için 1 boyutlu kart kodları.
+    :param cut_card_depth: Kesme kartının ayakkabının sonundan kaç kart önce olduğu.
+    :param burn: True ise ilk kart açılır ve değeri kadar kart yakılır.
+    :param rules: Kural varyantı (None: standart çekme kuralları).
+    :return: (ayakkabı sayısı, maksimum el sayısı) boyutunda sonuç kodları;
+             oynanmayan eller OUTCOME_NONE ile doldurulur.
+    """
+    codes = np.atleast_2d(np.asarray(rank_codes, dtype=np.int8))
+    return _walk_shoes(codes, cut_card_depth, burn, rules)[0]
+
+
+def resolve_shoes_detailed(rank_codes: np.ndarray, cut_card_depth: int = 14, burn: bool = True,
+                           return_outcomes: bool = False, rules: Optional[BaccaratRules] = None):
+    """
+    resolve_shoes gibi oynar, ancak oynanan her el için kartları, skorları ve
+    çekme bayraklarını içeren bir HAND_DETAIL_DTYPE dizisi (ayakkabı sırasıyla) döndürür.
+    :param return_outcomes: True ise (ayrıntılar, resolve_shoes sonuç dizisi) döndürülür.
+    """
+    from simulation.hand_detail import HAND_DETAIL_DTYPE
+    codes = np.atleast_2d(np.asarray(rank_codes, dtype=np.int8))
+    n_shoes, n_cards = codes.shape
+    results, positions, consumed_table = _walk_shoes(codes, cut_card_depth, burn, rules)
+    player_draws_table = _rule_arrays(rules)[0]
+    shoe_rows, hand_columns = np.nonzero(results != OUTCOME_NONE)
+    starts = positions[shoe_rows, hand_columns]
+
+    padded = np.zeros((n_shoes, n_cards + HAND_PAD), dtype=np.int8)
+    padded[:, :n_cards] = codes
+    cards = padded[shoe_rows[:, None], starts[:, None] + np.arange(HAND_PAD)] # (el, 6): p1, b1, p2, b2, 5., 6.
+    values = RANK_VALUES[cards]
+
+    player_score = HAND_TOTAL_ARRAY[values[:, 0], values[:, 2]]
+    banker_score = HAND_TOTAL_ARRAY[values[:, 1], values[:, 3]]
+    natural = NATURAL_ARRAY[player_score] | NATURAL_ARRAY[banker_score]
+    player_drew = ~natural & player_draws_table[player_score]
+    banker_drew = consumed_table[shoe_rows, starts] - 4 - player_drew > 0
+    player_third = np.where(player_drew, cards[:, 4], 0)
+    banker_third = np.where(banker_drew, np.where(player_drew, cards[:, 5], cards[:, 4]), 0)
+
+    details = np.zeros(len(starts), dtype=HAND_DETAIL_DTYPE)
+    details['player_cards'] = np.stack([cards[:, 0], cards[:, 2], player_third], axis=1)
+    details['banker_cards'] = np.stack([cards[:, 1], cards[:, 3], banker_third], axis=1)
+    details['player_score'] = HAND_TOTAL_ARRAY[player_score, RANK_VALUES[player_third]]
+    details['banker_score'] = HAND_TOTAL_ARRAY[banker_score, RANK_VALUES[banker_third]]
+    details['player_drew'] = player_drew
+    details['banker_drew'] = banker_drew
+    details['outcome'] = results[shoe_rows, hand_columns]
+    return (details, results) if return_outcomes else details
+
+
+def resolve_shoe(rank_codes: np.ndarray, cut_card_depth: int = 14, burn: bool = True,
+                 rules: Optional[BaccaratRules] = None) -> np.ndarray:
+    """Tek bir ayakkabıyı oynar ve sadece oynanan ellerin sonuç kodlarını döndürür."""
+    results = resolve_shoes(np.asarray(rank_codes).reshape(1, -1), cut_card_depth, burn, rules)[0]
+    return results[results != OUTCOME_NONE]
+
+
+def outcome_labels(outcome_codes: np.ndarray) -> list:
+    """Sonuç kodlarını 'P'/'B'/'T' listesine çevirir (OUTCOME_NONE atlanır)."""
+    return [OUTCOME_LABELS[code] for code in outcome_codes if code != OUTCOME_NONE]